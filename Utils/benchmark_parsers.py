@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Flowery.NET Documentation Parser Benchmark
+==========================================
+
+Measures how the documentation parsers in generate_docs.py scale with input
+size. Synthetic inputs are generated at increasing sizes and parsed with the
+same entry points the generator uses:
+
+    CSharpParser.parse_file   Synthetic control files: many StyledProperties
+                              with long /// doc comments, nested enums and
+                              method bodies with braces inside strings.
+    AxamlParser.parse_file    Synthetic Gallery pages: many sections, each
+                              with labelled groups, deeply nested panels and
+                              Daisy controls with inner content.
+
+For each size it reports lines/s, time per phase (read, scan/index, build
+snippets), peak traced memory and the total. The time growth since the
+smallest size is compared with the input growth; a growth exponent above
+SUPERLINEAR_EXPONENT is flagged as super-linear.
+
+OUTPUT:
+    llms/parser-benchmark.json (or --output), so runs can be compared with
+    --compare PREVIOUS.json.
+
+USAGE:
+    python Utils/benchmark_parsers.py
+    python Utils/benchmark_parsers.py --sizes 1 4 16 64 --repeat 5
+    python Utils/benchmark_parsers.py --compare llms/parser-benchmark.baseline.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from generate_docs import AxamlParser, CSharpParser
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+
+DEFAULT_SIZES = [1, 2, 4, 8, 16]   # Scale factors; inputs grow linearly with the factor
+DEFAULT_REPEAT = 3                 # Timed runs per size (the fastest one is kept)
+SUPERLINEAR_EXPONENT = 1.25        # time ~ lines^k; flag k above this between sizes
+MIN_FLAG_SECONDS = 0.005           # Ignore growth between runs faster than this (timer noise)
+
+# Synthetic C# per scale step
+PROPERTIES_PER_STEP = 40           # StyledProperties (each with a CLR wrapper)
+ENUMS_PER_STEP = 4                 # Enums nested in the control class
+DOC_LINES_PER_MEMBER = 6           # /// lines in each summary
+
+# Synthetic AXAML per scale step
+SECTIONS_PER_STEP = 12             # SectionHeader sections
+GROUPS_PER_SECTION = 4             # Labelled groups per section
+CONTROLS_PER_GROUP = 6             # Daisy controls per group
+NESTING_DEPTH = 6                  # Panels wrapped around every group
+
+DEFAULT_OUTPUT = "llms/parser-benchmark.json"
+RESULTS_SCHEMA_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """One parser at one input size."""
+    parser: str
+    size: int
+    lines: int
+    bytes: int
+    phases: dict[str, float] = field(default_factory=dict)   # phase -> seconds (fastest run)
+    total_seconds: float = 0.0                               # parse_file, fastest run
+    lines_per_second: float = 0.0
+    peak_memory_bytes: int = 0                               # tracemalloc peak during parse_file
+    growth_exponent: Optional[float] = None                  # vs the smallest size
+    superlinear: bool = False
+
+
+# =============================================================================
+# Synthetic Inputs
+# =============================================================================
+
+def _doc_comment(indent: str, subject: str) -> list[str]:
+    lines = [f"{indent}/// <summary>"]
+    for i in range(DOC_LINES_PER_MEMBER):
+        lines.append(f"{indent}/// Line {i} about {subject}: see <see cref=\"DaisyControl\"/> for the "
+                     f"{{braces}} and \"quotes\" that appear in real comments.")
+    lines.append(f"{indent}/// </summary>")
+    return lines
+
+
+def synthetic_csharp(size: int) -> str:
+    """A control file whose member count grows linearly with size."""
+    name = "DaisySynthetic"
+    lines = [
+        "using System;",
+        "using Avalonia;",
+        "using Avalonia.Controls.Primitives;",
+        "",
+        "namespace Flowery.Controls",
+        "{",
+    ]
+    lines += _doc_comment("    ", name)
+    lines += [f"    public class {name} : TemplatedControl", "    {"]
+
+    for e in range(ENUMS_PER_STEP * size):
+        lines += _doc_comment("        ", f"mode {e}")
+        lines.append(f"        public enum SyntheticMode{e}")
+        lines.append("        {")
+        lines += [f"            Value{v}," for v in range(8)]
+        lines.append("        }")
+        lines.append("")
+
+    for p in range(PROPERTIES_PER_STEP * size):
+        prop = f"Option{p}"
+        prop_type = f"SyntheticMode{p % (ENUMS_PER_STEP * size)}"
+        lines += _doc_comment("        ", prop)
+        lines.append(f"        public static readonly StyledProperty<{prop_type}> {prop}Property =")
+        lines.append(f"            AvaloniaProperty.Register<{name}, {prop_type}>(nameof({prop}), {prop_type}.Value1);")
+        lines.append("")
+        lines += _doc_comment("        ", f"the {prop} wrapper")
+        lines.append(f"        public {prop_type} {prop}")
+        lines.append("        {")
+        lines.append(f"            get => GetValue({prop}Property);")
+        lines.append(f"            set => SetValue({prop}Property, value);")
+        lines.append("        }")
+        lines.append("")
+
+    for m in range(PROPERTIES_PER_STEP * size // 4):
+        lines.append(f"        private string Describe{m}(int value)")
+        lines.append("        {")
+        lines.append(f"            var text = $\"{{{{value}}}} {{value}} /* not a comment */ {m}\";")
+        lines.append("            if (value > 0) { text += @\"}\"; } // closing brace in a verbatim string")
+        lines.append("            return text;")
+        lines.append("        }")
+        lines.append("")
+
+    lines += ["    }", "}", ""]
+    return '\n'.join(lines)
+
+
+def synthetic_axaml(size: int) -> str:
+    """A Gallery page whose section count grows linearly with size."""
+    lines = [
+        '<UserControl xmlns="https://github.com/avaloniaui"',
+        '    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"',
+        '    xmlns:controls="clr-namespace:Flowery.Controls;assembly=Flowery.NET"',
+        '    xmlns:local="clr-namespace:Flowery.NET.Gallery.Examples"',
+        '    x:Class="Flowery.NET.Gallery.Examples.SyntheticExamples">',
+        '    <StackPanel Spacing="24">',
+    ]
+    for s in range(SECTIONS_PER_STEP * size):
+        lines.append(f'        <!-- Section {s} -->')
+        lines.append(f'        <local:SectionHeader SectionId="synthetic-{s}" Title="Synthetic {s}" />')
+        for g in range(GROUPS_PER_SECTION):
+            indent = "        "
+            for d in range(NESTING_DEPTH):
+                lines.append(f'{indent}<StackPanel Spacing="{d}" Margin="0,0,{d},0">')
+                indent += "    "
+            lines.append(f'{indent}<TextBlock Text="Group {g}" FontWeight="SemiBold" FontSize="14" Opacity="0.8"/>')
+            for c in range(CONTROLS_PER_GROUP):
+                if c % 2:
+                    lines.append(f'{indent}<controls:DaisyCard Variant="Primary" Margin="4" x:Name="Card{s}_{g}_{c}">')
+                    lines.append(f'{indent}    <controls:DaisyButton Content="Inner {c}" Size="Small"/>')
+                    lines.append(f'{indent}    <TextBlock Text="Body text {c}" TextWrapping="Wrap"/>')
+                    lines.append(f'{indent}</controls:DaisyCard>')
+                else:
+                    lines.append(f'{indent}<controls:DaisyButton Variant="Secondary" Content="Button {c}" Margin="4"/>')
+            for d in reversed(range(NESTING_DEPTH)):
+                indent = indent[:-4]
+                lines.append(f'{indent}</StackPanel>')
+        lines.append('        <controls:DaisyDivider/>')
+    lines += ['    </StackPanel>', '</UserControl>', '']
+    return '\n'.join(lines)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _fastest(func: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_csharp(path: Path, size: int, repeat: int) -> Measurement:
+    parser = CSharpParser()
+    content = path.read_text(encoding='utf-8')
+    symbols = parser.scan(content)
+    result = Measurement('CSharpParser', size, content.count('\n'), path.stat().st_size)
+    result.phases = {
+        'read': _fastest(lambda: path.read_text(encoding='utf-8'), repeat),
+        'scan': _fastest(lambda: parser.scan(content), repeat),
+        'build': _fastest(lambda: parser.control_from_symbols(symbols, path.stem), repeat),
+    }
+    result.total_seconds = _fastest(lambda: parser.parse_file(path), repeat)
+    result.peak_memory_bytes = _peak_memory(lambda: parser.parse_file(path))
+    return result
+
+
+def measure_axaml(path: Path, size: int, repeat: int) -> Measurement:
+    parser = AxamlParser()
+    source = path.read_bytes()
+    sections, _ = parser.build_index(source)
+    result = Measurement('AxamlParser', size, source.count(b'\n'), len(source))
+    result.phases = {
+        'read': _fastest(lambda: path.read_bytes(), repeat),
+        'index': _fastest(lambda: parser.build_index(source), repeat),
+        'snippets': _fastest(lambda: [parser._extract_sub_examples(section) for section in sections], repeat),
+    }
+    result.total_seconds = _fastest(lambda: parser.parse_file(path), repeat)
+    result.peak_memory_bytes = _peak_memory(lambda: parser.parse_file(path))
+    return result
+
+
+def flag_growth(measurements: list[Measurement]):
+    """
+    Fill growth_exponent/superlinear relative to the smallest size of the same
+    parser; a single noisy timing skews a long baseline less than a short one.
+    """
+    first = measurements[0]
+    for current in measurements[1:]:
+        if first.lines == current.lines or first.total_seconds <= 0:
+            continue
+        exponent = math.log(current.total_seconds / first.total_seconds) / math.log(current.lines / first.lines)
+        current.growth_exponent = round(exponent, 3)
+        current.superlinear = exponent > SUPERLINEAR_EXPONENT and current.total_seconds >= MIN_FLAG_SECONDS
+
+
+def run(sizes: list[int], repeat: int) -> list[Measurement]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for name, generate, measure, suffix in (
+            ('CSharpParser', synthetic_csharp, measure_csharp, '.cs'),
+            ('AxamlParser', synthetic_axaml, measure_axaml, '.axaml'),
+        ):
+            print(f"\n{name}")
+            measurements = []
+            for size in sizes:
+                path = workdir / f"DaisySynthetic{size}{suffix}"
+                path.write_text(generate(size), encoding='utf-8')
+                measurement = measure(path, size, repeat)
+                measurement.lines_per_second = round(measurement.lines / measurement.total_seconds) \
+                    if measurement.total_seconds else 0.0
+                measurements.append(measurement)
+            flag_growth(measurements)
+            for m in measurements:
+                phases = ", ".join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in m.phases.items())
+                growth = f" k={m.growth_exponent:.2f}" if m.growth_exponent is not None else ""
+                flag = "  SUPER-LINEAR" if m.superlinear else ""
+                print(f"  x{m.size:<4} {m.lines:>7} lines  {m.total_seconds * 1000:8.1f}ms  "
+                      f"{m.lines_per_second:>10,.0f} lines/s  peak {m.peak_memory_bytes / 1024:8.0f} KB"
+                      f"{growth}{flag}")
+                print(f"        {phases}")
+            results.extend(measurements)
+    return results
+
+
+def compare(results: list[Measurement], previous_path: Path):
+    """Print the time ratio against a previous results file for matching parser/size pairs."""
+    previous = json.loads(previous_path.read_text(encoding='utf-8'))
+    before = {(m['parser'], m['size']): m for m in previous.get('measurements', [])}
+    print(f"\nCompared with {previous_path}:")
+    for m in results:
+        old = before.get((m.parser, m.size))
+        if not old or not old['total_seconds']:
+            continue
+        ratio = m.total_seconds / old['total_seconds']
+        print(f"  {m.parser:<13} x{m.size:<4} {old['total_seconds'] * 1000:8.1f}ms -> "
+              f"{m.total_seconds * 1000:8.1f}ms  ({ratio:.2f}x)")
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark how the generate_docs.py parsers scale with input size',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/benchmark_parsers.py                      # Sizes x1..x16, JSON to llms/
+  python Utils/benchmark_parsers.py --sizes 1 4 16 64    # Larger inputs
+  python Utils/benchmark_parsers.py --compare old.json   # Time ratios against an earlier run
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, metavar='N',
+                        help=f'Scale factors to generate (default: {" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, metavar='N',
+                        help=f'Timed runs per size, the fastest is kept (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--output', type=Path, default=None, metavar='PATH',
+                        help=f'Results file (default: {DEFAULT_OUTPUT} in the repository root)')
+    parser.add_argument('--compare', type=Path, default=None, metavar='PATH',
+                        help='Earlier results file to compare against')
+    args = parser.parse_args()
+    if args.repeat < 1 or any(size < 1 for size in args.sizes):
+        parser.error("--sizes and --repeat must be positive")
+    if args.compare and not args.compare.is_file():
+        parser.error(f"--compare file not found: {args.compare}")
+
+    root_dir = Path(__file__).parent.parent
+    output_path = args.output or root_dir / DEFAULT_OUTPUT
+
+    print("Flowery.NET Parser Benchmark")
+    print("=" * 40)
+    results = run(sorted(set(args.sizes)), args.repeat)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        'schema_version': RESULTS_SCHEMA_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'superlinear_exponent': SUPERLINEAR_EXPONENT,
+        'measurements': [asdict(m) for m in results],
+    }, indent=2), encoding='utf-8')
+
+    flagged = [m for m in results if m.superlinear]
+    print("\n" + "=" * 40)
+    if flagged:
+        print("Super-linear growth: " + ", ".join(f"{m.parser} x{m.size} (k={m.growth_exponent:.2f})"
+                                                  for m in flagged))
+    else:
+        print("No super-linear growth detected")
+    print(f"Results: {output_path}")
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,152 +8,71 @@ Notes:
 - C#: strips // and /* */ while respecting string/char literals (including verbatim strings @"...").
 - AXAML: strips XML comments <!-- ... -->.
 - Skips common generated/build directories (bin, obj, .vs, etc.).
+- --jobs N counts files in N worker processes.
+- Per-file counts are cached in the git directory (count_loc_cache.json), keyed on the git blob SHA
+  from `git ls-files -s` for unmodified tracked files and on size + mtime for everything else, so a
+  recount only reads files that changed. Use --no-cache to disable or --cache PATH to move it.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import os
+import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+_CACHE_FILE = "count_loc_cache.json"
+_CACHE_VERSION = 1  # Bump when the strippers or the line rule change
 
-def _strip_xml_comments(text: str) -> str:
-    out: list[str] = []
-    i = 0
-    n = len(text)
-    in_comment = False
-
-    while i < n:
-        if not in_comment and text.startswith("<!--", i):
-            in_comment = True
-            i += 4
-            continue
-
-        if in_comment:
-            if text.startswith("-->", i):
-                in_comment = False
-                i += 3
-                continue
-            # Preserve newlines so line counting stays stable.
-            ch = text[i]
-            if ch == "\n":
-                out.append("\n")
-            i += 1
-            continue
 
-        out.append(text[i])
-        i += 1
+# A comment is replaced by its newlines so line counting stays stable. String,
+# verbatim-string and char literals are matched (and kept) so that comment
+# markers inside them are never treated as comments. Unterminated comments and
+# literals run to the end of the file.
+_XML_COMMENT_PATTERN = re.compile(r"<!--(?:.*?-->|.*)", re.DOTALL)
+_CSHARP_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<comment>//[^\n]*|/\*(?:.*?\*/|.*))
+    | @"(?:[^"]+|"")*"?             # Verbatim string: "" is an escaped quote
+    | "(?:[^"\\]+|\\.)*"?          # String
+    | '(?:[^'\\]+|\\.)*'?          # Char
+    """,
+    re.DOTALL | re.VERBOSE,
+)
 
-    return "".join(out)
 
+def _comment_newlines(match: re.Match) -> str:
+    return "\n" * match.group().count("\n")
 
-def _strip_csharp_comments(text: str) -> str:
-    out: list[str] = []
-    i = 0
-    n = len(text)
-
-    NORMAL = 0
-    LINE_COMMENT = 1
-    BLOCK_COMMENT = 2
-    STRING = 3
-    VERBATIM_STRING = 4
-    CHAR = 5
-
-    state = NORMAL
-
-    while i < n:
-        ch = text[i]
-        nxt = text[i + 1] if i + 1 < n else ""
-
-        if state == NORMAL:
-            if ch == "/" and nxt == "/":
-                state = LINE_COMMENT
-                i += 2
-                continue
-            if ch == "/" and nxt == "*":
-                state = BLOCK_COMMENT
-                i += 2
-                continue
-            if ch == "@" and nxt == '"':
-                state = VERBATIM_STRING
-                out.append('@')
-                out.append('"')
-                i += 2
-                continue
-            if ch == '"':
-                state = STRING
-                out.append(ch)
-                i += 1
-                continue
-            if ch == "'":
-                state = CHAR
-                out.append(ch)
-                i += 1
-                continue
-
-            out.append(ch)
-            i += 1
-            continue
-
-        if state == LINE_COMMENT:
-            if ch == "\n":
-                out.append("\n")
-                state = NORMAL
-            i += 1
-            continue
 
-        if state == BLOCK_COMMENT:
-            if ch == "*" and nxt == "/":
-                state = NORMAL
-                i += 2
-                continue
-            if ch == "\n":
-                out.append("\n")
-            i += 1
-            continue
-
-        if state == STRING:
-            out.append(ch)
-            if ch == "\\" and i + 1 < n:
-                out.append(text[i + 1])
-                i += 2
-                continue
-            if ch == '"':
-                state = NORMAL
-            i += 1
-            continue
-
-        if state == VERBATIM_STRING:
-            out.append(ch)
-            if ch == '"':
-                # In verbatim strings, "" is an escaped quote.
-                if nxt == '"':
-                    out.append('"')
-                    i += 2
-                    continue
-                state = NORMAL
-            i += 1
-            continue
+def _strip_xml_comments(text: str) -> str:
+    return _XML_COMMENT_PATTERN.sub(_comment_newlines, text)
 
-        if state == CHAR:
-            out.append(ch)
-            if ch == "\\" and i + 1 < n:
-                out.append(text[i + 1])
-                i += 2
-                continue
-            if ch == "'":
-                state = NORMAL
-            i += 1
-            continue
 
-    return "".join(out)
+def _strip_csharp_comments(text: str) -> str:
+    return _CSHARP_TOKEN_PATTERN.sub(
+        lambda m: _comment_newlines(m) if m.group("comment") is not None else m.group(), text
+    )
 
 
 def _count_non_empty_lines(text: str) -> int:
     return sum(1 for line in text.splitlines() if line.strip())
 
 
+def _count_file(path: str) -> int | None:
+    """Non-empty, comment-free lines of one .cs/.axaml file, or None if it cannot be read."""
+    try:
+        text = Path(path).read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return None
+    if path.lower().endswith(".cs"):
+        return _count_non_empty_lines(_strip_csharp_comments(text))
+    return _count_non_empty_lines(_strip_xml_comments(text))
+
+
 def _try_git_root(start: Path) -> Path | None:
     try:
         p = subprocess.run(
@@ -179,6 +98,82 @@ def _git_files(repo_root: Path) -> list[Path]:
     return [repo_root / line for line in p.stdout.splitlines() if line]
 
 
+def _git_dir(repo_root: Path) -> Path | None:
+    try:
+        p = subprocess.run(
+            ["git", "-C", str(repo_root), "rev-parse", "--absolute-git-dir"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+        return Path(p.stdout.strip())
+    except Exception:
+        return None
+
+
+def _git_blob_ids(repo_root: Path) -> dict[Path, str]:
+    """Blob SHA per tracked file whose working copy matches the index (modified files are left out)."""
+    try:
+        staged = subprocess.run(
+            ["git", "-C", str(repo_root), "ls-files", "-s"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        ).stdout
+        modified = subprocess.run(
+            ["git", "-C", str(repo_root), "ls-files", "-m"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        ).stdout
+    except Exception:
+        return {}
+
+    changed = {repo_root / line for line in modified.splitlines() if line}
+    blobs: dict[Path, str] = {}
+    for line in staged.splitlines():
+        # <mode> <sha> <stage>\t<path>
+        meta, _, name = line.partition("\t")
+        fields = meta.split()
+        path = repo_root / name
+        if len(fields) == 3 and path not in changed:
+            blobs[path] = fields[1]
+    return blobs
+
+
+def _cache_id(path: Path, repo_root: Path, blobs: dict[Path, str]) -> str | None:
+    suffix = path.suffix.lower()
+    sha = blobs.get(path)
+    if sha:
+        return f"blob{suffix}:{sha}"
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"stat:{path.relative_to(repo_root).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _load_cache(cache_path: Path) -> dict[str, int]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data.get("lines", {})
+
+
+def _save_cache(cache_path: Path, lines: dict[str, int]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"version": _CACHE_VERSION, "lines": lines}), encoding="utf-8")
+    except OSError:
+        pass
+
+
 def _walk_files(repo_root: Path, debug: bool = False) -> list[Path]:
     skip_dirs = {
         ".git",
@@ -239,6 +234,10 @@ def main() -> int:
     parser.add_argument("--use-git", action="store_true", help="Use git ls-files instead of walking the filesystem.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Print file count and repo root info.")
     parser.add_argument("--debug", action="store_true", help="Show skipped directories.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Count files in N worker processes (default: 1).")
+    parser.add_argument("--cache", type=Path, default=None,
+                        help=f"Cache file (default: {_CACHE_FILE} in the git directory; no cache outside git).")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the per-file cache.")
     args = parser.parse_args()
 
     start = Path(args.path).resolve()
@@ -254,6 +253,25 @@ def main() -> int:
         print(f"Repo root: {repo_root}", file=__import__('sys').stderr)
 
     all_paths = _git_files(repo_root) if (args.use_git and _try_git_root(repo_root) is not None) else _walk_files(repo_root, debug=args.debug)
+    paths = [path for path in all_paths if path.suffix.lower() in {".cs", ".axaml"} and path.is_file()]
+
+    cache_path = None
+    if not args.no_cache:
+        git_dir = _git_dir(repo_root)
+        cache_path = args.cache or (git_dir / _CACHE_FILE if git_dir else None)
+    cached = _load_cache(cache_path) if cache_path else {}
+    blobs = _git_blob_ids(repo_root) if cache_path else {}
+
+    # Cached files are not read at all; the rest are counted serially or in a process pool.
+    ids = {path: _cache_id(path, repo_root, blobs) for path in paths} if cache_path else {}
+    counts: dict[Path, int | None] = {path: cached[ids[path]] for path in paths if ids.get(path) in cached}
+    pending = [path for path in paths if path not in counts]
+    if args.jobs > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (args.jobs * 4))
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            counts.update(zip(pending, pool.map(_count_file, map(str, pending), chunksize=chunksize)))
+    else:
+        counts.update((path, _count_file(str(path))) for path in pending)
 
     total = 0
     file_count = 0
@@ -261,37 +279,31 @@ def main() -> int:
     cs_lines = 0
     axaml_files = 0
     axaml_lines = 0
-    
-    for path in all_paths:
-        suffix = path.suffix.lower()
-        if suffix not in {".cs", ".axaml"}:
-            continue
-        if not path.is_file():
-            continue
 
-        try:
-            text = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+    for path in paths:
+        lines = counts[path]
+        if lines is None:
             continue
 
         file_count += 1
-        if suffix == ".cs":
-            stripped = _strip_csharp_comments(text)
-            lines = _count_non_empty_lines(stripped)
+        if path.suffix.lower() == ".cs":
             cs_files += 1
             cs_lines += lines
         else:
-            stripped = _strip_xml_comments(text)
-            lines = _count_non_empty_lines(stripped)
             axaml_files += 1
             axaml_lines += lines
 
         total += lines
 
+    if cache_path:
+        _save_cache(cache_path, {ids[path]: counts[path] for path in paths if ids.get(path) and counts[path] is not None})
+
     if args.verbose:
         import sys
         print(f"Files processed: {file_count} ({cs_files} .cs, {axaml_files} .axaml)", file=sys.stderr)
         print(f"Lines: {cs_lines:,} .cs + {axaml_lines:,} .axaml = {total:,} total", file=sys.stderr)
+        if cache_path:
+            print(f"Cache: {len(paths) - len(pending)} hits, {len(pending)} counted ({cache_path})", file=sys.stderr)
 
     print(total)
     return 0
@@ -68,10 +68,13 @@ AXAML EXAMPLE FILES (Flowery.NET.Gallery/Examples/*Examples.axaml):
 
    <controls:DaisyDivider />
 
-5. Control elements use the "controls:" namespace prefix:
+5. Control elements come from a clr-namespace (usually the "controls:" prefix):
 
    xmlns:controls="clr-namespace:Flowery.Controls;assembly=Flowery.NET"
 
+6. Files are read with an XML parser, so they must be well-formed XML
+   (a file that is not is skipped with a warning).
+
 ADDING NEW CONTROLS:
 --------------------
 1. Create the C# control file following the patterns above
@@ -85,6 +88,11 @@ OUTPUT:
     llms/llms.txt            - Master index for LLMs
     llms/controls/*.md       - Per-control documentation
     llms/categories/*.md     - Category overviews
+    llms/controls.json       - API metadata (controls, properties, enums, categories,
+                               examples) for tooling; --msgpack adds controls.msgpack
+    llms/property-invalidation.json
+                             - Properties that invalidate measure/arrange/render or
+                               have change handlers, per control, with layout hot paths
 
 SUPPLEMENTARY DOCUMENTATION:
 ----------------------------
@@ -110,21 +118,31 @@ Example supplementary file:
 """
 
 import argparse
+import fnmatch
+import hashlib
+import json
 import os
+import random
 import re
-from dataclasses import dataclass, field
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+try:
+    import msgpack  # Optional: only needed for --msgpack
+except ImportError:
+    msgpack = None
 
 
 # =============================================================================
 # Configuration Constants
 # =============================================================================
 
-# Parser limits
-SUMMARY_PROXIMITY_CHARS = 300      # Max chars between summary comment and class definition
-SUMMARY_LOOKBACK_LINES = 5        # Lines to search backward for summary comments
-
 # Example extraction limits
 MAX_CONTROLS_PER_EXAMPLE = 3      # Max control elements to extract per example
 MAX_EXAMPLES_PER_CONTROL = 5      # Max examples sections per control doc
@@ -139,11 +157,58 @@ MAX_INNER_CONTENT_LENGTH = 100    # Inner XAML content before truncation
 MAX_NORMALIZED_LENGTH = 150       # Normalized content before truncation
 MAX_PATHICON_DATA_LENGTH = 50     # PathIcon Data attribute preview length
 
+# Attributes dropped from example snippets (layout and event noise), by exact qualified name
+EXAMPLE_DROPPED_ATTRIBUTES = frozenset({
+    'Margin', 'HorizontalAlignment', 'VerticalAlignment', 'Click', 'x:Name', 'Tag', 'ToolTip.Tip',
+})
+EXAMPLE_DROPPED_PIXEL_ATTRIBUTES = frozenset({'Width', 'Height'})  # Only when a plain number, not "Auto"/bindings
+
+# Example deduplication (MinHash over tag/attribute shingles)
+EXAMPLE_SIMILARITY_THRESHOLD = 0.8  # Estimated Jaccard similarity at which two snippets are duplicates
+MINHASH_PERMUTATIONS = 64           # Signature length; a multiple of MINHASH_BANDS
+MINHASH_BANDS = 16                  # LSH bands (4 rows each): pairs above ~0.5 similarity are compared
+MINHASH_SEED = 1                    # Fixed, so every build keeps the same examples
+EXAMPLE_TEXT_ATTRIBUTES = {         # Free text: compared by name only, like element text
+    'Content', 'Text', 'Header', 'Title', 'Watermark', 'PlaceholderText', 'Label', 'Description',
+    'ToolTip.Tip',
+}
+
 # Label validation
 MIN_UPPERCASE_LABEL_LENGTH = 3    # Minimum length for all-uppercase labels to be suspicious
 
+# Parallel parsing
+DEFAULT_PARSE_JOBS = 1            # Worker processes for file parsing (1 = in-process)
+PARSE_CHUNK_SIZE = 8              # Files handed to a worker per round trip
 
-@dataclass
+# Parse cache
+PARSE_CACHE_FILE = ".parse-cache.json"  # Stored in the output directory (llms/)
+
+# API metadata export
+API_METADATA_FILE = "controls.json"            # Written to the output directory (llms/)
+API_METADATA_MSGPACK_FILE = "controls.msgpack"  # Same data, with --msgpack
+API_SCHEMA_VERSION = 1                          # Bump on incompatible changes to the layout
+
+# Gallery usage index
+USAGE_INDEX_FILE = "control-usage.json"   # Written to the output directory (llms/)
+USAGE_SCHEMA_VERSION = 1
+GALLERY_SKIP_DIRS = {'bin', 'obj'}        # Build output below Flowery.NET.Gallery/
+
+# Property invalidation metadata
+INVALIDATION_EFFECTS = ('Measure', 'Arrange', 'Render', 'Handler')  # Display order
+LAYOUT_EFFECTS = {'Measure', 'Arrange'}
+ANIMATABLE_PROPERTY_TYPES = {                 # Types Avalonia transitions and key frames interpolate
+    'double', 'float', 'int', 'Color', 'IBrush', 'Thickness', 'CornerRadius', 'Point', 'Vector', 'Size',
+    'RelativePoint', 'BoxShadows', 'ITransform', 'TransformOperations',
+}
+INVALIDATION_REPORT_FILE = "property-invalidation.json"  # Written to the output directory (llms/)
+INVALIDATION_SCHEMA_VERSION = 1
+
+# Docs index (what --only needs to patch categories and llms.txt without a full build)
+DOCS_INDEX_FILE = ".docs-index.json"      # Written to the output directory (llms/)
+DOCS_INDEX_SCHEMA_VERSION = 1
+
+
+@dataclass(slots=True)
 class EnumInfo:
     """Represents a C# enum definition."""
     name: str
@@ -151,7 +216,7 @@ class EnumInfo:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyInfo:
     """Represents a StyledProperty definition."""
     name: str
@@ -160,7 +225,7 @@ class PropertyInfo:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlInfo:
     """Represents a Daisy control class."""
     name: str
@@ -168,14 +233,141 @@ class ControlInfo:
     description: str
     properties: list[PropertyInfo] = field(default_factory=list)
     enums: list[EnumInfo] = field(default_factory=list)
+    invalidation: dict[str, list[str]] = field(default_factory=dict)  # property -> INVALIDATION_EFFECTS
+    # Resolved through the SymbolIndex, not parsed from the control's own file
+    inherited_properties: dict[str, list[PropertyInfo]] = field(default_factory=dict)  # base class -> properties
+    referenced_enums: list[EnumInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExampleSnippet:
     """Represents an AXAML example snippet."""
     section_id: str
     title: str
     sub_examples: list[tuple[str, str]] = field(default_factory=list)  # (label, xaml)
+    signatures: list[tuple[int, ...]] = field(default_factory=list)    # MinHash of each sub-example
+
+
+@dataclass(slots=True)
+class ControlSummary:
+    """The part of a ControlInfo the category pages and llms.txt need, kept once the control is written."""
+    name: str
+    description: str
+    key_properties: list[str]              # First MAX_PROPS_IN_OVERVIEW property names
+    property_count: int
+
+    @classmethod
+    def of(cls, control: ControlInfo) -> 'ControlSummary':
+        return cls(
+            name=control.name,
+            description=control.description,
+            key_properties=[p.name for p in control.properties[:MAX_PROPS_IN_OVERVIEW]],
+            property_count=len(control.properties),
+        )
+
+
+@dataclass
+class GeneratedDocs:
+    """Everything one run produced, for in-process consumers such as generate_site.py."""
+    controls: list[ControlSummary]
+    control_docs: dict[str, str]           # control name -> markdown (only with keep_docs)
+    categories: dict[str, list[str]]       # category name -> control names
+    category_docs: dict[str, str]          # file stem (e.g. "cards-and-layout") -> markdown
+    llms_txt: str
+    metadata: Optional[dict]               # Same data as controls.json (only with keep_docs)
+
+
+@dataclass
+class ExampleIndex:
+    """Every Gallery example file parsed once, indexed for the whole pipeline."""
+    examples_by_control: dict[str, list[ExampleSnippet]] = field(default_factory=dict)
+    categories: dict[str, list[str]] = field(default_factory=dict)      # category -> control names
+    section_to_control: dict[str, str] = field(default_factory=dict)    # section id -> control name
+    usage: dict[str, dict] = field(default_factory=dict)                # control -> Gallery usages (JSON-ready)
+    example_files: dict[str, list[str]] = field(default_factory=dict)   # control -> files its snippets come from
+
+
+def merge_effects(invalidation: dict[str, list[str]], prop_name: str, effects: list[str]):
+    """Add effects to a property's entry, keeping INVALIDATION_EFFECTS order."""
+    merged = set(invalidation.get(prop_name, ())) | set(effects)
+    invalidation[prop_name] = [effect for effect in INVALIDATION_EFFECTS if effect in merged]
+
+
+def is_layout_hot_path(prop: PropertyInfo, effects: list[str]) -> bool:
+    """An animatable property whose changes invalidate measure or arrange (layout on every frame)."""
+    return prop.prop_type.rstrip('?') in ANIMATABLE_PROPERTY_TYPES and bool(LAYOUT_EFFECTS.intersection(effects))
+
+
+# =============================================================================
+# C# Lexer
+# =============================================================================
+
+# Comments and literals are matched first and consumed whole, so braces,
+# semicolons or keywords inside them never reach the parser.
+CSHARP_LITERALS_AND_COMMENTS = r"""
+    (?P<doc>///[^\n]*)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>
+        \$*(?P<raw_quotes>"{3,}).*?(?P=raw_quotes)       # raw string literal (C# 11)
+      | (?:\$@|@\$|@)"(?:[^"]|"")*"                     # verbatim string, "" escapes a quote
+      | \$?"(?:[^"\\\n]|\\.)*"                         # regular / interpolated string
+    )
+  | (?P<char>'(?:[^'\\\n]|\\.){1,8}')
+"""
+
+# Full tokenizer: every identifier, number and punctuation character.
+CSHARP_TOKEN_PATTERN = re.compile(CSHARP_LITERALS_AND_COMMENTS + r"""
+  | (?P<ident>@?[A-Za-z_]\w*)
+  | (?P<number>\d[\w.]*)
+  | (?P<punct>\S)
+""", re.VERBOSE | re.DOTALL)
+
+# Structural scan: only what the parser reacts to. Everything else (most of a
+# file) is skipped inside the regex engine instead of becoming a token; the
+# leading lookahead rejects positions that cannot start any alternative.
+CSHARP_STRUCTURE_PATTERN = re.compile(r"""(?=[/"'@$ceACOS{};\]\#])(?:""" + CSHARP_LITERALS_AND_COMMENTS + r"""
+  | (?P<preproc>\#[^\n]*)
+  | (?P<decl>\b(?:class|enum|StyledProperty|Affects(?:Measure|Arrange|Render)|OnPropertyChanged)\b)
+  | (?P<changed>(?<=Property\.)Changed\b)
+  | (?P<boundary>[{};\]])
+)""", re.VERBOSE | re.DOTALL)
+
+
+@dataclass(slots=True)
+class CSharpToken:
+    """A lexical token: kind is doc, string, char, ident, number or punct."""
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+def tokenize_csharp(content: str, pos: int = 0) -> Iterator[CSharpToken]:
+    """Lazily yield the tokens of C# source from `pos` on (plain comments are dropped)."""
+    for match in CSHARP_TOKEN_PATTERN.finditer(content, pos):
+        kind = match.lastgroup
+        if kind != 'comment':
+            yield CSharpToken(kind, match.group(), match.start(), match.end())
+
+
+@dataclass
+class ClassDecl:
+    """A class declaration found by the C# scan."""
+    name: str
+    base_class: str
+    description: str
+    line: int
+    modifiers: list[str] = field(default_factory=list)
+    properties: list[PropertyInfo] = field(default_factory=list)  # Declared in this class's body
+    invalidation: dict[str, list[str]] = field(default_factory=dict)  # property -> INVALIDATION_EFFECTS
+
+
+@dataclass
+class SourceSymbols:
+    """Everything the C# scan found in one file."""
+    classes: list[ClassDecl] = field(default_factory=list)
+    enums: list[EnumInfo] = field(default_factory=list)
+    properties: list[PropertyInfo] = field(default_factory=list)  # All StyledProperties, file order
 
 
 # =============================================================================
@@ -185,206 +377,317 @@ class ExampleSnippet:
 class CSharpParser:
     """Parses C# control files to extract metadata."""
 
+    # Bump when parsing output changes, so cached results are re-parsed
+    VERSION = 5
+
+    # Modifiers that may precede a documented class (matches the
+    # "public [static|sealed|partial] class" convention above)
+    CLASS_MODIFIERS = {'public', 'static', 'sealed', 'partial'}
+
     def parse_file(self, filepath: Path) -> Optional[ControlInfo]:
         """Parse a C# control file and extract metadata."""
-        content = filepath.read_text(encoding='utf-8')
+        return self.control_from_symbols(self.scan_file(filepath), filepath.stem)
 
-        # Extract enums
-        enums = self._extract_enums(content)
+    def scan_file(self, filepath: Path) -> SourceSymbols:
+        """Scan a C# file for classes, enums and StyledProperties."""
+        return self.scan(filepath.read_text(encoding='utf-8'))
 
+    def control_from_symbols(self, symbols: SourceSymbols, target_name: str) -> Optional[ControlInfo]:
+        """Build the ControlInfo for a control file from its scan."""
         # Extract class info
-        target_name = filepath.stem
-        class_info = self._extract_class(content, target_name)
+        class_info = self.select_class(symbols.classes, target_name)
         if not class_info:
             return None
 
-        class_name, base_class, description = class_info
-
-        # Extract properties
-        properties = self._extract_properties(content)
-
         return ControlInfo(
-            name=class_name,
-            base_class=base_class,
-            description=description,
-            properties=properties,
-            enums=enums
+            name=class_info.name,
+            base_class=class_info.base_class,
+            description=class_info.description,
+            properties=list(symbols.properties),
+            enums=list(symbols.enums),
+            invalidation={name: list(effects) for name, effects in class_info.invalidation.items()}
         )
 
-    def _extract_enums(self, content: str) -> list[EnumInfo]:
-        """Extract all enum definitions from the file."""
-        enums = []
-        enum_pattern = re.compile(
-            r'public\s+enum\s+(\w+)\s*\{([^}]+)\}',
-            re.DOTALL
-        )
-        for match in enum_pattern.finditer(content):
-            enum_name = match.group(1)
-            enum_body = match.group(2)
-            values = []
-            for line in enum_body.split('\n'):
-                line = line.strip()
-                if not line or line.startswith('//'):
-                    continue
-                value_match = re.match(r'(\w+)', line)
-                if value_match:
-                    values.append(value_match.group(1))
-            enums.append(EnumInfo(name=enum_name, values=values))
-        return enums
-
-    def _extract_class(self, content: str, target_name: str) -> Optional[tuple[str, str, str]]:
+    def select_class(self, classes: list[ClassDecl], target_name: str) -> Optional[ClassDecl]:
+        """Pick the class named like the file, else the first Daisy* class."""
+        candidates = [c for c in classes if 'public' in c.modifiers and set(c.modifiers) <= self.CLASS_MODIFIERS]
+        for decl in candidates:
+            if decl.name == target_name:
+                return decl
+        for decl in candidates:
+            if decl.name.startswith("Daisy"):
+                return decl
+        return None
+
+    def scan(self, content: str) -> SourceSymbols:
         """
-        Extract class info for the target class name.
-        Returns (class_name, base_class, description).
+        Extract classes, public enums and StyledProperty registrations, each with
+        its attached /// summary, in one forward pass. Declarations are
+        tokenized in full only from their keyword to their end. Brace depth is
+        tracked so each property is also attributed to its enclosing class,
+        as are AffectsMeasure/Arrange/Render registrations and change handlers
+        (XProperty.Changed subscriptions, OnPropertyChanged comparisons).
         """
-        # Regex to match class definition:
-        # public [static] [sealed|partial] class Name [: Base]
-        class_pattern = re.compile(
-            r'public\s+(?:static\s+|sealed\s+|partial\s+)*class\s+(\w+)(?:\s*:\s*([\w\.]+))?',
-            re.MULTILINE
-        )
-
-        # Find all classes
-        matches = list(class_pattern.finditer(content))
-
-        selected_match = None
+        classes: list[ClassDecl] = []
+        enums: list[EnumInfo] = []
+        properties: list[PropertyInfo] = []
+        seen = set()
 
-        # 1. Try to find exact match with filename
-        for m in matches:
-            if m.group(1) == target_name:
-                selected_match = m
+        depth = 0
+        open_classes: list[tuple[ClassDecl, int]] = []  # (class, brace depth of its body)
+        pending_class: Optional[ClassDecl] = None      # header seen, body '{' not yet
+
+        doc_lines: list[str] = []   # /// block waiting for its declaration
+        doc_end = -1
+        stmt_start = 0              # modifiers of the next declaration start here
+        line, line_pos = 1, 0
+        pos = 0
+        while True:
+            match = CSHARP_STRUCTURE_PATTERN.search(content, pos)
+            if not match:
                 break
-
-        # 2. Fallback: Find first class starting with "Daisy"
-        if not selected_match:
-            for m in matches:
-                if m.group(1).startswith("Daisy"):
-                    selected_match = m
-                    break
-
-        if not selected_match:
+            kind = match.lastgroup
+            start, pos = match.start(), match.end()
+
+            if kind == 'doc':
+                if doc_end < 0 or content[doc_end:start].strip():
+                    doc_lines = []
+                doc_lines.append(match.group()[3:])
+                doc_end = stmt_start = pos
+            elif kind == 'boundary':
+                boundary = match.group()
+                # Attributes end a modifier run but keep the doc comment above them
+                if boundary != ']':
+                    doc_lines = []
+                if boundary == '{':
+                    depth += 1
+                    if pending_class:
+                        open_classes.append((pending_class, depth))
+                elif boundary == '}':
+                    if open_classes and open_classes[-1][1] == depth:
+                        open_classes.pop()
+                    depth -= 1
+                pending_class = None
+                stmt_start = pos
+            elif kind in ('comment', 'preproc'):
+                # A plain comment or #region/#if line ends the modifier run, so
+                # its words are never read as modifiers of the next declaration
+                stmt_start = pos
+            elif kind == 'changed':
+                owner = re.search(r'(\w+)Property\.$', content[max(0, start - 100):start])
+                if owner and open_classes:
+                    merge_effects(open_classes[-1][0].invalidation, owner.group(1), ['Handler'])
+            elif kind == 'decl':
+                modifiers = re.findall(r'\w+', content[stmt_start:start])
+                tokens = tokenize_csharp(content, start)
+                next(tokens)  # the keyword itself
+                keyword = match.group()
+                end = None
+                if keyword == 'class':
+                    line += content.count('\n', line_pos, start)
+                    line_pos = start
+                    end = self._scan_class(content, tokens, modifiers, doc_lines, line, classes)
+                    if end is not None:
+                        pending_class = classes[-1]
+                elif keyword == 'enum' and 'public' in modifiers:
+                    end = self._scan_enum(tokens, doc_lines, enums)
+                elif keyword == 'StyledProperty' and {'public', 'static', 'readonly'} <= set(modifiers):
+                    count = len(properties)
+                    end = self._scan_styled_property(content, tokens, doc_lines, properties, seen)
+                    if len(properties) > count and open_classes:
+                        open_classes[-1][0].properties.append(properties[-1])
+                elif keyword.startswith('Affects') and open_classes:
+                    end = self._scan_affects(tokens, keyword[len('Affects'):], open_classes[-1][0])
+                elif keyword == 'OnPropertyChanged' and 'override' in modifiers and open_classes:
+                    end = self._scan_property_dispatch(tokens, open_classes[-1][0])
+                if end is not None:
+                    pos = end
+                    doc_lines = []
+                    stmt_start = pos
+
+        return SourceSymbols(classes=classes, enums=enums, properties=properties)
+
+    @staticmethod
+    def _collect(tokens: Iterator[CSharpToken], stop_texts: str) -> list[CSharpToken]:
+        """Consume tokens up to and including the first of stop_texts outside brackets."""
+        collected = []
+        depth = 0
+        for tok in tokens:
+            collected.append(tok)
+            if tok.kind != 'punct':
+                continue
+            if depth == 0 and tok.text in stop_texts:
+                break
+            if tok.text in '([{':
+                depth += 1
+            elif tok.text in ')]}':
+                depth -= 1
+        return collected
+
+    def _scan_class(self, content: str, tokens: Iterator[CSharpToken], modifiers: list[str],
+                    doc_lines: list[str], line: int, classes: list[ClassDecl]) -> Optional[int]:
+        """Record a class declaration; returns the offset of its body (None if not a declaration)."""
+        header = self._collect(tokens, '{;')
+        if not header or header[0].kind != 'ident':
+            return None  # e.g. the "class" constraint in "where T : class"
+        j = self._skip_balanced(header, 1, '<', '>')
+        base_class = "Object"  # Handle no base class (static)
+        if j < len(header) and header[j].text == ':':
+            parts = []
+            j += 1
+            while j < len(header) and (header[j].kind == 'ident' or header[j].text == '.'):
+                parts.append(header[j].text)
+                j += 1
+            if parts:
+                base_class = ''.join(parts)
+        classes.append(ClassDecl(
+            name=header[0].text,
+            base_class=base_class,
+            description=self._summary(doc_lines),
+            line=line,
+            modifiers=modifiers
+        ))
+        return header[-1].start
+
+    @staticmethod
+    def _property_name(tok: CSharpToken) -> Optional[str]:
+        """'Variant' for the identifier VariantProperty, else None."""
+        if tok.kind == 'ident' and tok.text.endswith('Property') and tok.text not in ('Property', 'AvaloniaProperty'):
+            return tok.text[:-len('Property')]
+        return None
+
+    def _scan_affects(self, tokens: Iterator[CSharpToken], effect: str, owner: ClassDecl) -> Optional[int]:
+        """Record AffectsRender<T>(AProperty, BProperty, ...); returns the offset after the call."""
+        call = self._collect(tokens, ';')
+        if not call or call[-1].text != ';' or not any(tok.text == '(' for tok in call):
+            return None  # e.g. a method named AffectsRender, not the registration call
+        for tok in call:
+            name = self._property_name(tok)
+            if name:
+                merge_effects(owner.invalidation, name, [effect])
+        return call[-1].end
+
+    def _scan_property_dispatch(self, tokens: Iterator[CSharpToken], owner: ClassDecl) -> Optional[int]:
+        """
+        Record the properties an OnPropertyChanged override reacts to: those
+        compared with == or matched by case; returns the offset after the body.
+        """
+        header = self._collect(tokens, '{;')
+        if not header or header[-1].text != '{':
             return None
+        body = self._collect(tokens, '}')
+        for i, tok in enumerate(body):
+            name = self._property_name(tok)
+            if not name:
+                continue
+            before = ''.join(t.text for t in body[max(0, i - 2):i])
+            after = ''.join(t.text for t in body[i + 1:i + 3])
+            if before.endswith('==') or after == '==' or (i and body[i - 1].text == 'case'):
+                merge_effects(owner.invalidation, name, ['Handler'])
+        return body[-1].end if body else header[-1].end
+
+    def _scan_enum(self, tokens: Iterator[CSharpToken], doc_lines: list[str],
+                   enums: list[EnumInfo]) -> Optional[int]:
+        """Record an enum and its member names; returns the offset after its body."""
+        header = self._collect(tokens, '{;')
+        if len(header) < 2 or header[0].kind != 'ident' or header[-1].text != '{':
+            return None
+        body = self._collect(tokens, '}')
+        values = []
+        expect_member = True
+        depth = 0
+        for tok in body[:-1]:
+            if tok.text in '([{':
+                depth += 1
+            elif tok.text in ')]}':
+                depth -= 1
+            elif depth == 0 and tok.text == ',':
+                expect_member = True
+            elif depth == 0 and expect_member and tok.kind == 'ident':
+                values.append(tok.text)
+                expect_member = False
+        enums.append(EnumInfo(name=header[0].text, values=values, description=self._summary(doc_lines)))
+        return body[-1].end if body else header[-1].end
+
+    def _scan_styled_property(self, content: str, tokens: Iterator[CSharpToken], doc_lines: list[str],
+                              properties: list[PropertyInfo], seen: set) -> Optional[int]:
+        """Record a StyledProperty field and its registration; returns the offset after its ';'."""
+        decl = self._collect(tokens, ';=')
+        type_end = self._skip_balanced(decl, 0, '<', '>')
+        if type_end < 2 or type_end >= len(decl) or decl[type_end].kind != 'ident' \
+                or not decl[type_end].text.endswith('Property'):
+            return None
+        prop_type = content[decl[0].end:decl[type_end - 1].start].strip()
+        prop_name = decl[type_end].text[:-len('Property')]
+        if decl[-1].text == '=':
+            init = self._collect(tokens, ';')
+            end = init[-1].end if init else decl[-1].end
+        else:
+            init = []
+            end = decl[-1].end
+
+        default = "-"
+        for k in range(len(init) - 3):
+            if init[k].text == 'nameof' and init[k + 1].text == '(' and init[k + 3].text == ')':
+                prop_name = init[k + 2].text
+                if k + 4 < len(init) and init[k + 4].text == ',':
+                    default = self._argument_text(content, init, k + 5, prop_type)
+                break
 
-        class_name = selected_match.group(1)
-        base_class = selected_match.group(2) or "Object" # Handle no base class (static)
-
-        # Find the summary comment immediately before the class
-        class_start = selected_match.start()
-        before_class = content[:class_start]
-
-        # Look for the last summary comment before class definition
-        summary_pattern = re.compile(
-            r'///\s*<summary>\s*(.*?)\s*</summary>',
-            re.DOTALL
-        )
-
-        summaries = list(summary_pattern.finditer(before_class))
-        description = ""
-        if summaries:
-            last_summary = summaries[-1]
-            # Check if summary is close to class definition (within 300 chars to be safe)
-            if class_start - last_summary.end() < SUMMARY_PROXIMITY_CHARS:
-                raw_desc = last_summary.group(1)
-                # Clean the description
-                description = self._clean_summary(raw_desc)
-
-        return class_name, base_class, description
-
-    def _extract_properties(self, content: str) -> list[PropertyInfo]:
-        """Extract all StyledProperty definitions."""
-        properties = []
-        seen = set()
-
-        # Split content into property blocks
-        lines = content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Look for StyledProperty definition
-            prop_match = re.search(
-                r'public\s+static\s+readonly\s+StyledProperty<([^>]+)>\s+(\w+)Property',
-                line
-            )
-            if prop_match:
-                prop_type = prop_match.group(1).strip()
-                prop_name_with_property = prop_match.group(2)
-                prop_name = prop_name_with_property  # Will extract actual name from nameof
-
-                # Find the nameof and default value
-                block = line
-                j = i + 1
-                paren_count = line.count('(') - line.count(')')
-                while paren_count > 0 and j < len(lines):
-                    block += '\n' + lines[j]
-                    paren_count += lines[j].count('(') - lines[j].count(')')
-                    j += 1
-
-                # Extract nameof
-                nameof_match = re.search(r'nameof\((\w+)\)', block)
-                if nameof_match:
-                    prop_name = nameof_match.group(1)
-
-                # Extract default value
-                default = self._extract_default(block, prop_type)
-
-                # Look for summary comment above
-                description = ""
-                k = i - 1
-                while k >= 0 and k >= i - SUMMARY_LOOKBACK_LINES:
-                    if '/// <summary>' in lines[k]:
-                        # Gather the summary
-                        summary_lines = []
-                        for m in range(k, min(k + 5, len(lines))):
-                            summary_lines.append(lines[m])
-                            if '</summary>' in lines[m]:
-                                break
-                        summary_text = '\n'.join(summary_lines)
-                        desc_match = re.search(r'<summary>\s*(.*?)\s*</summary>', summary_text, re.DOTALL)
-                        if desc_match:
-                            description = self._clean_summary(desc_match.group(1))
-                        break
-                    k -= 1
-
-                if prop_name not in seen:
-                    seen.add(prop_name)
-                    properties.append(PropertyInfo(
-                        name=prop_name,
-                        prop_type=prop_type,
-                        default=default,
-                        description=description
-                    ))
-
+        if prop_name not in seen:
+            seen.add(prop_name)
+            properties.append(PropertyInfo(
+                name=prop_name,
+                prop_type=prop_type,
+                default=default,
+                description=self._summary(doc_lines)
+            ))
+        return end
+
+    def _argument_text(self, content: str, tokens: list[CSharpToken], start: int, prop_type: str) -> str:
+        """Source text of the call argument starting at tokens[start], cleaned as a default value."""
+        depth = 0
+        j = start
+        while j < len(tokens):
+            text = tokens[j].text
+            if text in '([{':
+                depth += 1
+            elif text in ')]}':
+                if depth == 0:
+                    break
+                depth -= 1
+            elif text == ',' and depth == 0:
+                break
+            j += 1
+        if j == start:
+            return "-"
+        if tokens[start].text == 'defaultValue' and tokens[start + 1].text == ':':
+            start += 2
+        default_raw = content[tokens[start].start:tokens[j - 1].end].strip()
+        return self._clean_default(default_raw, prop_type) if default_raw else "-"
+
+    @staticmethod
+    def _skip_balanced(tokens: list[CSharpToken], i: int, open_text: str, close_text: str) -> int:
+        """If tokens[i] opens a bracket pair, return the index after its match; else i."""
+        if i >= len(tokens) or tokens[i].text != open_text:
+            return i
+        depth = 0
+        while i < len(tokens):
+            if tokens[i].text == open_text:
+                depth += 1
+            elif tokens[i].text == close_text:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
             i += 1
+        return i
 
-        return properties
-
-    def _extract_default(self, block: str, prop_type: str) -> str:
-        """Extract default value from property registration block."""
-        # Look for the default value after nameof - handle nested parentheses
-        # Pattern: nameof(X), DefaultValue)
-        match = re.search(r'nameof\(\w+\)\s*,\s*(.+?)\)\s*;', block, re.DOTALL)
-        if match:
-            default_raw = match.group(1).strip()
-            # Handle nested constructor calls like new Thickness(32)
-            paren_count = 0
-            result = []
-            for char in default_raw:
-                if char == '(':
-                    paren_count += 1
-                    result.append(char)
-                elif char == ')':
-                    if paren_count > 0:
-                        paren_count -= 1
-                        result.append(char)
-                    else:
-                        break  # End of default value
-                else:
-                    result.append(char)
-            default_raw = ''.join(result).strip()
-            if default_raw:
-                return self._clean_default(default_raw, prop_type)
-        return "-"
+    def _summary(self, doc_lines: list[str]) -> str:
+        """Cleaned <summary> text of a /// block."""
+        if not doc_lines:
+            return ""
+        match = re.search(r'<summary>\s*(.*?)\s*</summary>', '\n'.join(doc_lines), re.DOTALL)
+        return self._clean_summary(match.group(1)) if match else ""
 
     def _clean_summary(self, text: str) -> str:
         """Clean XML documentation text."""
@@ -413,142 +716,389 @@ class CSharpParser:
             return "Color(semitransparent)"
         if 'Colors.' in default:
             return default.replace('Colors.', '')
-        # Enum defaults
-        if '.' in default:
+        # String literals are shown as written
+        if default.startswith(('"', '@"', '$"')):
+            return default
+        # Numeric literals are shown as written: 4.0, 0.25, -1, 12f
+        if re.fullmatch(r'-?\d+(\.\d+)?[fFdDmM]?', default):
+            return default
+        # Enum defaults / static members: DaisySize.Medium -> Medium
+        if re.fullmatch(r'[\w.]+', default):
             return default.split('.')[-1]
-        return default
+        # Static factory calls keep their type: System.TimeSpan.FromMilliseconds(250) -> TimeSpan.FromMilliseconds(250)
+        return re.sub(r'^(?:\w+\.)*(\w+\.\w+\()', r'\1', default)
 
 
 # =============================================================================
-# AXAML Parser
+# Symbol Index
 # =============================================================================
 
-class AxamlParser:
-    """Parses AXAML example files to extract snippets."""
+class SymbolIndex:
+    """
+    Classes and enums declared anywhere under Flowery.NET/Controls, built once
+    from the per-file scans: type -> declaration and source file, base chains,
+    declared properties and reverse "used by" edges (type -> classes whose
+    StyledProperties use it).
+    """
+
+    def __init__(self):
+        self.classes: dict[str, ClassDecl] = {}
+        self.enums: dict[str, EnumInfo] = {}
+        self.declared_in: dict[str, str] = {}     # type name -> source path
+        self.used_by: dict[str, list[str]] = {}   # type name -> class names
+
+    def add_file(self, path: str, symbols: SourceSymbols):
+        """Add one file's declarations (partial classes are merged)."""
+        for decl in symbols.classes:
+            existing = self.classes.get(decl.name)
+            if existing is None:
+                self.classes[decl.name] = replace(decl, properties=list(decl.properties),
+                                                  invalidation=dict(decl.invalidation))
+                self.declared_in[decl.name] = path
+                continue
+            existing.properties.extend(decl.properties)
+            for prop_name, effects in decl.invalidation.items():
+                merge_effects(existing.invalidation, prop_name, effects)
+            if existing.base_class == "Object" and decl.base_class != "Object":
+                existing.base_class = decl.base_class
+            existing.description = existing.description or decl.description
+        for enum in symbols.enums:
+            self.enums.setdefault(enum.name, enum)
+            self.declared_in.setdefault(enum.name, path)
+
+    def build_references(self):
+        """Compute the used-by edges once every file has been added."""
+        self.used_by = {}
+        for name, decl in self.classes.items():
+            for prop in decl.properties:
+                for type_name in self.type_names(prop.prop_type):
+                    users = self.used_by.setdefault(type_name, [])
+                    if name not in users:
+                        users.append(name)
+
+    def type_names(self, prop_type: str) -> list[str]:
+        """Indexed types mentioned in a property type (e.g. IList<DaisySize>?)."""
+        return [word for word in re.findall(r'\w+', prop_type) if word in self.enums or word in self.classes]
+
+    def base_chain(self, class_name: str) -> list[str]:
+        """Base classes declared in the index, nearest first."""
+        chain = []
+        decl = self.classes.get(class_name)
+        while decl:
+            base = decl.base_class.rsplit('.', 1)[-1]
+            if base in chain or base == class_name:
+                break  # Defensive: malformed input with a cycle
+            decl = self.classes.get(base)
+            if decl:
+                chain.append(base)
+        return chain
+
+    def resolve(self, control: ControlInfo):
+        """
+        Fill in the control's inherited properties, enums declared in other
+        files, and invalidation registered by its base classes (which applies
+        to the control too).
+        """
+        known = {prop.name for prop in control.properties}
+        control.inherited_properties = {}
+        for base in self.base_chain(control.name):
+            for prop_name, effects in self.classes[base].invalidation.items():
+                merge_effects(control.invalidation, prop_name, effects)
+            inherited = [prop for prop in self.classes[base].properties if prop.name not in known]
+            known.update(prop.name for prop in inherited)
+            if inherited:
+                control.inherited_properties[base] = inherited
+
+        local_enums = {enum.name for enum in control.enums}
+        control.referenced_enums = []
+        all_properties = control.properties + [
+            prop for props in control.inherited_properties.values() for prop in props
+        ]
+        for prop in all_properties:
+            for type_name in self.type_names(prop.prop_type):
+                if type_name in self.enums and type_name not in local_enums:
+                    local_enums.add(type_name)
+                    control.referenced_enums.append(self.enums[type_name])
 
-    def parse_file(self, filepath: Path) -> list[ExampleSnippet]:
-        """Parse an AXAML file and extract example snippets."""
-        content = filepath.read_text(encoding='utf-8')
-        snippets = []
 
-        # Find all section headers
-        section_pattern = re.compile(
-            r'<local:SectionHeader\s+(?:SectionId="([^"]+)"\s+)?Title="([^"]+)"[^/]*/?>',
-            re.IGNORECASE
-        )
+# =============================================================================
+# XML Documentation File
+# =============================================================================
 
-        divider_pattern = re.compile(r'<controls:DaisyDivider\s*/?>', re.IGNORECASE)
-
-        sections = []
-        for match in section_pattern.finditer(content):
-            section_id = match.group(1) or self._id_from_title(match.group(2))
-            title = match.group(2)
-            start_pos = match.end()
-            sections.append({
-                'id': section_id,
-                'title': title,
-                'start': start_pos
-            })
+class XmlDocIndex:
+    """
+    Summaries from the compiler's XML documentation file (Flowery.NET.xml,
+    written when the project builds with GenerateDocumentationFile). Members
+    are keyed by simple type name, so lookups need no namespaces.
+    """
 
-        # Find section boundaries
-        for i, section in enumerate(sections):
-            next_section_start = sections[i + 1]['start'] if i + 1 < len(sections) else len(content)
+    def __init__(self):
+        self.types: dict[str, str] = {}                   # DaisyButton -> summary
+        self.members: dict[tuple[str, str], str] = {}     # (DaisyButton, VariantProperty) -> summary
 
-            divider_match = divider_pattern.search(content, section['start'])
-            if divider_match and divider_match.start() < next_section_start:
-                end_pos = divider_match.start()
+    @classmethod
+    def load(cls, xml_path: Path) -> 'XmlDocIndex':
+        """
+        Stream-parse the file. Each <member> is removed from <members> once
+        read, so the tree never holds more than the member being parsed.
+        """
+        index = cls()
+        open_elements: list[ElementTree.Element] = []
+        for event, elem in ElementTree.iterparse(xml_path, events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if elem.tag != 'member':
+                continue
+            summary = elem.find('summary')
+            name = elem.get('name', '')
+            if summary is not None and len(name) > 2 and name[1] == ':':
+                index._add(name[0], name[2:], cls._text(summary))
+            if open_elements:
+                open_elements[-1].remove(elem)
+        return index
+
+    def _add(self, kind: str, qualified_name: str, summary: str):
+        if not summary:
+            return
+        path = re.sub(r'\(.*\)$', '', qualified_name).split('.')
+        if kind == 'T':
+            self.types.setdefault(path[-1], summary)
+        elif kind in ('F', 'P') and len(path) >= 2:
+            self.members.setdefault((path[-2], path[-1]), summary)
+
+    @classmethod
+    def _text(cls, elem: ElementTree.Element) -> str:
+        """Plain text of a doc element; <see cref="T:Ns.Type"/> becomes Type."""
+        parts = [elem.text or '']
+        for child in elem:
+            if child.get('cref'):
+                cref = re.sub(r'^\w:|\(.*\)$', '', child.get('cref'))
+                parts.append(child.text or cref.rsplit('.', 1)[-1])
+            elif child.get('langword') or child.get('name'):
+                parts.append(child.get('langword') or child.get('name'))
             else:
-                end_pos = next_section_start
+                parts.append(cls._text(child))
+            parts.append(child.tail or '')
+        return ' '.join(''.join(parts).split())
 
-            section_content = content[section['start']:end_pos]
+    def property_summary(self, type_name: str, prop_name: str) -> Optional[str]:
+        """Doc of the StyledProperty field, else of the CLR property wrapper."""
+        return self.members.get((type_name, f"{prop_name}Property")) or self.members.get((type_name, prop_name))
+
+    def apply(self, control: ControlInfo):
+        """Replace scanned summaries with the XML ones; keep the scan where the XML has none."""
+        control.description = self.types.get(control.name) or control.description
+        owners = [(control.name, control.properties)] + list(control.inherited_properties.items())
+        for owner, properties in owners:
+            for prop in properties:
+                prop.description = self.property_summary(owner, prop.name) or prop.description
+        for enum in control.enums + control.referenced_enums:
+            enum.description = self.types.get(enum.name) or enum.description
+
+
+# =============================================================================
+# AXAML Element Index
+# =============================================================================
+
+# Raw text of the start tag at a known offset: its attribute text and whether
+# it is self-closing. Quoted values may contain '>' (e.g. Text="a > b").
+AXAML_START_TAG_PATTERN = re.compile(rb'<[^\s/>]+((?:[^>"\']|"[^"]*"|\'[^\']*\')*?)(/?)>')
+
+# Attributes in raw start tag text, with their qualified names as written (x:Name)
+AXAML_ATTRIBUTE_PATTERN = re.compile(rb'([\w:.]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+# The same on decoded text, for re-serializing example snippets
+AXAML_TEXT_ATTRIBUTE_PATTERN = re.compile(r'([\w:.]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+# PathIcons kept as a preview when an element's content is otherwise elided
+PATHICON_DATA_PATTERN = re.compile(r'<PathIcon[^>]*Data="([^"]{1,100})"[^>]*/>')
+PATHICON_BINDING_PATTERN = re.compile(r'<PathIcon[^>]*Data="\{[^}]+\}"[^>]*/>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Namespaces Daisy controls are imported from (xmlns:controls="clr-namespace:...")
+CONTROL_NAMESPACE_PREFIXES = ('clr-namespace:', 'using:')
+
+
+@dataclass(slots=True)
+class ControlUsage:
+    """One occurrence of a Daisy control in a Gallery AXAML file."""
+    control: str
+    line: int
+    section_id: str                # Last SectionHeader above it ("" if none)
+    attributes: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class AxamlFileIndex:
+    """What one pass over an AXAML file yields: example snippets and every control usage."""
+    snippets: list[ExampleSnippet] = field(default_factory=list)
+    usages: list[ControlUsage] = field(default_factory=list)
+
+
+@dataclass
+class AxamlElement:
+    """A Daisy control element in an example file, with its source text."""
+    name: str
+    attrs: str
+    self_closing: bool
+    inner: Optional[str] = None   # Raw inner XAML of paired elements
 
-            # Extract sub-examples
-            sub_examples = self._extract_sub_examples(section_content)
 
+@dataclass
+class AxamlGroup:
+    """Control elements following a SemiBold TextBlock label ("" before the first label)."""
+    label: str
+    elements: list[AxamlElement] = field(default_factory=list)
+
+
+@dataclass
+class AxamlSection:
+    """Content between a SectionHeader and the next DaisyDivider or SectionHeader."""
+    section_id: str
+    title: str
+    groups: list[AxamlGroup] = field(default_factory=lambda: [AxamlGroup("")])
+
+
+# =============================================================================
+# AXAML Parser
+# =============================================================================
+
+class AxamlParser:
+    """Parses AXAML example files to extract snippets."""
+
+    # Bump when parsing output changes, so cached results are re-parsed
+    VERSION = 5
+
+    def __init__(self, dropped_attributes: frozenset[str] = EXAMPLE_DROPPED_ATTRIBUTES,
+                 dropped_pixel_attributes: frozenset[str] = EXAMPLE_DROPPED_PIXEL_ATTRIBUTES):
+        self.dropped_attributes = dropped_attributes
+        self.dropped_pixel_attributes = dropped_pixel_attributes
+
+    def parse_file(self, filepath: Path) -> list[ExampleSnippet]:
+        """Parse an AXAML file and extract example snippets."""
+        return self.index_file(filepath).snippets
+
+    def index_file(self, filepath: Path) -> AxamlFileIndex:
+        """Parse an AXAML file once for both its example snippets and its control usages."""
+        try:
+            sections, usages = self.build_index(filepath.read_bytes())
+        except expat.ExpatError as error:
+            print(f"      Warning: skipped {filepath.name}, not well-formed XML ({error})")
+            return AxamlFileIndex()
+
+        snippets = []
+        for section in sections:
+            # Extract sub-examples
+            sub_examples = self._extract_sub_examples(section)
             if sub_examples:
+                # Signatures are computed here so the parse cache keeps them with the snippet
                 snippets.append(ExampleSnippet(
-                    section_id=section['id'],
-                    title=section['title'],
-                    sub_examples=sub_examples
+                    section_id=section.section_id,
+                    title=section.title,
+                    sub_examples=sub_examples,
+                    signatures=ExampleSimilarityIndex.signatures_of([xaml for _, xaml in sub_examples])
+                ))
+
+        return AxamlFileIndex(snippets=snippets, usages=usages)
+
+    def build_index(self, source: bytes) -> tuple[list[AxamlSection], list[ControlUsage]]:
+        """
+        Index an AXAML document in one streaming, namespace-aware XML pass:
+        section -> labelled group -> Daisy control elements. Paired elements
+        get their inner XAML from the matching end tag, so nested elements
+        of the same name are paired correctly. Every Daisy element, inside a
+        section or not, is also returned as a ControlUsage.
+        """
+        sections: list[AxamlSection] = []
+        usages: list[ControlUsage] = []
+        section: Optional[AxamlSection] = None   # None after a divider
+        section_id = ""                          # Last header seen, kept across dividers
+        open_elements: list[Optional[tuple[AxamlElement, int]]] = []
+        parser = expat.ParserCreate(namespace_separator=' ')
+
+        def start_element(name: str, attributes: dict[str, str]):
+            nonlocal section, section_id
+            namespace, _, local_name = name.rpartition(' ')
+            entry = None
+            tag = None
+            if local_name.startswith('Daisy') and '.' not in local_name \
+                    and namespace.startswith(CONTROL_NAMESPACE_PREFIXES):
+                tag = AXAML_START_TAG_PATTERN.match(source, parser.CurrentByteIndex)
+                usages.append(ControlUsage(
+                    control=local_name,
+                    line=parser.CurrentLineNumber,
+                    section_id=section_id,
+                    attributes={
+                        attr.decode('utf-8'): (double or single).decode('utf-8')
+                        for attr, double, single in AXAML_ATTRIBUTE_PATTERN.findall(tag.group(1))
+                        if not attr.startswith(b'xmlns')
+                    }
                 ))
 
-        return snippets
+            if local_name == 'SectionHeader' and attributes.get('Title'):
+                title = attributes['Title']
+                section = AxamlSection(attributes.get('SectionId') or self._id_from_title(title), title)
+                section_id = section.section_id
+                sections.append(section)
+            elif local_name == 'DaisyDivider':
+                section = None
+            elif section is None:
+                pass
+            elif local_name == 'TextBlock' and attributes.get('FontWeight') == 'SemiBold' and attributes.get('Text'):
+                section.groups.append(AxamlGroup(attributes['Text']))
+            elif tag:
+                element = AxamlElement(local_name, tag.group(1).decode('utf-8'), self_closing=bool(tag.group(2)))
+                section.groups[-1].elements.append(element)
+                entry = (element, tag.end())
+            open_elements.append(entry)
+
+        def end_element(name: str):
+            entry = open_elements.pop()
+            if entry and not entry[0].self_closing:
+                element, inner_start = entry
+                element.inner = source[inner_start:parser.CurrentByteIndex].decode('utf-8').strip()
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.Parse(source, True)
+        return sections, usages
 
     def _id_from_title(self, title: str) -> str:
         """Generate section ID from title."""
         return title.lower().replace(' ', '-').replace('/', '-')
 
-    def _extract_sub_examples(self, content: str) -> list[tuple[str, str]]:
-        """Extract labeled sub-examples from content."""
+    def _extract_sub_examples(self, section: AxamlSection) -> list[tuple[str, str]]:
+        """Extract labeled sub-examples from a section."""
         sub_examples = []
 
-        # Look for TextBlock with FontWeight="SemiBold" as labels
-        label_pattern = re.compile(
-            r'<TextBlock\s+Text="([^"]+)"[^>]*FontWeight="SemiBold"[^>]*/?>',
-            re.IGNORECASE
-        )
-
-        matches = list(label_pattern.finditer(content))
-
-        for idx, match in enumerate(matches):
-            label = match.group(1)
-            start = match.end()
-            end = matches[idx + 1].start() if idx + 1 < len(matches) else len(content)
-            snippet = content[start:end]
-
-            controls = self._extract_control_elements(snippet)
+        for group in section.groups[1:]:
+            controls = self._extract_control_elements(group.elements)
             if controls:
-                sub_examples.append((label, controls))
+                sub_examples.append((group.label, controls))
 
         # If no labeled sub-examples, extract controls directly
         if not sub_examples:
-            controls = self._extract_control_elements(content)
+            elements = [element for group in section.groups for element in group.elements]
+            controls = self._extract_control_elements(elements)
             if controls:
                 sub_examples.append(("Example", controls))
 
         return sub_examples
 
-    def _extract_control_elements(self, content: str, target_control: str = None) -> str:
-        """Extract and format control elements."""
+    def _extract_control_elements(self, elements: list[AxamlElement]) -> str:
+        """Extract and format control elements (self-closing ones first, as the simplest examples)."""
         controls = []
 
-        # Match self-closing or paired control elements with any namespace prefix
-        # Matches: controls:DaisyButton, colorpicker:DaisyColorWheel, weather:DaisyWeatherCard, etc.
-        self_closing = re.compile(r'<(\w+):(Daisy\w+)([^>]*)/>')
-        paired_pattern = re.compile(r'<(\w+):(Daisy\w+)([^>]*)>')
-
-        for match in self_closing.finditer(content):
-            ns_prefix = match.group(1)
-            control_name = match.group(2)
-            # Skip dividers and unrelated controls if we have a target
-            if control_name == 'DaisyDivider':
-                continue
-            attrs = match.group(3)
-            xaml = self._format_control(control_name, attrs, None)
+        ordered = [e for e in elements if e.self_closing] + [e for e in elements if not e.self_closing]
+        for element in ordered:
+            xaml = self._format_control(element.name, element.attrs, element.inner)
             if xaml and xaml not in controls:
                 controls.append(xaml)
             if len(controls) >= MAX_CONTROLS_PER_EXAMPLE:
                 break
 
-        if len(controls) < MAX_CONTROLS_PER_EXAMPLE:
-            for match in paired_pattern.finditer(content):
-                ns_prefix = match.group(1)
-                control_name = match.group(2)
-                if control_name == 'DaisyDivider':
-                    continue
-                attrs = match.group(3)
-                start = match.end()
-                # Try to find end tag with same namespace prefix
-                end_tag = f'</{ns_prefix}:{control_name}>'
-                end_pos = content.find(end_tag, start)
-                if end_pos != -1:
-                    inner = content[start:end_pos].strip()
-                    xaml = self._format_control(control_name, attrs, inner)
-                    if xaml and xaml not in controls:
-                        controls.append(xaml)
-                if len(controls) >= MAX_CONTROLS_PER_EXAMPLE:
-                    break
-
         return '\n'.join(controls) if controls else ""
 
     def _format_control(self, control_name: str, attrs: str, inner: Optional[str]) -> str:
@@ -581,41 +1131,30 @@ class AxamlParser:
         return normalized
 
     def _clean_attrs(self, attrs: str) -> str:
-        """Clean attributes string."""
-        # Remove layout and event attributes
-        remove_patterns = [
-            r'\s*Margin="[^"]*"',
-            r'\s*Width="\d+"',
-            r'\s*Height="\d+"',
-            r'\s*HorizontalAlignment="[^"]*"',
-            r'\s*VerticalAlignment="[^"]*"',
-            r'\s*Click="[^"]*"',
-            r'\s*x:Name="[^"]*"',
-            r'\s*Tag="[^"]*"',
-            r'\s*ToolTip\.Tip="[^"]*"',
-        ]
-        for pattern in remove_patterns:
-            attrs = re.sub(pattern, '', attrs)
-
-        # Collapse whitespace
-        attrs = ' '.join(attrs.split())
-        if attrs:
-            attrs = ' ' + attrs
-        return attrs
+        """
+        Tokenize the attribute text once and re-serialize it without the
+        dropped layout/event attributes (whitespace inside values collapsed).
+        """
+        kept = []
+        for match in AXAML_TEXT_ATTRIBUTE_PATTERN.finditer(attrs):
+            name, double, single = match.groups()
+            value = double if double is not None else single
+            if name in self.dropped_attributes or (name in self.dropped_pixel_attributes and value.isdigit()):
+                continue
+            quote = '"' if double is not None else "'"
+            kept.append(f" {name}={quote}{WHITESPACE_PATTERN.sub(' ', value)}{quote}")
+        return ''.join(kept)
 
     def _simplify_inner(self, inner: str) -> str:
-        """Simplify inner content."""
-        # First normalize the indentation
-        inner = self._normalize_indentation(inner)
-
+        """Simplify inner content (already collapsed by _normalize_indentation)."""
         # If it contains complex nested controls, just indicate content
         if '<controls:' in inner or '<StackPanel' in inner or '<Grid' in inner:
             # Check for PathIcon
             if '<PathIcon' in inner:
-                path_match = re.search(r'<PathIcon[^>]*Data="([^"]{1,100})"[^>]*/>', inner)
+                path_match = PATHICON_DATA_PATTERN.search(inner)
                 if path_match:
                     return f'<PathIcon Data="{path_match.group(1)[:MAX_PATHICON_DATA_LENGTH]}..."/>'
-                path_match = re.search(r'<PathIcon[^>]*Data="\{[^}]+\}"[^>]*/>', inner)
+                path_match = PATHICON_BINDING_PATTERN.search(inner)
                 if path_match:
                     return path_match.group(0)
             return "<!-- Content -->"
@@ -627,6 +1166,101 @@ class AxamlParser:
         return inner
 
 
+# =============================================================================
+# Example Similarity
+# =============================================================================
+
+# Opening tags and attributes; closing tags and text content carry no structure
+XAML_SHINGLE_TOKEN_PATTERN = re.compile(r'<(?:\w+:)?([\w.]+)|([\w.:]+)="([^"]*)"')
+MINHASH_PRIME = (1 << 61) - 1
+
+
+class ExampleSimilarityIndex:
+    """
+    Near-duplicate detection for example snippets. A snippet's tokens are its
+    tag names and attribute name=value pairs (free-text attributes by name
+    only); its shingles are the tokens plus adjacent token pairs. MinHash
+    signatures estimate the Jaccard similarity of two shingle sets, and LSH
+    band buckets limit the comparisons to likely matches.
+    """
+
+    _permutations: list[tuple[int, int]] = []
+
+    def __init__(self, threshold: float = EXAMPLE_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        # Below the LSH curve's midpoint, buckets would miss matches: compare with everything
+        self.exhaustive = threshold < (1 / MINHASH_BANDS) ** (1 / self.rows)
+        self.signatures: list[tuple[int, ...]] = []
+        self.owners: list[str] = []
+        self.buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+    @classmethod
+    def permutations(cls) -> list[tuple[int, int]]:
+        """The (a, b) pairs of the hash permutations, drawn once per process."""
+        if not cls._permutations:
+            rng = random.Random(MINHASH_SEED)
+            cls._permutations = [
+                (rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME))
+                for _ in range(MINHASH_PERMUTATIONS)
+            ]
+        return cls._permutations
+
+    @staticmethod
+    def shingles(xaml: str) -> set[str]:
+        tokens = []
+        for tag, attr, value in XAML_SHINGLE_TOKEN_PATTERN.findall(xaml):
+            if tag:
+                tokens.append(f"<{tag}")
+            elif attr.rsplit(':', 1)[-1] in EXAMPLE_TEXT_ATTRIBUTES:
+                tokens.append(attr)
+            else:
+                tokens.append(f"{attr}={value}")
+        if not tokens:
+            tokens = [' '.join(xaml.split())]
+        return set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+    @classmethod
+    def signatures_of(cls, snippets: list[str]) -> list[tuple[int, ...]]:
+        """MinHash signatures for a batch of snippets (one per snippet, same order)."""
+        permutations = cls.permutations()
+        signatures = []
+        for xaml in snippets:
+            # One row of permuted values per shingle; the signature is the column-wise minimum
+            rows = [
+                [(a * h + b) % MINHASH_PRIME for a, b in permutations]
+                for h in (int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+                          for shingle in cls.shingles(xaml))
+            ]
+            signatures.append(tuple(map(min, zip(*rows))))
+        return signatures
+
+    def _bands(self, signature: tuple[int, ...]) -> Iterator[tuple[int, tuple[int, ...]]]:
+        for band in range(MINHASH_BANDS):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def similarity(self, first: tuple[int, ...], second: tuple[int, ...]) -> float:
+        return sum(x == y for x, y in zip(first, second)) / MINHASH_PERMUTATIONS
+
+    def find(self, signature: tuple[int, ...]) -> Optional[str]:
+        """Owner of the first indexed snippet at or above the threshold, or None."""
+        if self.exhaustive:
+            candidates = range(len(self.signatures))
+        else:
+            candidates = sorted({i for key in self._bands(signature) for i in self.buckets.get(key, ())})
+        for i in candidates:
+            if self.similarity(signature, self.signatures[i]) >= self.threshold:
+                return self.owners[i]
+        return None
+
+    def add(self, signature: tuple[int, ...], owner: str):
+        index = len(self.signatures)
+        self.signatures.append(signature)
+        self.owners.append(owner)
+        for key in self._bands(signature):
+            self.buckets.setdefault(key, []).append(index)
+
+
 # =============================================================================
 # Markdown Generator
 # =============================================================================
@@ -634,10 +1268,16 @@ class AxamlParser:
 class MarkdownGenerator:
     """Generates markdown documentation files."""
 
-    def __init__(self, extras_dir: Path | None = None, auto_parse: bool = False):
+    def __init__(self, extras_dir: Path | None = None, auto_parse: bool = False,
+                 similarity_threshold: float = EXAMPLE_SIMILARITY_THRESHOLD):
         """Initialize with optional supplementary docs directory."""
         self.extras_dir = extras_dir
         self.auto_parse = auto_parse
+        self.similarity_threshold = similarity_threshold
+        # Examples shown on every page so far, to report overlap between controls
+        self.shown_examples = ExampleSimilarityIndex(similarity_threshold)
+        self.skipped_duplicates = 0
+        self.shared_examples: list[tuple[str, str, str]] = []  # (control, label, other control)
 
     def _load_extra(self, control_name: str) -> str:
         """Load supplementary documentation for a control if it exists."""
@@ -776,21 +1416,25 @@ class MarkdownGenerator:
             if control.properties:
                 lines.append("## Properties")
                 lines.append("")
-                lines.append("| Property | Type | Default | Description |")
-                lines.append("|----------|------|---------|-------------|")
-                for prop in control.properties:
-                    desc = prop.description if prop.description else "-"
-                    # Truncate long descriptions
-                    if len(desc) > MAX_DESCRIPTION_LENGTH:
-                        desc = desc[:MAX_DESCRIPTION_LENGTH - 3] + "..."
-                    lines.append(f"| {prop.name} | `{prop.prop_type}` | {prop.default} | {desc} |")
+                lines.extend(self._property_table(control.properties, control.invalidation))
                 lines.append("")
 
-            # Enums
-            if control.enums:
+            # Properties declared on Flowery base classes
+            if control.inherited_properties:
+                lines.append("## Base Class Properties")
+                lines.append("")
+                for base, properties in control.inherited_properties.items():
+                    lines.append(f"### From {base}")
+                    lines.append("")
+                    lines.extend(self._property_table(properties, control.invalidation))
+                    lines.append("")
+
+            # Enums (declared in this file, then shared ones used by its properties)
+            enums = control.enums + control.referenced_enums
+            if enums:
                 lines.append("## Enum Values")
                 lines.append("")
-                for enum in control.enums:
+                for enum in enums:
                     lines.append(f"### {enum.name}")
                     lines.append("")
                     lines.append(f"`{', '.join(enum.values)}`")
@@ -800,40 +1444,85 @@ class MarkdownGenerator:
             if examples:
                 lines.append("## Usage Examples")
                 lines.append("")
-                seen_xaml = set()
-                example_count = 0
-                for example in examples:
-                    for label, xaml in example.sub_examples:
-                        # Normalize XAML for comparison (remove variable text content)
-                        normalized = self._normalize_xaml_for_comparison(xaml)
-                        if normalized in seen_xaml:
-                            continue
-                        seen_xaml.add(normalized)
-
-                        # Skip labels that look like data-bound values
-                        if self._is_data_label(label):
-                            label = "Example"
-
-                        lines.append(f"### {label}")
-                        lines.append("")
-                        lines.append("```xml")
-                        lines.append(xaml)
-                        lines.append("```")
-                        lines.append("")
-
-                        example_count += 1
-                        if example_count >= MAX_EXAMPLES_PER_CONTROL:
-                            break
-                    if example_count >= MAX_EXAMPLES_PER_CONTROL:
-                        break
+                for label, xaml in self._select_examples(control.name, examples):
+                    # Skip labels that look like data-bound values
+                    if self._is_data_label(label):
+                        label = "Example"
+
+                    lines.append(f"### {label}")
+                    lines.append("")
+                    lines.append("```xml")
+                    lines.append(xaml)
+                    lines.append("```")
+                    lines.append("")
 
         return '\n'.join(lines)
 
-    def _normalize_xaml_for_comparison(self, xaml: str) -> str:
-        """Normalize XAML to detect structural duplicates."""
-        # Extract just tag names in sequence (most aggressive dedup)
-        tags = re.findall(r'</?(?:controls:)?(\w+)', xaml)
-        return ' '.join(tags)
+    def _property_table(self, properties: list[PropertyInfo],
+                        invalidation: Optional[dict[str, list[str]]] = None) -> list[str]:
+        """
+        Markdown table rows for a list of properties. Controls with
+        invalidation metadata get an Invalidates column; animatable
+        properties that invalidate layout are marked with a footnote.
+        """
+        if invalidation:
+            lines = [
+                "| Property | Type | Default | Description | Invalidates |",
+                "|----------|------|---------|-------------|-------------|",
+            ]
+        else:
+            lines = [
+                "| Property | Type | Default | Description |",
+                "|----------|------|---------|-------------|",
+            ]
+        hot = False
+        for prop in properties:
+            desc = prop.description if prop.description else "-"
+            # Truncate long descriptions
+            if len(desc) > MAX_DESCRIPTION_LENGTH:
+                desc = desc[:MAX_DESCRIPTION_LENGTH - 3] + "..."
+            row = f"| {prop.name} | `{prop.prop_type}` | {prop.default} | {desc} |"
+            if invalidation:
+                effects = invalidation.get(prop.name, [])
+                cell = ", ".join(effects) if effects else "-"
+                if is_layout_hot_path(prop, effects):
+                    cell += " †"
+                    hot = True
+                row += f" {cell} |"
+            lines.append(row)
+        if hot:
+            lines.append("")
+            lines.append("† Animatable and invalidates layout: animating it re-runs measure/arrange on every frame.")
+        return lines
+
+    def _select_examples(self, control_name: str, examples: list[ExampleSnippet]) -> list[tuple[str, str]]:
+        """
+        The first MAX_EXAMPLES_PER_CONTROL sub-examples, in Gallery order, that
+        are not near-duplicates of one already picked. Picked examples that
+        resemble another control's are kept but recorded in shared_examples.
+        """
+        candidates = [sub_example for example in examples for sub_example in example.sub_examples]
+        signatures = []
+        for example in examples:
+            # Signatures come from the parse (and its cache); snippets built elsewhere are hashed here
+            signatures += example.signatures or \
+                ExampleSimilarityIndex.signatures_of([xaml for _, xaml in example.sub_examples])
+        picked_index = ExampleSimilarityIndex(self.similarity_threshold)
+        picked = []
+        for (label, xaml), signature in zip(candidates, signatures):
+            if len(picked) >= MAX_EXAMPLES_PER_CONTROL:
+                break
+            if picked_index.find(signature) is not None:
+                self.skipped_duplicates += 1
+                continue
+            picked_index.add(signature, control_name)
+            picked.append((label, xaml))
+            other = self.shown_examples.find(signature)
+            if other is not None and other != control_name:
+                self.shared_examples.append((control_name, label, other))
+        for signature in picked_index.signatures:
+            self.shown_examples.add(signature, control_name)
+        return picked
 
     def _is_data_label(self, label: str) -> bool:
         """Check if a label looks like data-bound content rather than a description."""
@@ -848,7 +1537,7 @@ class MarkdownGenerator:
             return True
         return False
 
-    def generate_category_doc(self, category: str, controls: list[ControlInfo]) -> str:
+    def generate_category_doc(self, category: str, controls: list[ControlSummary]) -> str:
         """Generate markdown documentation for a category."""
         lines = []
 
@@ -868,7 +1557,7 @@ class MarkdownGenerator:
 
         return '\n'.join(lines)
 
-    def generate_master_index(self, controls: list[ControlInfo], categories: dict[str, list[str]]) -> str:
+    def generate_master_index(self, controls: list[ControlSummary], categories: dict[str, list[str]]) -> str:
         """Generate the master llms.txt index file."""
         lines = []
 
@@ -904,8 +1593,8 @@ class MarkdownGenerator:
                 desc = f"{control.name.replace('Daisy', '')} control"
             if len(desc) > MAX_LLMS_DESC_LENGTH:
                 desc = desc[:MAX_LLMS_DESC_LENGTH - 3] + "..."
-            props = ", ".join(p.name for p in control.properties[:MAX_PROPS_IN_OVERVIEW])
-            if len(control.properties) > MAX_PROPS_IN_OVERVIEW:
+            props = ", ".join(control.key_properties)
+            if control.property_count > MAX_PROPS_IN_OVERVIEW:
                 props += ", ..."
             lines.append(f"| [{control.name}](controls/{control.name}.html) | {desc} | {props} |")
 
@@ -966,6 +1655,202 @@ class MarkdownGenerator:
         return '\n'.join(lines)
 
 
+# =============================================================================
+# Parallel Parsing
+# =============================================================================
+
+# Module-level so a process pool can pickle them by reference; the parsers
+# hold no state, and results (dataclasses of str/list) pickle as-is.
+
+def scan_source_file(filepath: Path) -> SourceSymbols:
+    """Scan one C# file (process pool worker)."""
+    return CSharpParser().scan_file(filepath)
+
+
+def index_axaml_file(filepath: Path) -> AxamlFileIndex:
+    """Parse one AXAML file for snippets and control usages (process pool worker)."""
+    return AxamlParser().index_file(filepath)
+
+
+# =============================================================================
+# Parse Cache
+# =============================================================================
+
+def encode_parse_result(result):
+    """asdict() form of a worker result: a dataclass, a list of them, or None."""
+    if isinstance(result, list):
+        return [asdict(item) for item in result]
+    return asdict(result) if result is not None else None
+
+
+def symbols_from_dict(data: dict) -> SourceSymbols:
+    """Rebuild SourceSymbols from their asdict() form."""
+    def properties(items: list[dict]) -> list[PropertyInfo]:
+        return [PropertyInfo(**item) for item in items]
+
+    return SourceSymbols(
+        classes=[
+            ClassDecl(**{**item, 'properties': properties(item['properties'])})
+            for item in data['classes']
+        ],
+        enums=[EnumInfo(**item) for item in data['enums']],
+        properties=properties(data['properties'])
+    )
+
+
+def axaml_index_from_dict(data: dict) -> AxamlFileIndex:
+    """Rebuild an AxamlFileIndex from its asdict() form."""
+    return AxamlFileIndex(
+        snippets=[
+            ExampleSnippet(
+                section_id=item['section_id'],
+                title=item['title'],
+                sub_examples=[tuple(sub) for sub in item['sub_examples']],
+                signatures=[tuple(signature) for signature in item['signatures']]
+            )
+            for item in data['snippets']
+        ],
+        usages=[ControlUsage(**item) for item in data['usages']]
+    )
+
+
+class ParseCache:
+    """
+    Parse results per source file, keyed on the file's content hash and the
+    parser version. Entries are stored as JSON so a stale or corrupt cache
+    is simply rebuilt; entries of the wrong shape are dropped on load.
+    """
+
+    ENTRY_KEYS = {'sha256', 'version', 'result'}
+
+    def __init__(self, cache_path: Path, enabled: bool = True):
+        self.cache_path = cache_path
+        self.enabled = enabled
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        if enabled and cache_path.exists():
+            try:
+                data = json.loads(cache_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            self.entries = {key: entry for key, entry in data.items()
+                            if isinstance(entry, dict) and self.ENTRY_KEYS <= entry.keys()}
+
+    @staticmethod
+    def digest(filepath: Path) -> str:
+        return hashlib.sha256(filepath.read_bytes()).hexdigest()
+
+    def get(self, key: str, digest: str, version: int):
+        """Return the cached (encoded) result, or None on a miss."""
+        entry = self.entries.get(key) if self.enabled else None
+        if entry and entry['sha256'] == digest and entry['version'] == version:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: str, digest: str, version: int, result):
+        if self.enabled:
+            self.entries[key] = {'sha256': digest, 'version': version, 'result': result}
+
+    def save(self, root_dir: Path):
+        """Write the cache, dropping entries for files that no longer exist."""
+        if not self.enabled:
+            return
+        self.entries = {key: entry for key, entry in self.entries.items() if (root_dir / key).exists()}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.entries), encoding='utf-8')
+
+    def clear(self):
+        self.entries = {}
+        if self.cache_path.exists():
+            self.cache_path.unlink()
+
+
+# =============================================================================
+# API Metadata
+# =============================================================================
+
+class ApiMetadataWriter:
+    """
+    Writes controls.json one control entry at a time, so the entries are not
+    collected into one list before serializing. msgpack needs the entry count
+    before the entries, so packed entries are spooled to a temporary file and
+    copied after the header. Entries must arrive sorted by name; enums and
+    categories are small and written at the end. The bytes match json.dumps()
+    (or msgpack.packb()) of the whole document.
+    """
+
+    def __init__(self, output_dir: Optional[Path], auto_parse: bool,
+                 write_msgpack: bool = False, keep: bool = False):
+        self.output_dir = output_dir  # None: nothing is written
+        self.auto_parse = auto_parse
+        self.enums: dict[str, dict] = {}
+        self.kept: Optional[list[dict]] = [] if keep else None
+        self.json_file = None
+        self.packer = msgpack.Packer(use_bin_type=True) if write_msgpack and output_dir else None
+        self.packed = tempfile.TemporaryFile() if self.packer else None  # Entries until the count is known
+        self.count = 0
+        if output_dir:
+            self.json_file = (output_dir / API_METADATA_FILE).open('w', encoding='utf-8')
+            self.json_file.write(
+                f'{{"schema_version":{API_SCHEMA_VERSION},"auto_parse":{self._dumps(auto_parse)},"controls":['
+            )
+
+    @staticmethod
+    def _dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+    def add(self, entry: dict, enums: dict[str, dict]):
+        """Append one control entry; enums are merged by name (first definition wins)."""
+        for name, enum in enums.items():
+            self.enums.setdefault(name, enum)
+        if self.json_file:
+            self.json_file.write((',' if self.count else '') + self._dumps(entry))
+        if self.packer:
+            self.packed.write(self.packer.pack(entry))
+        if self.kept is not None:
+            self.kept.append(entry)
+        self.count += 1
+
+    def close(self, categories: dict[str, list[str]]) -> list[str]:
+        """Finish the files; returns the names written."""
+        enums = dict(sorted(self.enums.items()))
+        written = []
+        if self.json_file:
+            self.json_file.write(f'],"enums":{self._dumps(enums)},"categories":{self._dumps(categories)}}}')
+            self.json_file.close()
+            written.append(API_METADATA_FILE)
+        if self.packer:
+            pack = self.packer.pack
+            with (self.output_dir / API_METADATA_MSGPACK_FILE).open('wb') as out:
+                out.write(b''.join([self.packer.pack_map_header(5),
+                                    pack('schema_version'), pack(API_SCHEMA_VERSION),
+                                    pack('auto_parse'), pack(self.auto_parse),
+                                    pack('controls'), self.packer.pack_array_header(self.count)]))
+                self.packed.seek(0)
+                shutil.copyfileobj(self.packed, out)
+                out.write(pack('enums') + pack(enums) + pack('categories') + pack(categories))
+            self.packed.close()
+            written.append(API_METADATA_MSGPACK_FILE)
+        return written
+
+    def document(self, categories: dict[str, list[str]]) -> Optional[dict]:
+        """The whole document as a dict, when entries were kept."""
+        if self.kept is None:
+            return None
+        return {
+            'schema_version': API_SCHEMA_VERSION,
+            'auto_parse': self.auto_parse,
+            'controls': self.kept,
+            'enums': dict(sorted(self.enums.items())),
+            'categories': categories,
+        }
+
+
 # =============================================================================
 # Main Generator
 # =============================================================================
@@ -973,17 +1858,34 @@ class MarkdownGenerator:
 class DocumentationGenerator:
     """Main documentation generator that orchestrates parsing and output."""
 
-    def __init__(self, root_dir: Path, auto_parse: bool = False):
+    def __init__(self, root_dir: Path, auto_parse: bool = False, jobs: int = DEFAULT_PARSE_JOBS,
+                 use_cache: bool = True, clear_cache: bool = False, write_msgpack: bool = False,
+                 write_files: bool = True, xmldoc_path: Optional[Path] = None, keep_docs: bool = False,
+                 similarity_threshold: float = EXAMPLE_SIMILARITY_THRESHOLD):
         self.root_dir = root_dir
         self.controls_dir = root_dir / "Flowery.NET" / "Controls"
-        self.examples_dir = root_dir / "Flowery.NET.Gallery" / "Examples"
+        self.gallery_dir = root_dir / "Flowery.NET.Gallery"
+        self.examples_dir = self.gallery_dir / "Examples"
         self.output_dir = root_dir / "llms"
         self.supplementary_dir = root_dir / "llms-static"
         self.auto_parse = auto_parse
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.write_msgpack = write_msgpack
+        self.write_files = write_files  # False: nothing is written to llms/
+        self.keep_docs = keep_docs      # Return every control doc and the metadata (generate_site.py --from-source)
+        self.parse_cache = ParseCache(self.output_dir / PARSE_CACHE_FILE, enabled=use_cache)
+        if clear_cache:
+            self.parse_cache.clear()
+        self.example_index = ExampleIndex()
+        self.symbol_index = SymbolIndex()
+        self.xmldoc_path = xmldoc_path  # Compiler XML doc file; its summaries win over the C# scan
+        self.xml_docs: Optional[XmlDocIndex] = None
+        self.control_sources: list[tuple[Path, SourceSymbols]] = []  # Daisy*.cs files, by control name
+        self.invalidation_report: dict[str, dict] = {}  # control -> property -> effects (see INVALIDATION_REPORT_FILE)
 
         self.csharp_parser = CSharpParser()
-        self.axaml_parser = AxamlParser()
-        self.md_generator = MarkdownGenerator(extras_dir=self.supplementary_dir, auto_parse=auto_parse)
+        self.md_generator = MarkdownGenerator(extras_dir=self.supplementary_dir, auto_parse=auto_parse,
+                                              similarity_threshold=similarity_threshold)
 
         self.category_mapping = {
             "ActionsExamples": "Actions",
@@ -1000,8 +1902,8 @@ class DocumentationGenerator:
             "ColorPickerExamples": "Color Picker"
         }
 
-    def generate(self):
-        """Generate all documentation."""
+    def generate(self) -> GeneratedDocs:
+        """Generate all documentation (written to llms/ unless write_files is False)."""
         print("Flowery.NET Documentation Generator")
         print("=" * 40)
         if self.auto_parse:
@@ -1010,86 +1912,515 @@ class DocumentationGenerator:
             print("Mode: CURATED ONLY (llms-static/)")
 
         # Create output directories
-        self.output_dir.mkdir(exist_ok=True)
-        (self.output_dir / "controls").mkdir(exist_ok=True)
-        (self.output_dir / "categories").mkdir(exist_ok=True)
-
-        # Parse all controls (needed for control list even in curated-only mode)
-        print("\n[1/4] Parsing C# control files...")
-        controls = self._parse_all_controls()
-        print(f"      Found {len(controls)} controls")
-
-        # Parse examples only if auto_parse is enabled
-        examples_by_control: dict[str, list[ExampleSnippet]] = {}
+        if self.write_files:
+            self.output_dir.mkdir(exist_ok=True)
+            (self.output_dir / "controls").mkdir(exist_ok=True)
+            (self.output_dir / "categories").mkdir(exist_ok=True)
+
+        # Scan all C# files (needed for control list even in curated-only mode).
+        # The scans stay in memory; ControlInfo objects are built from them one
+        # at a time in step 3
+        print("\n[1/5] Parsing C# control files...")
+        self._scan_controls()
+        print(f"      Found {len(self.control_sources)} controls")
+
+        # Parse each example file once; snippets are only used with auto_parse,
+        # category membership is needed in both modes
+        print("\n[2/5] Parsing Gallery AXAML files...")
+        self.example_index = self._build_example_index()
+        if self.write_files:
+            self.parse_cache.save(self.root_dir)
+        examples_by_control = self.example_index.examples_by_control
         if self.auto_parse:
-            print("\n[2/4] Parsing AXAML example files...")
-            examples_by_control = self._parse_all_examples()
             print(f"      Found examples for {len(examples_by_control)} controls")
+        print(f"      Indexed {len(self.example_index.section_to_control)} sections "
+              f"in {len(self.example_index.categories)} categories")
+        usage_count = sum(entry['count'] for entry in self.example_index.usage.values())
+        print(f"      Indexed {usage_count} usages of {len(self.example_index.usage)} controls")
+
+        # Generate per-control docs: build, render and write one control at a
+        # time, keeping only its summary (and its docs with keep_docs). The
+        # inputs (scans, parse cache, example snippets) are all resident already
+        print("\n[3/5] Generating control documentation...")
+        categories = self.example_index.categories
+        category_of: dict[str, list[str]] = {}
+        for cat_name, cat_controls in categories.items():
+            for name in cat_controls:
+                category_of.setdefault(name, []).append(cat_name)
+        metadata_writer = ApiMetadataWriter(self.output_dir if self.write_files else None, self.auto_parse,
+                                            write_msgpack=self.write_msgpack, keep=self.keep_docs)
+        control_docs: dict[str, str] = {}
+        summaries = self._render_controls(category_of, metadata_writer, control_docs)
+        if self.auto_parse:
+            print(f"      Included auto-parsed Properties/Enums/Examples")
+            print(f"      Skipped {self.md_generator.skipped_duplicates} near-duplicate examples "
+                  f"(similarity >= {self.md_generator.similarity_threshold:g})")
+            shared = self.md_generator.shared_examples
+            if shared:
+                print(f"      {len(shared)} examples resemble one on another control's page, e.g. "
+                      f"{shared[0][0]} '{shared[0][1]}' ~ {shared[0][2]}")
+
+        # Generate category docs
+        print("\n[4/5] Generating category and index documentation...")
+        category_docs: dict[str, str] = {}
+        for cat_name, cat_controls in categories.items():
+            cat_summaries = [c for c in summaries if c.name in cat_controls]
+            doc = self.md_generator.generate_category_doc(cat_name, cat_summaries)
+            safe_name = cat_name.lower().replace(' ', '-').replace('&', 'and')
+            category_docs[safe_name] = doc
+            if self.write_files:
+                output_path = self.output_dir / "categories" / f"{safe_name}.md"
+                output_path.write_text(doc, encoding='utf-8')
+
+        # Generate master index
+        master_doc = self.md_generator.generate_master_index(summaries, categories)
+        if self.write_files:
+            (self.output_dir / "llms.txt").write_text(master_doc, encoding='utf-8')
+
+        # Machine-readable API surface for tooling (control entries already streamed)
+        written = metadata_writer.close(categories)
+        if self.write_files:
+            print("\n[5/5] Writing API metadata...")
+            for name in written:
+                print(f"      Wrote {name}")
+            usage_doc = {'schema_version': USAGE_SCHEMA_VERSION, 'controls': self.example_index.usage}
+            (self.output_dir / USAGE_INDEX_FILE).write_text(
+                json.dumps(usage_doc, ensure_ascii=False, separators=(',', ':')), encoding='utf-8'
+            )
+            print(f"      Wrote {USAGE_INDEX_FILE}")
+            print(f"      Wrote {INVALIDATION_REPORT_FILE} ({self._write_invalidation_report(self.invalidation_report)})")
         else:
-            print("\n[2/4] Skipping AXAML parsing (curated-only mode)")
+            print("\n[5/5] Keeping docs in memory (llms/ files not written)")
+
+        if self.write_files:
+            self._write_docs_index(summaries, categories, self.example_index.example_files,
+                                   self.symbol_index.declared_in)
+
+        print("\n" + "=" * 40)
+        print("Documentation generated successfully!")
+        if self.write_files:
+            print(f"Output directory: {self.output_dir}")
+
+        return GeneratedDocs(
+            controls=summaries,
+            control_docs=control_docs,
+            categories=categories,
+            category_docs=category_docs,
+            llms_txt=master_doc,
+            metadata=metadata_writer.document(categories)
+        )
+
+    def generate_only(self, patterns: list[str]) -> bool:
+        """
+        Authoring mode (--only): regenerate just the controls matching the
+        name globs. Their C# files are scanned with their dependency closure
+        and their example files re-parsed; the category pages, llms.txt,
+        controls.json and property-invalidation.json entries are then patched
+        from the summaries saved by the last full build in
+        llms/.docs-index.json. Returns False when nothing matches or there is
+        no usable docs index.
+        """
+        print("Flowery.NET Documentation Generator")
+        print("=" * 40)
+        print(f"Mode: ONLY {' '.join(patterns)} ({'curated + auto-parsed' if self.auto_parse else 'curated only'})")
+
+        index_path = self.output_dir / DOCS_INDEX_FILE
+        try:
+            docs_index = json.loads(index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            docs_index = {}
+        if docs_index.get('schema_version') != DOCS_INDEX_SCHEMA_VERSION or \
+                docs_index.get('auto_parse') != self.auto_parse:
+            flag = "with" if self.auto_parse else "without"
+            print(f"\nError: no usable {index_path.name} in {self.output_dir}; "
+                  f"run a full build {flag} --auto-parse first")
+            return False
+
+        selected = sorted(
+            (filepath for filepath in self._source_files()
+             if self._is_control_file(filepath)
+             and any(fnmatch.fnmatchcase(filepath.stem, pattern) for pattern in patterns)),
+            key=lambda filepath: (filepath.stem, filepath)
+        )
+        if not selected:
+            print(f"\nError: no control files match --only {' '.join(patterns)}")
+            return False
+        names = [filepath.stem for filepath in selected]
+
+        print(f"\n[1/4] Parsing C# files for {len(selected)} control(s)...")
+        scanned = self._dependency_closure(selected, docs_index['declared_in'])
+        self._index_symbols(scanned)
+        self.control_sources = [(filepath, scanned[filepath]) for filepath in selected]
+        print(f"      {len(scanned)} files in the dependency closure")
+
+        print("\n[2/4] Parsing Gallery AXAML files...")
+        example_files = docs_index['example_files']
+        if self.auto_parse:
+            example_paths = sorted({self.root_dir / rel_path for name in names
+                                    for rel_path in example_files.get(name, [])
+                                    if (self.root_dir / rel_path).exists()})
+            self.example_index = self._build_example_index(example_paths)
+            for name in names:
+                example_files[name] = self.example_index.example_files.get(name, [])
+            print(f"      Found examples for {len(self.example_index.examples_by_control)} controls "
+                  f"in {len(example_paths)} files")
+        self.parse_cache.save(self.root_dir)
 
-        # Generate per-control docs
         print("\n[3/4] Generating control documentation...")
+        categories = docs_index['categories']
+        category_of: dict[str, list[str]] = {}
+        for cat_name, cat_controls in categories.items():
+            for name in cat_controls:
+                category_of.setdefault(name, []).append(cat_name)
+        metadata_writer = ApiMetadataWriter(None, self.auto_parse, keep=True)
+        fresh = self._render_controls(category_of, metadata_writer, {})
+
+        print("\n[4/4] Patching categories, index and metadata...")
+        summaries = {entry['name']: ControlSummary(**entry) for entry in docs_index['controls']}
+        summaries.update((summary.name, summary) for summary in fresh)
+        summaries = dict(sorted(summaries.items()))
+        for cat_name, cat_controls in categories.items():
+            if not set(cat_controls) & set(names):
+                continue
+            cat_summaries = [summary for name, summary in summaries.items() if name in cat_controls]
+            safe_name = cat_name.lower().replace(' ', '-').replace('&', 'and')
+            doc = self.md_generator.generate_category_doc(cat_name, cat_summaries)
+            (self.output_dir / "categories" / f"{safe_name}.md").write_text(doc, encoding='utf-8')
+            print(f"      Patched categories/{safe_name}.md")
+        master_doc = self.md_generator.generate_master_index(list(summaries.values()), categories)
+        (self.output_dir / "llms.txt").write_text(master_doc, encoding='utf-8')
+        print("      Patched llms.txt")
+
+        metadata_path = self.output_dir / API_METADATA_FILE
+        if metadata_path.exists():
+            metadata = json.loads(metadata_path.read_text(encoding='utf-8'))
+            entries = {entry['name']: entry for entry in metadata['controls']}
+            entries.update((entry['name'], entry) for entry in metadata_writer.kept)
+            metadata['controls'] = [entries[name] for name in sorted(entries)]
+            self._write_api_metadata(metadata)
+            print(f"      Patched {API_METADATA_FILE}" + (" and msgpack" if self.write_msgpack else ""))
+
+        report_path = self.output_dir / INVALIDATION_REPORT_FILE
+        try:
+            report = json.loads(report_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            report = None
+        if isinstance(report, dict) and report.get('schema_version') == INVALIDATION_SCHEMA_VERSION:
+            # Selected controls that no longer register anything drop out of the report
+            controls = {name: entry for name, entry in report['controls'].items() if name not in names}
+            controls.update(self.invalidation_report)
+            print(f"      Patched {INVALIDATION_REPORT_FILE} ({self._write_invalidation_report(controls)})")
+
+        declared_in = {**docs_index['declared_in'], **self.symbol_index.declared_in}
+        self._write_docs_index(list(summaries.values()), categories, example_files, declared_in)
+
+        print("\n" + "=" * 40)
+        print("Selected controls generated (other outputs untouched).")
+        return True
+
+    def _write_api_metadata(self, metadata: dict):
+        """Write a whole controls.json (and controls.msgpack if requested) at once."""
+        (self.output_dir / API_METADATA_FILE).write_text(
+            json.dumps(metadata, ensure_ascii=False, separators=(',', ':')), encoding='utf-8'
+        )
+        if self.write_msgpack:
+            (self.output_dir / API_METADATA_MSGPACK_FILE).write_bytes(msgpack.packb(metadata, use_bin_type=True))
+
+    def _render_controls(self, category_of: dict[str, list[str]], metadata_writer: ApiMetadataWriter,
+                         control_docs: dict[str, str]) -> list[ControlSummary]:
+        """
+        Build, render and write the controls of control_sources one at a
+        time; returns their summaries. Docs are added to control_docs only
+        with keep_docs.
+        """
         extras_count = 0
-        for control in controls:
-            examples = examples_by_control.get(control.name, [])
+        summaries: list[ControlSummary] = []
+        for control in self._iter_controls():
+            examples = self.example_index.examples_by_control.get(control.name, [])
             doc = self.md_generator.generate_control_doc(control, examples)
-            output_path = self.output_dir / "controls" / f"{control.name}.md"
-            output_path.write_text(doc, encoding='utf-8')
+            if self.keep_docs:
+                control_docs[control.name] = doc
+            if self.write_files:
+                output_path = self.output_dir / "controls" / f"{control.name}.md"
+                output_path.write_text(doc, encoding='utf-8')
+            metadata_writer.add(*self._control_metadata(control, category_of.get(control.name, []), examples))
+            if control.invalidation:
+                self.invalidation_report[control.name] = self._invalidation_entry(control)
+            summaries.append(ControlSummary.of(control))
             # Check if supplementary docs were merged
             if self.supplementary_dir.exists():
                 extra_file = self.supplementary_dir / f"{control.name}.md"
                 if extra_file.exists():
                     extras_count += 1
-        print(f"      Generated {len(controls)} control docs")
+        print(f"      Generated {len(summaries)} control docs")
         print(f"      Used {extras_count} curated docs from llms-static/")
-        if self.auto_parse:
-            print(f"      Included auto-parsed Properties/Enums/Examples")
+        return summaries
+
+    @staticmethod
+    def _invalidation_entry(control: ControlInfo) -> dict[str, dict]:
+        """Property -> type, effects and hot-path flag, for every property with registrations."""
+        declared = {prop.name: prop for prop in control.properties}
+        for props in control.inherited_properties.values():
+            for prop in props:
+                declared.setdefault(prop.name, prop)
+        entry = {}
+        for prop_name, effects in control.invalidation.items():
+            prop = declared.get(prop_name)
+            entry[prop_name] = {
+                'type': prop.prop_type if prop else None,  # None: not a StyledProperty of the class chain (e.g. DaisyAccessibility.AccessibleText)
+                'effects': effects,
+                'hot': bool(prop) and is_layout_hot_path(prop, effects),
+            }
+        return entry
+
+    def _write_invalidation_report(self, controls: dict[str, dict]) -> str:
+        """Write the invalidation report for controls; returns a one-line summary."""
+        hot_paths = [
+            {'control': control, 'property': prop_name, 'type': info['type'], 'effects': info['effects']}
+            for control, props in sorted(controls.items())
+            for prop_name, info in props.items()
+            if info['hot']
+        ]
+        report = {
+            'schema_version': INVALIDATION_SCHEMA_VERSION,
+            'hot_paths': hot_paths,
+            'controls': dict(sorted(controls.items())),
+        }
+        (self.output_dir / INVALIDATION_REPORT_FILE).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8'
+        )
+        count = sum(len(props) for props in controls.values())
+        return (f"{count} properties in {len(controls)} controls, "
+                f"{len(hot_paths)} animatable properties invalidating layout")
+
+    def _write_docs_index(self, summaries: list[ControlSummary], categories: dict[str, list[str]],
+                          example_files: dict[str, list[str]], declared_in: dict[str, str]):
+        """Save the control summaries, category membership and type locations for --only."""
+        docs_index = {
+            'schema_version': DOCS_INDEX_SCHEMA_VERSION,
+            'auto_parse': self.auto_parse,
+            'controls': [asdict(summary) for summary in summaries],
+            'categories': categories,
+            'example_files': example_files,
+            'declared_in': declared_in,
+        }
+        (self.output_dir / DOCS_INDEX_FILE).write_text(
+            json.dumps(docs_index, ensure_ascii=False, separators=(',', ':')), encoding='utf-8'
+        )
 
-        # Generate category docs
-        print("\n[4/4] Generating category and index documentation...")
-        categories = self._categorize_controls(controls, examples_by_control)
-        for cat_name, cat_controls in categories.items():
-            cat_control_infos = [c for c in controls if c.name in cat_controls]
-            doc = self.md_generator.generate_category_doc(cat_name, cat_control_infos)
-            safe_name = cat_name.lower().replace(' ', '-').replace('&', 'and')
-            output_path = self.output_dir / "categories" / f"{safe_name}.md"
-            output_path.write_text(doc, encoding='utf-8')
+    def _control_metadata(self, control: ControlInfo, categories: list[str],
+                          examples: list[ExampleSnippet]) -> tuple[dict, dict[str, dict]]:
+        """
+        One control's entry for controls.json (base chain, properties,
+        enums, categories, examples), plus its enums with their used-by
+        edges.
+        """
+        symbols = self.symbol_index
+
+        def properties(props: list[PropertyInfo]) -> list[dict]:
+            return [
+                {'name': p.name, 'type': p.prop_type, 'default': p.default, 'description': p.description}
+                for p in props
+            ]
+
+        enums = {}
+        for enum in control.enums + control.referenced_enums:
+            enums.setdefault(enum.name, {
+                'values': enum.values,
+                'description': enum.description,
+                'source': symbols.declared_in.get(enum.name, ""),
+                'used_by': symbols.used_by.get(enum.name, []),
+            })
 
-        # Generate master index
-        master_doc = self.md_generator.generate_master_index(controls, categories)
-        (self.output_dir / "llms.txt").write_text(master_doc, encoding='utf-8')
+        entry = {
+            'name': control.name,
+            'base_class': control.base_class,
+            'base_chain': symbols.base_chain(control.name),
+            'description': control.description,
+            'source': symbols.declared_in.get(control.name, ""),
+            'categories': categories,
+            'properties': properties(control.properties),
+            'inherited_properties': {
+                base: properties(props) for base, props in control.inherited_properties.items()
+            },
+            'enums': [enum.name for enum in control.enums + control.referenced_enums],
+            'examples': [
+                {'section_id': snippet.section_id, 'title': snippet.title, 'label': label, 'xaml': xaml}
+                for snippet in examples
+                for label, xaml in snippet.sub_examples
+            ],
+        }
+        return entry, enums
 
-        print("\n" + "=" * 40)
-        print("Documentation generated successfully!")
-        print(f"Output directory: {self.output_dir}")
+    def _parse_files(self, worker, filepaths: list[Path], version: int, decode) -> list:
+        """
+        Run worker over filepaths, in a process pool when --jobs > 1.
+        Files unchanged since the last run are decoded from the parse cache
+        instead. Results come back in input order, so output does not depend
+        on which worker finished first.
+        """
+        results = [None] * len(filepaths)
+        pending = []  # (index, cache key, digest)
+        for i, filepath in enumerate(filepaths):
+            key = filepath.relative_to(self.root_dir).as_posix()
+            digest = ParseCache.digest(filepath)
+            entry = self.parse_cache.get(key, digest, version)
+            if entry:
+                results[i] = decode(entry['result'])
+            else:
+                pending.append((i, key, digest))
 
-    def _parse_all_controls(self) -> list[ControlInfo]:
-        """Parse all C# control files, including those in subfolders."""
-        controls = []
+        todo = [filepaths[i] for i, _, _ in pending]
+        if self.jobs <= 1 or len(todo) <= 1:
+            parsed = [worker(filepath) for filepath in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(todo))) as pool:
+                parsed = list(pool.map(worker, todo, chunksize=PARSE_CHUNK_SIZE))
+
+        for (i, key, digest), result in zip(pending, parsed):
+            results[i] = result
+            self.parse_cache.put(key, digest, version, encode_parse_result(result))
+
+        if self.parse_cache.enabled:
+            print(f"      Parsed {len(todo)} files, {len(filepaths) - len(todo)} unchanged (cached)")
+        return results
+
+    def _scan_controls(self):
+        """
+        Scan every C# file under Controls into the symbol index and remember
+        the Daisy*.cs control files that declare a control class, sorted by
+        control name, for _iter_controls().
+        """
         # Search recursively in Controls folder and all subfolders
-        for filepath in self.controls_dir.glob("**/Daisy*.cs"):
-            if "Converter" in filepath.name:
-                continue
-            control = self.csharp_parser.parse_file(filepath)
+        filepaths = self._source_files()
+        results = self._parse_files(scan_source_file, filepaths, CSharpParser.VERSION, symbols_from_dict)
+        self._index_symbols(dict(zip(filepaths, results)))
+        self.control_sources = sorted(
+            ((filepath, symbols) for filepath, symbols in zip(filepaths, results)
+             if self._is_control_file(filepath)
+             and self.csharp_parser.select_class(symbols.classes, filepath.stem)),
+            key=lambda source: (source[0].stem, source[0])
+        )
+
+    def _source_files(self) -> list[Path]:
+        """Every .cs file under Controls, in the order the symbol index merges them."""
+        return sorted(self.controls_dir.glob("**/*.cs"), key=lambda filepath: (filepath.name, filepath))
+
+    @staticmethod
+    def _is_control_file(filepath: Path) -> bool:
+        return filepath.name.startswith("Daisy") and "Converter" not in filepath.name
+
+    def _index_symbols(self, scanned: dict[Path, SourceSymbols]):
+        """Build the symbol index from scanned files (and load the XML docs, if given)."""
+        self.symbol_index = SymbolIndex()
+        for filepath in sorted(scanned, key=lambda filepath: (filepath.name, filepath)):
+            self.symbol_index.add_file(filepath.relative_to(self.root_dir).as_posix(), scanned[filepath])
+        self.symbol_index.build_references()
+
+        self.xml_docs = XmlDocIndex.load(self.xmldoc_path) if self.xmldoc_path else None
+        if self.xml_docs:
+            print(f"      Loaded {len(self.xml_docs.types)} type and {len(self.xml_docs.members)} member "
+                  f"summaries from {self.xmldoc_path.name}")
+
+    def _dependency_closure(self, filepaths: list[Path], declared_in: dict[str, str]) -> dict[Path, SourceSymbols]:
+        """
+        Scan the given files plus, transitively, the files declaring their
+        base classes and StyledProperty types (located through declared_in).
+        """
+        scanned: dict[Path, SourceSymbols] = {}
+        pending = filepaths
+        while pending:
+            batch = sorted(set(pending) - scanned.keys())
+            pending = []
+            results = self._parse_files(scan_source_file, batch, CSharpParser.VERSION, symbols_from_dict)
+            for filepath, symbols in zip(batch, results):
+                scanned[filepath] = symbols
+                type_names = [decl.base_class.rsplit('.', 1)[-1] for decl in symbols.classes]
+                type_names += [name for prop in symbols.properties for name in re.findall(r'\w+', prop.prop_type)]
+                for type_name in type_names:
+                    source = declared_in.get(type_name)
+                    if source and (self.root_dir / source).exists():
+                        pending.append(self.root_dir / source)
+        return scanned
+
+    def _iter_controls(self) -> Iterator[ControlInfo]:
+        """Build each control with inherited properties and shared enums resolved, one at a time."""
+        for filepath, symbols in self.control_sources:
+            control = self.csharp_parser.control_from_symbols(symbols, filepath.stem)
             if control:
-                controls.append(control)
-        return controls
+                self.symbol_index.resolve(control)
+                if self.xml_docs:
+                    self.xml_docs.apply(control)
+                yield control
 
-    def _parse_all_examples(self) -> dict[str, list[ExampleSnippet]]:
-        """Parse all AXAML example files and map to controls."""
-        examples_by_control: dict[str, list[ExampleSnippet]] = {}
+    def _build_example_index(self, filepaths: Optional[list[Path]] = None) -> ExampleIndex:
+        """
+        Parse every Gallery AXAML file (or just the given ones) once and
+        derive everything downstream needs: snippets per control
+        (*Examples.axaml, auto-parse only), category membership (files in
+        category_mapping), the section -> control map and the reverse usage
+        index (control -> every location).
+        """
+        if filepaths is None:
+            filepaths = sorted(
+                filepath for filepath in self.gallery_dir.glob("**/*.axaml")
+                if not GALLERY_SKIP_DIRS.intersection(filepath.relative_to(self.gallery_dir).parts)
+            )
+        results = self._parse_files(index_axaml_file, filepaths, AxamlParser.VERSION, axaml_index_from_dict)
+
+        example_files = []  # (filepath, snippets) of the Examples/ files used for docs and categories
+        for filepath, result in zip(filepaths, results):
+            if filepath.parent != self.examples_dir:
+                continue
+            if filepath.stem in self.category_mapping or (self.auto_parse and filepath.name.endswith("Examples.axaml")):
+                example_files.append((filepath, result.snippets))
+        snippets_by_stem = {filepath.stem: snippets for filepath, snippets in example_files}
 
-        for filepath in self.examples_dir.glob("*Examples.axaml"):
-            snippets = self.axaml_parser.parse_file(filepath)
+        index = ExampleIndex()
+        for filepath, snippets in example_files:
             for snippet in snippets:
                 control_name = self._section_to_control(snippet.section_id)
+                if not control_name:
+                    continue
+                index.section_to_control[snippet.section_id] = control_name
+                if self.auto_parse and filepath.name.endswith("Examples.axaml"):
+                    index.examples_by_control.setdefault(control_name, []).append(snippet)
+                    files = index.example_files.setdefault(control_name, [])
+                    rel_path = filepath.relative_to(self.root_dir).as_posix()
+                    if rel_path not in files:
+                        files.append(rel_path)
+
+        # Categorize controls based on example files (in category_mapping order)
+        for stem, cat_name in self.category_mapping.items():
+            for snippet in snippets_by_stem.get(stem, []):
+                control_name = index.section_to_control.get(snippet.section_id)
                 if control_name:
-                    if control_name not in examples_by_control:
-                        examples_by_control[control_name] = []
-                    examples_by_control[control_name].append(snippet)
-
-        return examples_by_control
+                    members = index.categories.setdefault(cat_name, [])
+                    if control_name not in members:
+                        members.append(control_name)
+
+        index.usage = self._build_usage_index(filepaths, results)
+        return index
+
+    def _build_usage_index(self, filepaths: list[Path], results: list[AxamlFileIndex]) -> dict[str, dict]:
+        """Control -> usage count, attribute frequencies and every location, sorted by control name."""
+        usage: dict[str, dict] = {}
+        for filepath, result in zip(filepaths, results):
+            rel_path = filepath.relative_to(self.root_dir).as_posix()
+            for item in result.usages:
+                entry = usage.setdefault(item.control, {'count': 0, 'attributes': {}, 'locations': []})
+                entry['count'] += 1
+                for attr in item.attributes:
+                    entry['attributes'][attr] = entry['attributes'].get(attr, 0) + 1
+                entry['locations'].append({
+                    'file': rel_path,
+                    'line': item.line,
+                    'section_id': item.section_id,
+                    'attributes': item.attributes,
+                })
+        for entry in usage.values():
+            entry['attributes'] = dict(sorted(entry['attributes'].items(), key=lambda kv: (-kv[1], kv[0])))
+        return dict(sorted(usage.items()))
 
     def _section_to_control(self, section_id: str) -> Optional[str]:
         """Map a section ID to a control name."""
@@ -1183,29 +2514,6 @@ class DocumentationGenerator:
 
         return mappings.get(normalized)
 
-    def _categorize_controls(self, controls: list[ControlInfo],
-                            examples_by_control: dict[str, list[ExampleSnippet]]) -> dict[str, list[str]]:
-        """Categorize controls based on example files."""
-        categories: dict[str, list[str]] = {}
-
-        # Look for all AXAML files that are in the category mapping
-        for stem, cat_name in self.category_mapping.items():
-            filepath = self.examples_dir / f"{stem}.axaml"
-            if not filepath.exists():
-                continue
-
-            snippets = self.axaml_parser.parse_file(filepath)
-
-            for snippet in snippets:
-                control_name = self._section_to_control(snippet.section_id)
-                if control_name:
-                    if cat_name not in categories:
-                        categories[cat_name] = []
-                    if control_name not in categories[cat_name]:
-                        categories[cat_name].append(control_name)
-
-        return categories
-
 
 def main():
     """Main entry point."""
@@ -1216,6 +2524,10 @@ def main():
 Examples:
   python Utils/generate_docs.py              # Use curated docs only (default)
   python Utils/generate_docs.py --auto-parse # Include auto-parsed Properties/Examples
+  python Utils/generate_docs.py --auto-parse --jobs 0  # Parse on all CPU cores
+  python Utils/generate_docs.py --auto-parse --no-cache # Re-parse every file
+  python Utils/generate_docs.py --auto-parse --only DaisyButton  # Just one control (after a full build)
+  python Utils/generate_docs.py --auto-parse --xmldoc Flowery.NET/bin/Release/netstandard2.0/Flowery.NET.xml
         """
     )
     parser.add_argument(
@@ -1224,13 +2536,72 @@ Examples:
         default=False,
         help='Include auto-parsed Properties, Enums, and Examples from source files'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=DEFAULT_PARSE_JOBS,
+        metavar='N',
+        help='Parse source files in N worker processes (0 = one per CPU core, default: 1)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or write the parse cache (llms/{PARSE_CACHE_FILE})'
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='Delete the parse cache before parsing, then rebuild it'
+    )
+    parser.add_argument(
+        '--msgpack',
+        action='store_true',
+        help=f'Also write the API metadata as llms/{API_METADATA_MSGPACK_FILE} (requires the msgpack package)'
+    )
+    parser.add_argument(
+        '--xmldoc',
+        type=Path,
+        default=None,
+        metavar='PATH',
+        help='Compiler XML documentation file (Flowery.NET.xml); its summaries replace the ones '
+             'scanned from /// comments, which remain the fallback'
+    )
+    parser.add_argument(
+        '--example-similarity',
+        type=float,
+        default=EXAMPLE_SIMILARITY_THRESHOLD,
+        metavar='T',
+        help=f'Estimated similarity (0-1) at which two examples of a control count as duplicates '
+             f'and only the first is kept (default: {EXAMPLE_SIMILARITY_THRESHOLD})'
+    )
+    parser.add_argument(
+        '--only',
+        action='append',
+        default=None,
+        metavar='CONTROL',
+        help='Only regenerate this control (repeatable, glob patterns allowed) and patch its category, '
+             'llms.txt and controls.json entries; needs an earlier full build'
+    )
     args = parser.parse_args()
+    if args.msgpack and msgpack is None:
+        parser.error("--msgpack requires the 'msgpack' package (pip install msgpack)")
+    if not 0 < args.example_similarity <= 1:
+        parser.error("--example-similarity must be in (0, 1]")
+    if args.xmldoc and not args.xmldoc.is_file():
+        parser.error(f"--xmldoc file not found: {args.xmldoc}")
 
     script_dir = Path(__file__).parent
     root_dir = script_dir.parent
 
-    generator = DocumentationGenerator(root_dir, auto_parse=args.auto_parse)
-    generator.generate()
+    generator = DocumentationGenerator(root_dir, auto_parse=args.auto_parse, jobs=args.jobs,
+                                     use_cache=not args.no_cache, clear_cache=args.clear_cache,
+                                     write_msgpack=args.msgpack, xmldoc_path=args.xmldoc,
+                                     similarity_threshold=args.example_similarity)
+    if args.only:
+        if not generator.generate_only(args.only):
+            raise SystemExit(1)
+    else:
+        generator.generate()
 
 
 if __name__ == "__main__":
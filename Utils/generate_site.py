@@ -7,6 +7,7 @@ Converts markdown documentation into a static HTML website for GitHub Pages.
 Usage:
     python Utils/generate_site.py                # Use curated llms-static/ only (default)
     python Utils/generate_site.py --use-generated # Use llms/ (auto-generated) docs
+    python Utils/generate_site.py --from-source   # Run generate_docs.py --auto-parse in-process
 
 Input (markdown):
     Default mode (curated):
@@ -18,12 +19,19 @@ Input (markdown):
         llms/controls/*.md       - Per-control docs (auto-generated)
         llms/categories/*.md     - Category docs
 
+    With --from-source:
+        Same content as --use-generated, passed in memory from generate_docs.py
+        (llms/ is only written with --write-llms)
+
 Output (HTML):
     docs/index.html          - Main landing page
     docs/controls/*.html     - Per-control pages
     docs/categories/*.html   - Category pages
     docs/style.css           - Stylesheet
     docs/llms.txt            - Machine-readable docs for AI assistants
+    docs/sw.js               - Service worker (offline cache, skip with --no-service-worker)
+    docs/precache-manifest.json - Every output with its content hash
+    docs/page-weights.json   - Per-page transfer weight report (see --page-budget/--total-budget)
 
 GitHub Pages Setup:
     1. Push the docs/ folder to your repo
@@ -34,12 +42,55 @@ GitHub Pages Setup:
 """
 
 import argparse
+import base64
+import fnmatch
+import gzip
+import hashlib
+import json
+import posixpath
 import re
 import shutil
+import urllib.parse
 from pathlib import Path
 from typing import Optional
 
 
+# Build steps
+FULL_BUILD_STEPS = 9
+ONLY_MODE_STEPS = 5                                # --only: scan, scan, pages, stylesheet, service worker
+
+# Offline cache (service worker)
+SERVICE_WORKER_FILE = "sw.js"                     # Emitted at the site root so its scope covers docs/
+PRECACHE_MANIFEST_FILE = "precache-manifest.json"
+PRECACHE_HASH_LENGTH = 16                          # Hex chars of SHA-256 kept per file revision
+
+# Page weight report
+PAGE_WEIGHT_REPORT_FILE = "page-weights.json"
+PAGE_WEIGHT_TOP_N = 10                             # Heaviest pages printed to the console
+PRECOMPRESSED_EXTENSIONS = ('.gif', '.png', '.jpg', '.jpeg', '.webp')  # Served as-is (no gzip)
+PAGE_RESOURCE_PATTERN = re.compile(
+    r'<(?:link[^>]*?\shref|script[^>]*?\ssrc|img[^>]*?\ssrc)="([^"]+)"',
+    re.IGNORECASE
+)
+
+# Image inlining
+DEFAULT_INLINE_IMAGE_MAX_BYTES = 4096              # Images up to this size become data URIs (0 = off)
+SVG_DATA_URI_SAFE_CHARS = " /:=;,.'()!*~-_@"        # Left unescaped in UTF-8 SVG data URIs
+IMAGE_MIME_TYPES = {                               # Fixed table: mimetypes differs per OS and is slow to init
+    '.gif': 'image/gif',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml',
+}
+
+# Stylesheet pruning / critical CSS
+CRITICAL_HTML_CHARS = 6000                         # Leading chars of <body> treated as above the fold
+ALWAYS_USED_ELEMENTS = {'html', 'body'}
+STYLESHEET_LINK_PATTERN = re.compile(r'<link rel="stylesheet" href="((?:\.\./)*style\.css)">')
+
+
 def strip_html_comments_outside_code(content: str) -> str:
     """
     Remove HTML comments (<!-- ... -->) but preserve them inside code blocks.
@@ -69,9 +120,173 @@ def strip_html_comments_outside_code(content: str) -> str:
     return '\n'.join(result)
 
 
+class ImageInliner:
+    """
+    Turns small site images into data URIs to save a request per image.
+    Image bytes come from the generator's recorded outputs (keyed by path
+    relative to the site root); encodings are cached by content hash so the
+    same icon used on many pages is encoded once. Images not written by this
+    build (e.g. with --only) are looked up in fallback_dir.
+    """
+
+    def __init__(self, outputs: dict[str, bytes], max_bytes: int = DEFAULT_INLINE_IMAGE_MAX_BYTES,
+                 fallback_dir: Optional[Path] = None):
+        self.outputs = outputs
+        self.max_bytes = max_bytes
+        self.fallback_dir = fallback_dir
+        self._encoded: dict[str, str] = {}  # sha256 -> data URI
+
+    def data_uri(self, rel_path: str) -> Optional[str]:
+        """Return a data URI for a site-relative image path, or None to keep the URL."""
+        if self.max_bytes <= 0:
+            return None
+        rel_path = posixpath.normpath(rel_path)
+        while rel_path.startswith('../'):
+            rel_path = rel_path[3:]
+        data = self.outputs.get(rel_path)
+        if data is None and self.fallback_dir:
+            fallback = self.fallback_dir / rel_path
+            if fallback.is_file() and fallback.stat().st_size <= self.max_bytes:
+                data = fallback.read_bytes()
+        if data is None or len(data) > self.max_bytes:
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._encoded:
+            mime_type = IMAGE_MIME_TYPES.get(posixpath.splitext(rel_path)[1].lower(), 'application/octet-stream')
+            if mime_type == 'image/svg+xml':
+                # UTF-8 SVG is smaller than base64 and still compresses well
+                text = ' '.join(data.decode('utf-8').split())
+                self._encoded[digest] = f"data:{mime_type};utf8,{urllib.parse.quote(text, safe=SVG_DATA_URI_SAFE_CHARS)}"
+            else:
+                self._encoded[digest] = f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+        return self._encoded[digest]
+
+
+class CssOptimizer:
+    """
+    Prunes unused rules from site_template.css and extracts critical rules.
+
+    The stylesheet is split into flat rules (selector list + body) and @media
+    blocks. A selector is kept when every element, class and id it names is
+    used somewhere; pseudo-classes and attribute selectors are ignored, so
+    state-dependent rules (:hover, :checked, [data-theme]) survive.
+    """
+
+    def __init__(self, css: str):
+        self.blocks = self._parse(re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL))
+
+    @staticmethod
+    def collect_used(html: str, used: dict[str, set[str]]):
+        """Add the elements, classes and ids found in an HTML document to `used`."""
+        used['elements'].update(tag.lower() for tag in re.findall(r'<([a-zA-Z][\w-]*)', html))
+        for class_attr in re.findall(r'\sclass="([^"]*)"', html):
+            used['classes'].update(class_attr.split())
+        used['ids'].update(re.findall(r'\sid="([^"]*)"', html))
+
+    @staticmethod
+    def collect_dynamic_classes(js: str, used: dict[str, set[str]]):
+        """Add class names toggled from script (classList.add/toggle/remove)."""
+        used['classes'].update(re.findall(r'classList\.(?:add|toggle|remove)\([\'"]([\w-]+)[\'"]\)', js))
+
+    def render(self, used: dict[str, set[str]]) -> str:
+        """Serialize only the rules whose selectors match the used sets."""
+        out = []
+        for block in self.blocks:
+            if block[0] == 'rule':
+                rule = self._render_rule(block[1], block[2], used, indent='')
+                if rule:
+                    out.append(rule)
+            elif block[0] == 'media':
+                rules = [self._render_rule(sel, body, used, indent='    ') for sel, body in block[2]]
+                rules = [r for r in rules if r]
+                if rules:
+                    out.append(f"{block[1]} {{\n" + '\n\n'.join(rules) + "\n}")
+            else:
+                out.append(block[1])
+        return '\n\n'.join(out) + '\n'
+
+    def rule_count(self, used: Optional[dict[str, set[str]]] = None) -> int:
+        """Count selector rules (all of them, or only those kept for `used`)."""
+        count = 0
+        for block in self.blocks:
+            if block[0] == 'rule':
+                rules = [(block[1], block[2])]
+            elif block[0] == 'media':
+                rules = block[2]
+            else:
+                continue
+            for selectors, _ in rules:
+                if used is None or any(self._selector_used(sel, used) for sel in selectors):
+                    count += 1
+        return count
+
+    def _render_rule(self, selectors: list[str], body: str, used: dict[str, set[str]], indent: str) -> str:
+        kept = [sel for sel in selectors if self._selector_used(sel, used)]
+        if not kept:
+            return ""
+        selector_sep = ',\n' + indent
+        lines = [f"{indent}    {line.strip()}" for line in body.strip().split('\n') if line.strip()]
+        return f"{indent}{selector_sep.join(kept)} {{\n" + '\n'.join(lines) + f"\n{indent}}}"
+
+    def _selector_used(self, selector: str, used: dict[str, set[str]]) -> bool:
+        # Drop pseudo-classes/elements (with arguments) and attribute selectors
+        simplified = re.sub(r'::?[\w-]+(?:\([^)]*\))?|\[[^\]]*\]', '', selector)
+        for compound in re.split(r'[\s>+~]+', simplified.strip()):
+            if not compound:
+                continue
+            match = re.match(r'^([a-zA-Z][\w-]*|\*)?((?:[.#][\w-]+)*)$', compound)
+            if not match:
+                return True  # Unknown syntax - keep to be safe
+            element = match.group(1)
+            if element and element != '*' and element.lower() not in used['elements'] | ALWAYS_USED_ELEMENTS:
+                return False
+            for kind, name in re.findall(r'([.#])([\w-]+)', match.group(2)):
+                if name not in (used['classes'] if kind == '.' else used['ids']):
+                    return False
+        return True
+
+    def _parse(self, css: str) -> list[tuple]:
+        """
+        Split CSS into ('rule', selectors, body), ('media', prelude, [(selectors, body)])
+        and ('raw', text) blocks for other at-rules, which are always kept.
+        """
+        blocks = []
+        i = 0
+        n = len(css)
+        while i < n:
+            open_pos = css.find('{', i)
+            if open_pos == -1:
+                break
+            prelude = css[i:open_pos].strip()
+            # Find the matching close brace
+            depth = 1
+            j = open_pos + 1
+            while j < n and depth:
+                if css[j] == '{':
+                    depth += 1
+                elif css[j] == '}':
+                    depth -= 1
+                j += 1
+            body = css[open_pos + 1:j - 1]
+            if prelude.startswith('@media'):
+                inner_rules = [(block[1], block[2]) for block in self._parse(body) if block[0] == 'rule']
+                blocks.append(('media', prelude, inner_rules))
+            elif prelude.startswith('@'):
+                blocks.append(('raw', css[i:j].strip()))
+            else:
+                selectors = [sel.strip() for sel in prelude.split(',') if sel.strip()]
+                blocks.append(('rule', selectors, body))
+            i = j
+        return blocks
+
+
 class MarkdownToHtml:
     """Simple markdown to HTML converter."""
 
+    def __init__(self, image_inliner: Optional[ImageInliner] = None):
+        self.image_inliner = image_inliner
+
     def convert(self, markdown: str, depth: int = 1) -> str:
         """Convert markdown to HTML.
         
@@ -99,9 +314,11 @@ class MarkdownToHtml:
         def convert_image(m):
             alt = m.group(1)
             src = m.group(2)
-            # If src is a local file (not http), prepend path prefix based on depth
-            if not src.startswith(('http://', 'https://', '/')):
-                src = path_prefix + src
+            # If src is a local file (not http), inline it when small enough,
+            # otherwise prepend path prefix based on depth
+            if not src.startswith(('http://', 'https://', '/', 'data:')):
+                data_uri = self.image_inliner.data_uri(src) if self.image_inliner else None
+                src = data_uri or path_prefix + src
             return f'<img src="{src}" alt="{alt}" class="doc-image">'
         html = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', convert_image, html)
 
@@ -297,13 +514,29 @@ class SiteGenerator:
         'FlowerySizeManager',  # Global discrete size tiers (XS-XL)
     }
 
-    def __init__(self, docs_dir: Path, output_dir: Path, curated_dir: Path | None = None):
+    def __init__(self, docs_dir: Path, output_dir: Path, curated_dir: Path | None = None,
+                 service_worker: bool = True, page_budget_kb: float | None = None,
+                 total_budget_kb: float | None = None,
+                 inline_image_max_bytes: int = DEFAULT_INLINE_IMAGE_MAX_BYTES,
+                 prune_css: bool = True, critical_css: bool = False,
+                 only: Optional[list[str]] = None, generated=None):
         self.docs_dir = docs_dir
         self.output_dir = output_dir
         self.curated_dir = curated_dir  # llms-static/ for curated-only mode
-        self.converter = MarkdownToHtml()
+        self.service_worker = service_worker
+        self.prune_css = prune_css        # Drop stylesheet rules no generated page uses
+        self.critical_css = critical_css  # Inline above-the-fold rules, load style.css async
+        self.only = only                  # Page name globs to render (None = whole site)
+        self.generated = generated        # generate_docs.GeneratedDocs (--from-source), else read llms/
+        self.page_budget_kb = page_budget_kb    # Max compressed weight per page (None = report only)
+        self.total_budget_kb = total_budget_kb  # Max compressed weight of the whole site
+        self.budget_violations: list[str] = []
         self.controls: list[dict] = []
         self.categories: list[dict] = []
+        self.outputs: dict[str, bytes] = {}  # relative path (posix) -> bytes written this build
+        self.image_inliner = ImageInliner(self.outputs, max_bytes=inline_image_max_bytes,
+                                          fallback_dir=output_dir)
+        self.converter = MarkdownToHtml(image_inliner=self.image_inliner)
         self.use_curated_only = curated_dir is not None
 
     def generate(self):
@@ -312,6 +545,8 @@ class SiteGenerator:
         print("=" * 40)
         if self.use_curated_only:
             print("Mode: CURATED ONLY (llms-static/)")
+        elif self.generated:
+            print("Mode: GENERATED (in memory from generate_docs.py)")
         else:
             print("Mode: GENERATED (llms/)")
 
@@ -322,7 +557,7 @@ class SiteGenerator:
         (self.output_dir / "images").mkdir(exist_ok=True)
 
         # Collect all controls
-        print("\n[1/5] Scanning control docs...")
+        self._step(1, "Scanning control docs...")
         seen_controls = set()
 
         if self.use_curated_only:
@@ -365,6 +600,16 @@ class SiteGenerator:
                         }
                         self.controls.append(entry)
                         seen_controls.add(name)
+        elif self.generated:
+            # Markdown already rendered by generate_docs.py in this process
+            for name, content in sorted(self.generated.control_docs.items()):
+                if name.startswith("Daisy"):
+                    self.controls.append({
+                        'name': name,
+                        'content': content,
+                        'html_name': f"{name}.html",
+                        'is_helper': name in self.HELPER_CONTROL_NAMES
+                    })
         else:
             # Read from llms/controls/
             controls_dir = self.docs_dir / "controls"
@@ -383,9 +628,23 @@ class SiteGenerator:
         print(f"      Found {len(self.controls)} controls")
 
         # Collect categories (always from llms/categories/)
-        print("\n[2/5] Scanning category docs...")
+        self._step(2, "Scanning category docs...")
         categories_dir = self.docs_dir / "categories"
-        if categories_dir.exists():
+        if self.generated:
+            # Membership comes as data, no need to recover it from the markdown
+            members = {
+                cat_name.lower().replace(' ', '-').replace('&', 'and'): controls
+                for cat_name, controls in self.generated.categories.items()
+            }
+            for stem, content in sorted(self.generated.category_docs.items()):
+                self.categories.append({
+                    'name': stem.replace('-', ' ').title(),
+                    'content': content,
+                    'controls': [name for name in members.get(stem, []) if name.startswith("Daisy")],
+                    'html_name': f"{stem}.html"
+                })
+            print(f"      Found {len(self.categories)} categories")
+        elif categories_dir.exists():
             for md_file in sorted(categories_dir.glob("*.md")):
                 self.categories.append({
                     'name': md_file.stem.replace('-', ' ').title(),
@@ -396,29 +655,141 @@ class SiteGenerator:
         else:
             print("      No categories folder found (run generate_docs.py first)")
 
+        # Authoring mode: render only the requested pages, leave all other outputs alone
+        if self.only:
+            return self._generate_only()
+
         # Copy images from llms-static/ to docs/
-        print("\n[3/6] Copying images...")
+        self._step(3, "Copying images...")
         self._copy_images()
 
         # Copy standalone guides from llms-static/ to docs/
-        print("\n[4/6] Copying guides...")
+        self._step(4, "Copying guides...")
         self._copy_guides()
 
         # Generate CSS
-        print("\n[5/6] Generating stylesheet...")
+        self._step(5, "Generating stylesheet...")
         self._write_css()
 
         # Generate HTML pages
-        print("\n[6/6] Generating HTML pages...")
+        self._step(6, "Generating HTML pages...")
         self._generate_shell()
         self._generate_home()
         self._generate_control_pages()
         self._generate_category_pages()
 
+        # Stylesheet pruning / critical CSS (rewrites outputs, so runs before weights)
+        if self.prune_css or self.critical_css:
+            self._step(7, "Optimizing stylesheet...")
+            self._optimize_css()
+        else:
+            self._step(7, "Skipping stylesheet optimization (--no-css-prune)")
+
+        # Page weight report and budgets
+        self._step(8, "Measuring page weights...")
+        self._check_page_weights()
+
+        # Generate offline cache (must run last so every output is in the manifest)
+        if self.service_worker:
+            self._step(9, "Generating service worker...")
+            self._write_service_worker()
+        else:
+            self._step(9, "Skipping service worker (--no-service-worker)")
+
+        if self.budget_violations:
+            print("\n" + "=" * 40)
+            print("Page weight budget exceeded:")
+            for violation in self.budget_violations:
+                print(f"  - {violation}")
+            return False
+
         print("\n" + "=" * 40)
         print("Site generated successfully!")
         print(f"Output: {self.output_dir}")
         print(f"Open:   {self.output_dir / 'index.html'}")
+        return True
+
+    def _step(self, number: int, text: str):
+        """Print a numbered build step; --only runs fewer steps than a full build."""
+        total = ONLY_MODE_STEPS if self.only else FULL_BUILD_STEPS
+        print(f"\n[{number}/{total}] {text}")
+
+    def _is_selected(self, page_name: str) -> bool:
+        """Check a page name (e.g. 'DaisyButton', 'Effects') against the --only globs."""
+        if not self.only:
+            return True
+        return any(fnmatch.fnmatchcase(page_name, pattern) for pattern in self.only)
+
+    def _generate_only(self) -> bool:
+        """
+        Fast authoring mode (--only): render just the matching control and guide
+        pages. Navigation and breadcrumbs still come from the full control and
+        category lists scanned above. The stylesheet is re-pruned (and critical
+        CSS inlined) against the pages already in the output directory plus the
+        new ones, and the precache manifest entries of the rewritten files are
+        updated so the service worker does not keep serving the old copies.
+        Images, shell, home and category pages are left as they are.
+        """
+        guides = [g for g in self.GUIDE_FILES if self._is_selected(g.replace('.md', ''))]
+        selected_controls = [c['name'] for c in self.controls if self._is_selected(c['name'])]
+        if not guides and not selected_controls:
+            print(f"\nError: no control or guide pages match --only {' '.join(self.only)}")
+            return False
+
+        self._step(3, f"Generating {len(selected_controls) + len(guides)} selected page(s)...")
+        if guides:
+            self._copy_guides(guides)
+        if selected_controls:
+            self._generate_control_pages()
+        for rel_path in self.outputs:
+            print(f"      Wrote {rel_path}")
+
+        self._step(4, "Updating stylesheet...")
+        self._write_css()
+        if self.prune_css or self.critical_css:
+            existing_pages = {
+                path.relative_to(self.output_dir).as_posix(): path.read_text(encoding='utf-8')
+                for path in self.output_dir.glob("**/*.html")
+            }
+            for rel_path in self.outputs:
+                existing_pages.pop(rel_path, None)
+            self._optimize_css(existing_pages)
+
+        manifest_path = self.output_dir / PRECACHE_MANIFEST_FILE
+        if self.service_worker and manifest_path.exists():
+            self._step(5, "Updating service worker...")
+            try:
+                previous = json.loads(manifest_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                previous = None
+            if isinstance(previous, dict) and isinstance(previous.get('files'), list):
+                self._write_service_worker(previous)
+            else:
+                print(f"      Warning: {PRECACHE_MANIFEST_FILE} is unreadable; run a full build to recreate it")
+        else:
+            self._step(5, "Skipping service worker (no precache manifest from a full build)")
+
+        print("\n" + "=" * 40)
+        print("Selected pages generated (run a full build before deploying).")
+        return True
+
+    @staticmethod
+    def _read_doc(entry: dict) -> str:
+        """Markdown of a control/category entry: in-memory content, else its file."""
+        if 'content' in entry:
+            return entry['content']
+        return entry['file'].read_text(encoding='utf-8')
+
+    def _write_output(self, rel_path: str, content: str | bytes):
+        """Write a file below the output directory and record it for the precache manifest."""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        (self.output_dir / rel_path).write_bytes(data)
+        self.outputs[rel_path] = data
+
+    def _copy_output(self, src: Path, rel_path: str):
+        """Copy a static file below the output directory (keeping its timestamps) and record it."""
+        self._write_output(rel_path, src.read_bytes())
+        shutil.copystat(src, self.output_dir / rel_path)
 
     def _copy_images(self):
         """Copy image files from llms-static/ and llms-static/images/ to docs/images/."""
@@ -431,8 +802,7 @@ class SiteGenerator:
         # Copy ALL images from llms-static/ root to docs/images/
         for ext in image_extensions:
             for img_file in self.curated_dir.glob(ext):
-                dest = self.output_dir / "images" / img_file.name
-                shutil.copy2(img_file, dest)
+                self._copy_output(img_file, f"images/{img_file.name}")
                 copied += 1
 
         # Copy images from llms-static/images/ to docs/images/
@@ -440,13 +810,12 @@ class SiteGenerator:
         if images_subdir.exists():
             for ext in image_extensions:
                 for img_file in images_subdir.glob(ext):
-                    dest = self.output_dir / "images" / img_file.name
-                    shutil.copy2(img_file, dest)
+                    self._copy_output(img_file, f"images/{img_file.name}")
                     copied += 1
 
         print(f"      Copied {copied} image(s)")
 
-    def _copy_guides(self):
+    def _copy_guides(self, guide_files: Optional[list[str]] = None):
         """Copy standalone guide markdown files from llms-static/ to docs/ and convert to HTML."""
         if not self.curated_dir:
             return
@@ -454,7 +823,7 @@ class SiteGenerator:
         # List of standalone guide files to copy (not control docs)
         copied = 0
 
-        for guide_name in self.GUIDE_FILES:
+        for guide_name in guide_files or self.GUIDE_FILES:
             guide_file = self.curated_dir / guide_name
             if guide_file.exists():
                 # Read and convert to HTML
@@ -469,7 +838,7 @@ class SiteGenerator:
                 # Generate HTML page
                 html_name = guide_name.replace('.md', '.html')
                 page = self._page_template(guide_name.replace('.md', ''), final_content, depth=0)
-                (self.output_dir / html_name).write_text(page, encoding='utf-8')
+                self._write_output(html_name, page)
                 copied += 1
 
         if copied > 0:
@@ -479,7 +848,69 @@ class SiteGenerator:
         """Write the stylesheet (read from external template file)."""
         css_template = Path(__file__).parent / "site_template.css"
         css = css_template.read_text(encoding='utf-8')
-        (self.output_dir / "style.css").write_text(css, encoding='utf-8')
+        self._write_output("style.css", css)
+
+    def _optimize_css(self, existing_pages: Optional[dict[str, str]] = None):
+        """
+        Prune style.css down to the rules used by the generated pages and,
+        with critical CSS enabled, inline each page type's above-the-fold rules
+        while the stylesheet itself loads asynchronously. existing_pages (--only)
+        are pages from an earlier build: they count towards what is kept and
+        inlined but are not rewritten.
+        """
+        utils_dir = Path(__file__).parent
+        optimizer = CssOptimizer((utils_dir / "site_template.css").read_text(encoding='utf-8'))
+        html_pages = {path: data.decode('utf-8') for path, data in self.outputs.items() if path.endswith('.html')}
+        all_pages = {**(existing_pages or {}), **html_pages}
+
+        used: dict[str, set[str]] = {'elements': set(), 'classes': set(), 'ids': set()}
+        for html in all_pages.values():
+            CssOptimizer.collect_used(html, used)
+        for script in ("site_shell.js", "site_content.js"):
+            CssOptimizer.collect_dynamic_classes((utils_dir / script).read_text(encoding='utf-8'), used)
+
+        if self.prune_css:
+            original_size = len(self.outputs["style.css"])
+            self._write_output("style.css", optimizer.render(used))
+            print(f"      Kept {optimizer.rule_count(used)}/{optimizer.rule_count()} rules "
+                  f"({original_size / 1024:.1f} KB -> {len(self.outputs['style.css']) / 1024:.1f} KB)")
+
+        if not self.critical_css:
+            return
+
+        # Union of what appears above the fold, per page type
+        above_fold: dict[str, dict[str, set[str]]] = {}
+        for path, html in all_pages.items():
+            page_used = above_fold.setdefault(self._page_type(path), {'elements': set(), 'classes': set(), 'ids': set()})
+            body_start = max(html.find('<body'), 0)
+            CssOptimizer.collect_used(html[body_start:body_start + CRITICAL_HTML_CHARS], page_used)
+        critical = {page_type: optimizer.render(page_used) for page_type, page_used in above_fold.items()}
+
+        for path, html in html_pages.items():
+            inline_css = critical[self._page_type(path)]
+
+            def async_stylesheet(m, inline_css=inline_css):
+                href = m.group(1)
+                return (f'<style>\n{inline_css}</style>\n'
+                        f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                        f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+            self._write_output(path, STYLESHEET_LINK_PATTERN.sub(async_stylesheet, html, count=1))
+        sizes = ', '.join(f"{page_type} {len(css) / 1024:.1f} KB" for page_type, css in sorted(critical.items()))
+        print(f"      Inlined critical CSS per page type: {sizes}")
+
+    @staticmethod
+    def _page_type(rel_path: str) -> str:
+        """Classify an output page for per-type critical CSS."""
+        if rel_path == "index.html":
+            return "shell"
+        if rel_path == "home.html":
+            return "home"
+        if rel_path.startswith("controls/"):
+            return "control"
+        if rel_path.startswith("categories/"):
+            return "category"
+        return "guide"
 
     def _page_template(self, title: str, content: str, depth: int = 0) -> str:
         """Generate HTML page for content (loaded in iframe)."""
@@ -505,6 +936,80 @@ class SiteGenerator:
 </body>
 </html>'''
 
+    def _check_page_weights(self):
+        """
+        Compute the transfer weight of every HTML page (the page plus the CSS, JS
+        and images it references), raw and gzip-compressed, from the outputs
+        recorded during this build. Writes a report sorted by compressed weight
+        and records budget violations.
+        """
+        compressed_sizes: dict[str, int] = {}
+
+        def compressed_size(rel_path: str) -> int:
+            if rel_path not in compressed_sizes:
+                data = self.outputs[rel_path]
+                if rel_path.lower().endswith(PRECOMPRESSED_EXTENSIONS):
+                    compressed_sizes[rel_path] = len(data)
+                else:
+                    compressed_sizes[rel_path] = len(gzip.compress(data, compresslevel=6, mtime=0))
+            return compressed_sizes[rel_path]
+
+        pages = []
+        for page_path, data in self.outputs.items():
+            if not page_path.endswith('.html'):
+                continue
+            html = data.decode('utf-8')
+            page_dir = posixpath.dirname(page_path)
+            resources = []
+            external = []
+            for ref in dict.fromkeys(PAGE_RESOURCE_PATTERN.findall(html)):
+                if ref.startswith(('http://', 'https://', '//', 'data:')):
+                    if not ref.startswith('data:'):
+                        external.append(ref)
+                    continue
+                rel_path = posixpath.normpath(posixpath.join(page_dir, ref.split('#')[0].split('?')[0]))
+                if rel_path in self.outputs:
+                    resources.append({
+                        'path': rel_path,
+                        'raw': len(self.outputs[rel_path]),
+                        'compressed': compressed_size(rel_path),
+                    })
+            raw = len(data) + sum(r['raw'] for r in resources)
+            compressed = compressed_size(page_path) + sum(r['compressed'] for r in resources)
+            pages.append({
+                'page': page_path,
+                'html': {'raw': len(data), 'compressed': compressed_size(page_path)},
+                'raw': raw,
+                'compressed': compressed,
+                'resources': resources,
+                'external': external,
+            })
+
+        pages.sort(key=lambda p: (-p['compressed'], p['page']))
+        total_raw = sum(len(data) for data in self.outputs.values())
+        total_compressed = sum(compressed_size(rel_path) for rel_path in self.outputs)
+
+        report = {
+            'budgets': {'page_kb': self.page_budget_kb, 'total_kb': self.total_budget_kb},
+            'total': {'files': len(self.outputs), 'raw': total_raw, 'compressed': total_compressed},
+            'pages': pages,
+        }
+        (self.output_dir / PAGE_WEIGHT_REPORT_FILE).write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+        print(f"      Site total: {total_raw / 1024:.1f} KB raw, {total_compressed / 1024:.1f} KB compressed")
+        for page in pages[:PAGE_WEIGHT_TOP_N]:
+            print(f"      {page['compressed'] / 1024:8.1f} KB  {page['page']}")
+        print(f"      Report: {self.output_dir / PAGE_WEIGHT_REPORT_FILE}")
+
+        if self.page_budget_kb is not None:
+            for page in pages:
+                if page['compressed'] > self.page_budget_kb * 1024:
+                    self.budget_violations.append(
+                        f"{page['page']}: {page['compressed'] / 1024:.1f} KB > {self.page_budget_kb:g} KB per page")
+        if self.total_budget_kb is not None and total_compressed > self.total_budget_kb * 1024:
+            self.budget_violations.append(
+                f"site total: {total_compressed / 1024:.1f} KB > {self.total_budget_kb:g} KB")
+
     def _generate_shell(self):
         """Generate the main app shell (index.html) with sidebar and iframe."""
         shell_js = (Path(__file__).parent / "site_shell.js").read_text(encoding='utf-8')
@@ -617,7 +1122,7 @@ class SiteGenerator:
     </script>
 </body>
 </html>'''
-        (self.output_dir / "index.html").write_text(html, encoding='utf-8')
+        self._write_output("index.html", html)
 
     def _generate_home(self):
         """Generate the home content page (home.html)."""
@@ -625,10 +1130,11 @@ class SiteGenerator:
         if self.use_curated_only:
             llms_content = self._generate_llms_txt_from_curated()
         else:
-            llms_content = (self.docs_dir / "llms.txt").read_text(encoding='utf-8')
+            llms_content = self.generated.llms_txt if self.generated \
+                else (self.docs_dir / "llms.txt").read_text(encoding='utf-8')
 
         # Write llms.txt to output directory for AI assistants
-        (self.output_dir / "llms.txt").write_text(llms_content, encoding='utf-8')
+        self._write_output("llms.txt", llms_content)
 
         # Convert to HTML
         html_content = self.converter.convert(llms_content)
@@ -673,7 +1179,7 @@ class SiteGenerator:
 
         full_content = html_content + footer_html
         page = self._page_template("Documentation", full_content, depth=0)
-        (self.output_dir / "home.html").write_text(page, encoding='utf-8')
+        self._write_output("home.html", page)
 
     def _generate_llms_txt_from_curated(self) -> str:
         """Generate a master llms.txt from curated docs."""
@@ -708,7 +1214,7 @@ class SiteGenerator:
             # Try to extract description from the markdown file
             desc = f"{display_name} control"
             try:
-                content = ctrl['file'].read_text(encoding='utf-8')
+                content = self._read_doc(ctrl)
                 # Look for first paragraph after "# Overview" or first non-header line
                 content_clean = strip_html_comments_outside_code(content)
                 # Find first meaningful paragraph
@@ -735,7 +1241,7 @@ class SiteGenerator:
                 badge = ' <sup class="custom-badge">✦</sup>' if is_custom else ''
                 desc = f"{display_name} helper"
                 try:
-                    content = ctrl['file'].read_text(encoding='utf-8')
+                    content = self._read_doc(ctrl)
                     content_clean = strip_html_comments_outside_code(content)
                     for line in content_clean.split('\n'):
                         line = line.strip()
@@ -816,8 +1322,8 @@ class SiteGenerator:
         # Image panels
         html += '  <div class="image-panels">\n'
         for i, img_path in enumerate(images):
-            # Prepend ../ for controls/ subfolder
-            src = '../' + img_path
+            # Inline small images, otherwise prepend ../ for controls/ subfolder
+            src = self.image_inliner.data_uri(img_path) or '../' + img_path
             html += f'    <div class="image-panel">\n'
             html += f'      <img src="{src}" alt="{control_name} - Part {i+1}" class="doc-image">\n'
             html += f'    </div>\n'
@@ -883,16 +1389,20 @@ class SiteGenerator:
 
         # Parse categories to find which controls belong where
         for cat in self.categories:
-            cat_content = cat['file'].read_text(encoding='utf-8')
-            # Extract control names from list items
-            # - **[DaisyButton](../controls/DaisyButton.html)**
-            found_controls = re.findall(r'\*\*\[?(Daisy\w+)', cat_content)
+            if 'controls' in cat:
+                found_controls = cat['controls']
+            else:
+                # Extract control names from list items
+                # - **[DaisyButton](../controls/DaisyButton.html)**
+                found_controls = re.findall(r'\*\*\[?(Daisy\w+)', self._read_doc(cat))
             category_controls_map[cat['name']] = found_controls
             for ctrl_name in found_controls:
                 control_category_map[ctrl_name] = cat
 
         for ctrl in self.controls:
-            md_content = ctrl['file'].read_text(encoding='utf-8')
+            if not self._is_selected(ctrl['name']):
+                continue
+            md_content = self._read_doc(ctrl)
             # Strip HTML comments from curated docs (but preserve them inside code blocks)
             md_content = strip_html_comments_outside_code(md_content)
 
@@ -1017,15 +1527,42 @@ class SiteGenerator:
             final_content = breadcrumbs + html_content + prev_next
 
             page = self._page_template(ctrl['name'], final_content, depth=1)
-            (self.output_dir / "controls" / ctrl['html_name']).write_text(page, encoding='utf-8')
+            self._write_output(f"controls/{ctrl['html_name']}", page)
 
     def _generate_category_pages(self):
         """Generate HTML pages for each category."""
         for cat in self.categories:
-            md_content = cat['file'].read_text(encoding='utf-8')
+            md_content = self._read_doc(cat)
             html_content = self.converter.convert(md_content)
             page = self._page_template(cat['name'], html_content, depth=1)
-            (self.output_dir / "categories" / cat['html_name']).write_text(page, encoding='utf-8')
+            self._write_output(f"categories/{cat['html_name']}", page)
+
+    def _write_service_worker(self, previous: Optional[dict] = None):
+        """
+        Write the precache manifest and service worker for offline browsing.
+        Every output of this build is listed with a content hash; the worker
+        reuses cached entries whose hash is unchanged, so a redeploy only
+        refetches the files that actually changed. With a previous manifest
+        (--only), its entries are kept and those of this build's outputs replaced.
+        """
+        revisions = {entry['url']: entry['revision'] for entry in (previous or {}).get('files', [])}
+        revisions.update(
+            (rel_path, hashlib.sha256(data).hexdigest()[:PRECACHE_HASH_LENGTH])
+            for rel_path, data in self.outputs.items()
+        )
+        files = [{'url': url, 'revision': revision} for url, revision in sorted(revisions.items())]
+        # The version changes whenever any file changes, which makes the browser
+        # see a byte-different sw.js and install the new precache.
+        version = hashlib.sha256(json.dumps(files, sort_keys=True).encode('utf-8')).hexdigest()[:PRECACHE_HASH_LENGTH]
+        manifest = {'version': version, 'files': files}
+        (self.output_dir / PRECACHE_MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
+        sw_template = (Path(__file__).parent / "site_sw.js").read_text(encoding='utf-8')
+        sw_js = (sw_template
+                 .replace('__PRECACHE_VERSION__', version)
+                 .replace('__PRECACHE_MANIFEST__', PRECACHE_MANIFEST_FILE))
+        (self.output_dir / SERVICE_WORKER_FILE).write_text(sw_js, encoding='utf-8')
+        print(f"      Precache manifest: {len(files)} file(s), version {version}")
 
 
 def main():
@@ -1036,6 +1573,13 @@ def main():
 Examples:
   python Utils/generate_site.py                # Use curated llms-static/ only (default)
   python Utils/generate_site.py --use-generated # Use llms/ (auto-generated) docs
+  python Utils/generate_site.py --from-source   # Parse sources and build the site in one process
+  python Utils/generate_site.py --from-source --write-llms # ...and also write llms/ as before
+  python Utils/generate_site.py --no-service-worker # Skip the offline cache
+  python Utils/generate_site.py --page-budget 150  # Fail if a page exceeds 150 KB compressed
+  python Utils/generate_site.py --inline-images-below 0 # Never inline images as data URIs
+  python Utils/generate_site.py --critical-css     # Inline above-the-fold CSS per page type
+  python Utils/generate_site.py --only DaisyButton --only "DaisyColor*" # Re-render just these pages
         """
     )
     parser.add_argument(
@@ -1044,6 +1588,66 @@ Examples:
         default=False,
         help='Use llms/ (auto-generated) docs instead of curated llms-static/'
     )
+    parser.add_argument(
+        '--from-source',
+        action='store_true',
+        default=False,
+        help='Run generate_docs.py --auto-parse in this process and build the site from its '
+             'in-memory output (implies --use-generated; llms/ is not read)'
+    )
+    parser.add_argument(
+        '--write-llms',
+        action='store_true',
+        default=False,
+        help='With --from-source, also write the llms/ markdown files as generate_docs.py does'
+    )
+    parser.add_argument(
+        '--no-service-worker',
+        action='store_true',
+        default=False,
+        help='Do not emit sw.js / precache-manifest.json (offline cache)'
+    )
+    parser.add_argument(
+        '--page-budget',
+        type=float,
+        default=None,
+        metavar='KB',
+        help='Fail the build if any page (HTML + local CSS/JS/images) exceeds KB compressed'
+    )
+    parser.add_argument(
+        '--total-budget',
+        type=float,
+        default=None,
+        metavar='KB',
+        help='Fail the build if the whole site exceeds KB compressed'
+    )
+    parser.add_argument(
+        '--inline-images-below',
+        type=int,
+        default=DEFAULT_INLINE_IMAGE_MAX_BYTES,
+        metavar='BYTES',
+        help=f'Inline images up to BYTES as data URIs (default: {DEFAULT_INLINE_IMAGE_MAX_BYTES}, 0 disables)'
+    )
+    parser.add_argument(
+        '--no-css-prune',
+        action='store_true',
+        default=False,
+        help='Copy site_template.css unchanged instead of dropping rules no page uses'
+    )
+    parser.add_argument(
+        '--critical-css',
+        action='store_true',
+        default=False,
+        help='Inline above-the-fold CSS per page type and load style.css asynchronously'
+    )
+    parser.add_argument(
+        '--only',
+        action='append',
+        default=None,
+        metavar='PAGE',
+        help='Only render this control or guide page (repeatable, glob patterns allowed); '
+             'all other outputs are left untouched'
+    )
     args = parser.parse_args()
 
     script_dir = Path(__file__).parent
@@ -1052,20 +1656,43 @@ Examples:
     curated_dir = root_dir / "llms-static"
     docs_dir = root_dir / "docs"
 
-    if args.use_generated:
+    if args.from_source:
+        # Fused pipeline: docs are generated here and handed over in memory
+        from generate_docs import DocumentationGenerator
+        docs = DocumentationGenerator(root_dir, auto_parse=True, write_files=args.write_llms,
+                                     keep_docs=True).generate()
+        print()
+        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=None,
+                                  service_worker=not args.no_service_worker,
+                                  page_budget_kb=args.page_budget, total_budget_kb=args.total_budget,
+                                  inline_image_max_bytes=args.inline_images_below,
+                                  prune_css=not args.no_css_prune, critical_css=args.critical_css,
+                                  only=args.only, generated=docs)
+    elif args.use_generated:
         # Use auto-generated llms/ folder
         if not llms_dir.exists():
             print("Error: llms/ folder not found. Run generate_docs.py --auto-parse first.")
             return
-        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=None)
+        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=None,
+                                  service_worker=not args.no_service_worker,
+                                  page_budget_kb=args.page_budget, total_budget_kb=args.total_budget,
+                                  inline_image_max_bytes=args.inline_images_below,
+                                  prune_css=not args.no_css_prune, critical_css=args.critical_css,
+                                  only=args.only)
     else:
         # Use curated llms-static/ folder (default)
         if not curated_dir.exists():
             print("Error: llms-static/ folder not found.")
             return
-        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=curated_dir)
-
-    generator.generate()
+        generator = SiteGenerator(llms_dir, docs_dir, curated_dir=curated_dir,
+                                  service_worker=not args.no_service_worker,
+                                  page_budget_kb=args.page_budget, total_budget_kb=args.total_budget,
+                                  inline_image_max_bytes=args.inline_images_below,
+                                  prune_css=not args.no_css_prune, critical_css=args.critical_css,
+                                  only=args.only)
+
+    if not generator.generate():
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
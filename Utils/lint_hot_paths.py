@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Flowery.NET Hot-Path Allocation Linter
+======================================
+
+Finds allocations in code that runs per frame or per layout pass, where they
+turn into GC pressure that no profiler session points at until it costs us.
+
+HOT PATHS:
+----------
+    - override Render / MeasureOverride / ArrangeOverride
+    - Timer callbacks: handlers attached to Tick/Elapsed (method groups or
+      lambdas), DispatcherTimer.Run/RunOnce and RequestAnimationFrame callbacks
+    - Per-frame AnimationHelper.AnimateAsync callbacks (the Action<double>
+      that applies each interpolated value)
+
+FLAGGED PATTERNS (weight):
+--------------------------
+    3  new brushes, pens, geometries, FormattedText, bitmaps
+    2  new collections and arrays, LINQ calls, interpolated strings, string.Format
+    1  other `new` of reference types, ToString(), string concatenation, lambdas
+
+Value types (Rect, Point, Size, Thickness, Color, ...) are not flagged, and
+neither is the in-place List<T>.Reverse() statement.
+
+The C# is read with the lexer from generate_docs.py, so comments and string
+contents never produce findings. Controls are ranked by the summed weight of
+their findings; each finding has file, line and method.
+
+USAGE:
+    python Utils/lint_hot_paths.py
+    python Utils/lint_hot_paths.py --top 10 --json llms/hot-paths.json
+    python Utils/lint_hot_paths.py --path Flowery.NET
+"""
+
+import argparse
+import bisect
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from generate_docs import CSharpToken, tokenize_csharp
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+
+HOT_OVERRIDES = {'Render', 'MeasureOverride', 'ArrangeOverride'}
+TIMER_EVENTS = {'Tick', 'Elapsed'}                           # timer.Tick += callback
+TIMER_CALLBACK_CALLS = {'Run', 'RunOnce', 'RequestAnimationFrame', 'AnimateAsync'}  # First argument is the callback
+TIMER_CALLBACK_OWNERS = {'Run': 'DispatcherTimer', 'RunOnce': 'DispatcherTimer',
+                         'AnimateAsync': 'AnimationHelper'}  # Owner type the call must be made on
+
+RENDER_RESOURCE_TYPES = {
+    'SolidColorBrush', 'LinearGradientBrush', 'RadialGradientBrush', 'ConicGradientBrush', 'ImageBrush',
+    'VisualBrush', 'Pen', 'ImmutablePen', 'ImmutableSolidColorBrush', 'DashStyle', 'GradientStop',
+    'GradientStops', 'FormattedText', 'TextLayout', 'StreamGeometry', 'PathGeometry', 'EllipseGeometry',
+    'RectangleGeometry', 'LineGeometry', 'PolylineGeometry', 'CombinedGeometry', 'GeometryGroup',
+    'RenderTargetBitmap', 'WriteableBitmap', 'Bitmap', 'DrawingGroup', 'DrawingImage',
+}
+COLLECTION_TYPES = {
+    'List', 'Dictionary', 'HashSet', 'SortedSet', 'SortedDictionary', 'Queue', 'Stack', 'LinkedList',
+    'ObservableCollection', 'StringBuilder',
+}
+VALUE_TYPES = {
+    'Rect', 'Point', 'Size', 'Vector', 'Matrix', 'Thickness', 'CornerRadius', 'Color', 'HslColor', 'HsvColor',
+    'RelativePoint', 'RelativeRect', 'RelativeScalar', 'PixelPoint', 'PixelSize', 'PixelRect', 'PixelVector',
+    'BoxShadow', 'BoxShadows', 'Typeface', 'GridLength', 'TimeSpan', 'DateTime', 'DateTimeOffset',
+    'KeyValuePair', 'ValueTuple', 'Guid', 'Span', 'ReadOnlySpan', 'Memory', 'CancellationToken',
+}
+LINQ_METHODS = {
+    'Select', 'SelectMany', 'Where', 'OrderBy', 'OrderByDescending', 'ThenBy', 'GroupBy', 'ToList',
+    'ToArray', 'ToDictionary', 'ToHashSet', 'Concat', 'Distinct', 'Reverse', 'Skip', 'Take', 'Zip',
+    'Cast', 'OfType', 'Any', 'All', 'Sum', 'Min', 'Max', 'Average', 'Count', 'First', 'FirstOrDefault',
+    'Last', 'LastOrDefault', 'Aggregate',
+}
+STATIC_OWNERS = {'Math', 'MathF', 'Interlocked', 'Volatile', 'Array'}  # Math.Min(...) is not Enumerable.Min
+
+WEIGHT_RENDER_RESOURCE = 3
+WEIGHT_COLLECTION = 2
+WEIGHT_LINQ = 2
+WEIGHT_STRING_FORMAT = 2
+WEIGHT_OBJECT = 1
+WEIGHT_TO_STRING = 1
+WEIGHT_CONCAT = 1
+WEIGHT_LAMBDA = 1
+
+DEFAULT_PATH = "Flowery.NET/Controls"
+SKIP_DIRS = {'bin', 'obj'}
+
+
+@dataclass
+class Finding:
+    """One flagged allocation inside a hot method."""
+    file: str
+    line: int
+    control: str
+    method: str       # e.g. "Render", "OnTimerTick (timer callback)"
+    rule: str
+    weight: int
+    code: str         # The tokens that triggered the rule
+
+
+@dataclass
+class ControlReport:
+    """All findings of one class, ranked by score."""
+    control: str
+    file: str
+    score: int = 0
+    findings: list[Finding] = field(default_factory=list)
+
+
+# =============================================================================
+# Hot Method Discovery
+# =============================================================================
+
+class HotPathLinter:
+    """Locates hot method bodies in one C# file and flags allocations in them."""
+
+    def __init__(self, filepath: Path, rel_path: str):
+        self.rel_path = rel_path
+        content = filepath.read_text(encoding='utf-8-sig')
+        self.tokens: list[CSharpToken] = list(tokenize_csharp(content))
+        self.line_starts = [0] + [i + 1 for i, ch in enumerate(content) if ch == '\n']
+        self.owners = self._class_owners()
+
+    def _line(self, tok: CSharpToken) -> int:
+        return bisect.bisect_right(self.line_starts, tok.start)
+
+    def _text(self, i: int) -> str:
+        return self.tokens[i].text if 0 <= i < len(self.tokens) else ''
+
+    def _matching(self, i: int) -> int:
+        """Index of the bracket closing the one at i (or the last token)."""
+        pairs = {'(': ')', '{': '}', '[': ']'}
+        opening, closing = self.tokens[i].text, pairs[self.tokens[i].text]
+        depth = 0
+        for j in range(i, len(self.tokens)):
+            text = self.tokens[j].text
+            if self.tokens[j].kind != 'punct':
+                continue
+            if text == opening:
+                depth += 1
+            elif text == closing:
+                depth -= 1
+                if depth == 0:
+                    return j
+        return len(self.tokens) - 1
+
+    def _expression_end(self, i: int) -> int:
+        """Index of the ';' ',' or unmatched ')' ending the expression starting at i."""
+        depth = 0
+        for j in range(i, len(self.tokens)):
+            tok = self.tokens[j]
+            if tok.kind != 'punct':
+                continue
+            if tok.text in '([{':
+                depth += 1
+            elif tok.text in ')]}':
+                if depth == 0:
+                    return j
+                depth -= 1
+            elif tok.text in ';,' and depth == 0:
+                return j
+        return len(self.tokens)
+
+    def _class_owners(self) -> list[str]:
+        """Innermost enclosing class name for every token index."""
+        owners = []
+        stack: list[tuple[str, int]] = []   # (class name, brace depth of its body)
+        pending = None
+        depth = 0
+        for i, tok in enumerate(self.tokens):
+            if tok.kind == 'ident' and tok.text in ('class', 'struct', 'record') and \
+                    self.tokens[i + 1:i + 2] and self.tokens[i + 1].kind == 'ident':
+                pending = self.tokens[i + 1].text
+            elif tok.text == '{' and tok.kind == 'punct':
+                depth += 1
+                if pending:
+                    stack.append((pending, depth))
+                    pending = None
+            elif tok.text == '}' and tok.kind == 'punct':
+                if stack and stack[-1][1] == depth:
+                    stack.pop()
+                depth -= 1
+            elif tok.text == ';':
+                pending = None
+            owners.append(stack[-1][0] if stack else "")
+        return owners
+
+    def _callback_body(self, i: int) -> Optional[tuple[str, int, int]]:
+        """
+        The callback expression starting at token i: (name, -1, -1) for a
+        method group, ('', body start, body end) for a lambda or delegate.
+        """
+        tok = self.tokens[i] if i < len(self.tokens) else None
+        if tok is None:
+            return None
+        if tok.kind == 'ident' and tok.text != 'delegate' and self._text(i + 1) in (';', ')', ','):
+            return tok.text, -1, -1
+        end = self._expression_end(i)
+        for j in range(i, end):
+            if self.tokens[j].text == '=' and self._text(j + 1) == '>':
+                body = j + 2
+                if self._text(body) == '{':
+                    return '', body + 1, self._matching(body)
+                return '', body, end
+            if self.tokens[j].text == 'delegate':
+                brace = next((k for k in range(j, end) if self.tokens[k].text == '{'), None)
+                if brace is not None:
+                    return '', brace + 1, self._matching(brace)
+        return None
+
+    def hot_bodies(self) -> list[tuple[str, int, int]]:
+        """(method label, first token, end token) of every hot method or callback body."""
+        bodies = []
+        callbacks = set()
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != 'ident':
+                continue
+            # timer.Tick += OnTick;  timer.Tick += (s, e) => { ... };
+            if tok.text in TIMER_EVENTS and self._text(i - 1) == '.' and \
+                    self._text(i + 1) == '+' and self._text(i + 2) == '=':
+                callback = self._callback_body(i + 3)
+            # DispatcherTimer.Run(OnTick, ...), TopLevel.RequestAnimationFrame(ts => ...),
+            # AnimationHelper.AnimateAsync(t => ..., duration)
+            elif tok.text in TIMER_CALLBACK_CALLS and self._text(i + 1) == '(' and self._is_callback_call(i):
+                callback = self._callback_body(i + 2)
+            else:
+                continue
+            if callback and callback[0]:
+                callbacks.add(callback[0])
+            elif callback:
+                bodies.append((f"{tok.text} lambda (timer callback)", callback[1], callback[2]))
+
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != 'ident' or self._text(i + 1) != '(':
+                continue
+            previous = self.tokens[i - 1] if i else None
+            if previous is None or not (previous.kind == 'ident' or previous.text in '>?]'):
+                continue  # a call, not a declaration
+            if tok.text in HOT_OVERRIDES and self._has_modifier(i, 'override'):
+                label = tok.text
+            elif tok.text in callbacks:
+                label = f"{tok.text} (timer callback)"
+            else:
+                continue
+            close = self._matching(i + 1)
+            if self._text(close + 1) == '{':
+                bodies.append((label, close + 2, self._matching(close + 1)))
+            elif self._text(close + 1) == '=' and self._text(close + 2) == '>':
+                bodies.append((label, close + 3, self._expression_end(close + 3)))
+        return bodies
+
+    def _is_callback_call(self, i: int) -> bool:
+        """Whether the TIMER_CALLBACK_CALLS name at token i is a call, on its owner type if it has one."""
+        owner = TIMER_CALLBACK_OWNERS.get(self.tokens[i].text)
+        if owner:
+            return self._text(i - 1) == '.' and self._text(i - 2) == owner
+        # topLevel.RequestAnimationFrame(...) or a bare call starting a statement, not a declaration
+        return self._text(i - 1) in ('.', '{', '}', ';')
+
+    def _has_modifier(self, i: int, modifier: str) -> bool:
+        """Whether the declaration whose name is at token i carries the modifier."""
+        for j in range(i - 1, -1, -1):
+            text = self.tokens[j].text
+            if text in ('{', '}', ';', ']'):
+                return False
+            if text == modifier:
+                return True
+        return False
+
+    # =========================================================================
+    # Allocation Rules
+    # =========================================================================
+
+    def findings(self) -> tuple[list[Finding], int]:
+        """Flagged allocations and the number of hot bodies they were searched in."""
+        results = []
+        seen = set()
+        bodies = self.hot_bodies()
+        for method, start, end in bodies:
+            for i in range(start, min(end, len(self.tokens))):
+                if i in seen:
+                    continue
+                flagged = self._check(i)
+                if flagged:
+                    seen.add(i)
+                    rule, weight, code = flagged
+                    results.append(Finding(
+                        file=self.rel_path,
+                        line=self._line(self.tokens[i]),
+                        control=self.owners[i] or Path(self.rel_path).stem,
+                        method=method,
+                        rule=rule,
+                        weight=weight,
+                        code=code,
+                    ))
+        return results, len(bodies)
+
+    def _check(self, i: int) -> Optional[tuple[str, int, str]]:
+        """(rule, weight, code) if token i starts a flagged pattern."""
+        tok = self.tokens[i]
+        text = tok.text
+        if tok.kind == 'string' and text.lstrip('@').startswith('$'):
+            return "interpolated string", WEIGHT_STRING_FORMAT, text[:40]
+        # "a" + b, b + "a" and s += "a" all allocate a new string
+        if tok.kind == 'string' and (self._text(i - 1) == '+' or self._text(i + 1) == '+' or
+                                     (self._text(i - 1) == '=' and self._text(i - 2) == '+')):
+            return "string concatenation", WEIGHT_CONCAT, text[:40]
+        if tok.kind == 'punct' and text == '=' and self._text(i + 1) == '>':
+            return "lambda (closure/delegate allocation)", WEIGHT_LAMBDA, "=>"
+        if tok.kind != 'ident':
+            return None
+        if text == 'new':
+            return self._check_new(i)
+        if self._text(i - 1) == '.' and self._text(i + 1) == '(':
+            owner = self._text(i - 2)
+            if text in LINQ_METHODS and owner not in STATIC_OWNERS and not self._is_list_reverse(i):
+                return "LINQ", WEIGHT_LINQ, f".{text}()"
+            if text == 'Format' and owner in ('string', 'String'):
+                return "string.Format", WEIGHT_STRING_FORMAT, f"{owner}.Format()"
+            if text == 'ToString':
+                return "ToString()", WEIGHT_TO_STRING, ".ToString()"
+        return None
+
+    def _is_list_reverse(self, i: int) -> bool:
+        """Whether token i is `items.Reverse();` as a statement: List<T>.Reverse() returns void."""
+        if self.tokens[i].text != 'Reverse' or self._text(i + 2) != ')' or self._text(i + 3) != ';':
+            return False
+        j = i - 1
+        while j >= 0 and (self.tokens[j].kind == 'ident' or self.tokens[j].text == '.'):
+            j -= 1
+        return self._text(j) in ('{', '}', ';')
+
+    def _check_new(self, i: int) -> Optional[tuple[str, int, str]]:
+        j = i + 1
+        names = []
+        while j < len(self.tokens) and (self.tokens[j].kind == 'ident' or self.tokens[j].text == '.'):
+            if self.tokens[j].kind == 'ident':
+                names.append(self.tokens[j].text)
+            j += 1
+        following = self._text(j)
+        if not names:
+            if following == '[':
+                return "array", WEIGHT_COLLECTION, "new[]"
+            if following == '(':
+                return "target-typed new", WEIGHT_OBJECT, "new()"
+            return None
+        type_name = names[-1]
+        code = f"new {'.'.join(names)}"
+        if following == '[':
+            return "array", WEIGHT_COLLECTION, f"{code}[]"
+        if type_name in VALUE_TYPES:
+            return None
+        if type_name in RENDER_RESOURCE_TYPES:
+            return "render resource", WEIGHT_RENDER_RESOURCE, code
+        if type_name in COLLECTION_TYPES:
+            return "collection", WEIGHT_COLLECTION, code
+        return "object", WEIGHT_OBJECT, code
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def lint(root_dir: Path, scan_dir: Path) -> tuple[list[ControlReport], int]:
+    """
+    Lint every .cs file below scan_dir. Returns the control reports, highest
+    score first, and the number of hot method bodies that were inspected.
+    """
+    reports: dict[tuple[str, str], ControlReport] = {}
+    hot_bodies = 0
+    for filepath in sorted(scan_dir.glob("**/*.cs")):
+        if SKIP_DIRS.intersection(filepath.relative_to(scan_dir).parts):
+            continue
+        rel_path = filepath.relative_to(root_dir).as_posix()
+        linter = HotPathLinter(filepath, rel_path)
+        findings, body_count = linter.findings()
+        hot_bodies += body_count
+        for finding in findings:
+            report = reports.setdefault((finding.control, rel_path), ControlReport(finding.control, rel_path))
+            report.findings.append(finding)
+            report.score += finding.weight
+    for report in reports.values():
+        report.findings.sort(key=lambda f: f.line)
+    return sorted(reports.values(), key=lambda r: (-r.score, r.control)), hot_bodies
+
+
+def print_report(reports: list[ControlReport], hot_bodies: int, top: Optional[int]):
+    total = sum(len(report.findings) for report in reports)
+    print(f"Hot-path allocations: {total} findings in {len(reports)} controls ({hot_bodies} hot methods scanned)")
+    print("=" * 40)
+    for rank, report in enumerate(reports[:top] if top else reports, 1):
+        print(f"\n{rank:>2}. {report.control}  score {report.score}  ({report.file})")
+        for f in report.findings:
+            print(f"      L{f.line:<5} {f.method:<36} {f.rule:<26} {f.code}")
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Flag allocations in Render/MeasureOverride/ArrangeOverride and timer callbacks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/lint_hot_paths.py                          # Flowery.NET/Controls, all controls
+  python Utils/lint_hot_paths.py --top 5                  # Five highest-scoring controls
+  python Utils/lint_hot_paths.py --json llms/hot-paths.json
+        """
+    )
+    parser.add_argument('--path', type=Path, default=None, metavar='DIR',
+                        help=f'Directory to lint, relative to the repository root (default: {DEFAULT_PATH})')
+    parser.add_argument('--top', type=int, default=None, metavar='N',
+                        help='Only print the N highest-scoring controls')
+    parser.add_argument('--json', type=Path, default=None, metavar='PATH',
+                        help='Also write the full ranked report as JSON')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.parent
+    scan_dir = root_dir / (args.path or DEFAULT_PATH)
+    if not scan_dir.is_dir():
+        parser.error(f"directory not found: {scan_dir}")
+
+    reports, hot_bodies = lint(root_dir, scan_dir)
+    print_report(reports, hot_bodies, args.top)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps([asdict(report) for report in reports], indent=2), encoding='utf-8')
+        print(f"\nReport: {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
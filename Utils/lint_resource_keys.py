@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Flowery.NET Resource Key Graph
+==============================
+
+Builds a graph of resource keys across every .axaml and .cs file in the
+repository and reports unused keys, duplicate definitions and reference counts.
+
+EDGES:
+------
+    definition   any element with x:Key (ThemeDictionaries variants and
+                   {x:Type} keys of implicit ControlThemes excluded)
+    static       {StaticResource Key}, <StaticResource ResourceKey="Key"/>
+    dynamic      {DynamicResource Key}, <DynamicResource ResourceKey="Key"/>
+    code         a C# string literal equal to a key (FindResource("Key"),
+                   Resources["Key"], template keys held in variables, ...)
+    pattern      an interpolated key passed to a lookup method, e.g.
+                   GetResourceOrDefault($"DaisyBadge{size}FontSize"); every key
+                   it can match counts as referenced
+
+REPORT:
+-------
+    - Unreferenced keys (no edge of any kind, from the library, the Gallery
+      or the tests)
+    - Duplicate definitions: the same key defined more than once with an
+      identical value, unless each copy sits in a different alternative
+      dictionary (Themes/Palettes, where only one palette is loaded at a time)
+    - Reference counts per key
+
+The repository is walked once (with the file walker from count_loc.py); each
+file is read and parsed once, and the graph is resolved after the walk.
+
+USAGE:
+    python Utils/lint_resource_keys.py
+    python Utils/lint_resource_keys.py --top 30 --json llms/resource-keys.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import xml.parsers.expat
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from count_loc import _walk_files
+from generate_docs import tokenize_csharp
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+
+ALTERNATIVE_RESOURCE_DIRS = {'Palettes'}       # One dictionary of these is loaded at a time
+LOOKUP_METHODS = {'FindResource', 'TryFindResource', 'TryGetResource', 'GetResourceOrDefault'}
+REFERENCE_ELEMENTS = {'StaticResource': 'static', 'DynamicResource': 'dynamic'}
+
+MARKUP_REFERENCE_PATTERN = re.compile(
+    r'\{(Static|Dynamic)Resource\s+(?:ResourceKey=)?([^{}\s,]+)\s*\}')
+INTERPOLATION_HOLE_PATTERN = re.compile(r'\{[^{}]*\}')
+
+
+@dataclass
+class Definition:
+    file: str
+    line: int
+    alternative: bool     # Defined in a palette (alternative dictionary)
+    value: str            # Canonical form of the element without its x:Key
+
+
+@dataclass
+class KeyNode:
+    """One resource key: where it is defined and how often it is referenced."""
+    key: str
+    definitions: list[Definition] = field(default_factory=list)
+    references: Counter = field(default_factory=Counter)    # kind -> count
+    referenced_from: set[str] = field(default_factory=set)
+
+    @property
+    def reference_count(self) -> int:
+        return sum(self.references.values())
+
+
+# =============================================================================
+# Resource Graph
+# =============================================================================
+
+class ResourceKeyGraph:
+    """Collects definitions and references file by file; resolve() links them."""
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = root_dir
+        self.nodes: dict[str, KeyNode] = {}
+        self.code_strings: Counter = Counter()                 # (literal, file) -> count
+        self.code_patterns: list[tuple[re.Pattern, str, str]] = []   # (regex, source text, file)
+        self.files = Counter()
+
+    def node(self, key: str) -> KeyNode:
+        if key not in self.nodes:
+            self.nodes[key] = KeyNode(key)
+        return self.nodes[key]
+
+    def reference(self, key: str, kind: str, rel_path: str, count: int = 1):
+        node = self.node(key)
+        node.references[kind] += count
+        node.referenced_from.add(rel_path)
+
+    def add_file(self, filepath: Path):
+        suffix = filepath.suffix.lower()
+        rel_path = filepath.relative_to(self.root_dir).as_posix()
+        try:
+            text = filepath.read_text(encoding='utf-8-sig')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"      Warning: {rel_path}: {e}")
+            return
+        if suffix == '.axaml':
+            self._add_axaml(text, rel_path, bool(ALTERNATIVE_RESOURCE_DIRS.intersection(filepath.parts)))
+        else:
+            self._add_csharp(text, rel_path)
+        self.files[suffix] += 1
+
+    def _add_axaml(self, text: str, rel_path: str, alternative: bool):
+        parser = xml.parsers.expat.ParserCreate()
+        elements: list[str] = []
+        keyed: list[bool] = []                              # One entry per open element
+        captures: list[tuple[str, int, list[str]]] = []     # Open keyed elements: (key, line, value parts)
+
+        def start(name: str, attrs: dict):
+            if name in REFERENCE_ELEMENTS and attrs.get('ResourceKey'):
+                self.reference(attrs['ResourceKey'], REFERENCE_ELEMENTS[name], rel_path)
+            for value in attrs.values():
+                for match in MARKUP_REFERENCE_PATTERN.finditer(value):
+                    self.reference(match.group(2), match.group(1).lower(), rel_path)
+
+            canonical = f"<{name}" + "".join(f' {k}="{v}"' for k, v in sorted(attrs.items()) if k != 'x:Key') + ">"
+            for _, _, parts in captures:
+                parts.append(canonical)
+            key = attrs.get('x:Key')
+            # {x:Type ...} keys are implicit ControlThemes; ThemeDictionaries children are variants
+            is_keyed = bool(key) and not key.startswith('{') and \
+                not (elements and elements[-1].endswith('.ThemeDictionaries'))
+            if is_keyed:
+                captures.append((key, parser.CurrentLineNumber, [canonical]))
+            keyed.append(is_keyed)
+            elements.append(name)
+
+        def end(name: str):
+            elements.pop()
+            if keyed.pop():
+                key, line, parts = captures.pop()
+                value = " ".join(parts) + f" </{name}>"
+                self.node(key).definitions.append(Definition(rel_path, line, alternative, value))
+            for _, _, parts in captures:
+                parts.append(f"</{name}>")
+
+        def data(chunk: str):
+            chunk = chunk.strip()
+            for _, _, parts in captures if chunk else ():
+                parts.append(chunk)
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = data
+        try:
+            parser.Parse(text, True)
+        except xml.parsers.expat.ExpatError as e:
+            print(f"      Warning: {rel_path}: {e}")
+
+    def _add_csharp(self, text: str, rel_path: str):
+        tokens = list(tokenize_csharp(text))
+        for i, tok in enumerate(tokens):
+            if tok.kind != 'string':
+                continue
+            literal = tok.text.lstrip('@$')
+            if not tok.text.lstrip('@').startswith('$'):
+                if literal.startswith('"') and len(literal) >= 2:
+                    self.code_strings[literal[1:-1], rel_path] += 1
+            elif i >= 2 and tokens[i - 1].text == '(' and tokens[i - 2].text in LOOKUP_METHODS:
+                source = literal.strip('"')
+                parts = INTERPOLATION_HOLE_PATTERN.split(source.replace('{{', '\0').replace('}}', '\1'))
+                regex = '.+'.join(re.escape(part.replace('\0', '{').replace('\1', '}')) for part in parts)
+                self.code_patterns.append((re.compile(regex), tok.text, rel_path))
+
+    def resolve(self):
+        """Turn C# string literals and lookup patterns into edges to defined keys."""
+        for (literal, rel_path), count in self.code_strings.items():
+            if literal in self.nodes and self.nodes[literal].definitions:
+                self.reference(literal, 'code', rel_path, count)
+        defined = [key for key, node in self.nodes.items() if node.definitions]
+        for regex, _, rel_path in self.code_patterns:
+            for key in defined:
+                if regex.fullmatch(key):
+                    self.reference(key, 'pattern', rel_path)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def unreferenced(self) -> list[KeyNode]:
+        return sorted((node for node in self.nodes.values() if node.definitions and not node.reference_count),
+                      key=lambda node: (node.definitions[0].file, node.definitions[0].line))
+
+    def undefined(self) -> list[KeyNode]:
+        """Keys that are referenced but never defined here (Avalonia/Fluent theme keys, mostly)."""
+        return sorted((node for node in self.nodes.values() if not node.definitions),
+                      key=lambda node: node.key)
+
+    def duplicates(self) -> list[tuple[str, list[Definition]]]:
+        """Keys defined more than once with an identical value, apart from one copy per palette."""
+        groups = []
+        for key, node in sorted(self.nodes.items()):
+            by_value: dict[str, list[Definition]] = {}
+            for definition in node.definitions:
+                by_value.setdefault(definition.value, []).append(definition)
+            for copies in by_value.values():
+                files = {d.file for d in copies}
+                if len(copies) > 1 and (len(files) < len(copies) or not all(d.alternative for d in copies)):
+                    groups.append((key, copies))
+        return groups
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def print_report(graph: ResourceKeyGraph, top: Optional[int]):
+    defined = [node for node in graph.nodes.values() if node.definitions]
+    definitions = sum(len(node.definitions) for node in defined)
+    unreferenced = graph.unreferenced()
+    duplicates = graph.duplicates()
+
+    print(f"Resource keys: {len(defined)} keys, {definitions} definitions "
+          f"({graph.files['.axaml']} .axaml, {graph.files['.cs']} .cs scanned)")
+    print("=" * 40)
+    print(f"  Unreferenced keys:     {len(unreferenced)}")
+    print(f"  Duplicate definitions: {len(duplicates)}")
+    print(f"  Undefined references:  {len(graph.undefined())}")
+
+    print(f"\nUnreferenced keys ({len(unreferenced)}):")
+    for node in unreferenced:
+        first = node.definitions[0]
+        also = f" (+{len(node.definitions) - 1} more)" if len(node.definitions) > 1 else ""
+        print(f"      {node.key:<48} {first.file}:{first.line}{also}")
+
+    print(f"\nDuplicate definitions with identical values ({len(duplicates)}):")
+    for key, copies in duplicates:
+        print(f"      {key}")
+        for definition in copies:
+            print(f"          {definition.file}:{definition.line}")
+
+    undefined = graph.undefined()
+    print(f"\nReferenced but not defined here ({len(undefined)}):")
+    for node in undefined:
+        print(f"      {node.key:<48} {node.reference_count} references")
+
+    ranked = sorted(defined, key=lambda node: (-node.reference_count, node.key))
+    print(f"\nReference counts{f' (top {top})' if top else ''}:")
+    print(f"      {'Key':<48} {'total':>6} {'static':>7} {'dynamic':>8} {'code':>5} {'files':>6}")
+    for node in ranked[:top] if top else ranked:
+        refs = node.references
+        print(f"      {node.key:<48} {node.reference_count:>6} {refs['static']:>7} {refs['dynamic']:>8} "
+              f"{refs['code'] + refs['pattern']:>5} {len(node.referenced_from):>6}")
+
+
+def graph_to_json(graph: ResourceKeyGraph) -> dict:
+    return {
+        'keys': {
+            key: {
+                'definitions': [{'file': d.file, 'line': d.line, 'alternative': d.alternative}
+                                for d in node.definitions],
+                'references': dict(node.references),
+                'referenced_from': sorted(node.referenced_from),
+            }
+            for key, node in sorted(graph.nodes.items())
+        },
+        'unreferenced': [node.key for node in graph.unreferenced()],
+        'duplicates': [{'key': key, 'definitions': [asdict(d) for d in copies]}
+                       for key, copies in graph.duplicates()],
+        'code_patterns': [{'source': source, 'file': rel_path} for _, source, rel_path in graph.code_patterns],
+    }
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report unused, duplicate and most-referenced resource keys',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/lint_resource_keys.py                        # Whole repository
+  python Utils/lint_resource_keys.py --top 30               # Only the 30 most-referenced keys in the count table
+  python Utils/lint_resource_keys.py --json llms/resource-keys.json
+        """
+    )
+    parser.add_argument('--top', type=int, default=None, metavar='N',
+                        help='Only list the N most-referenced keys in the reference count table')
+    parser.add_argument('--json', type=Path, default=None, metavar='PATH',
+                        help='Also write the full key graph as JSON')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.parent.resolve()
+    graph = ResourceKeyGraph(root_dir)
+    for filepath in sorted(_walk_files(root_dir)):
+        if filepath.suffix.lower() in ('.axaml', '.cs'):
+            graph.add_file(filepath)
+    graph.resolve()
+    print_report(graph, args.top)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(graph_to_json(graph), indent=2), encoding='utf-8')
+        print(f"\nGraph: {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
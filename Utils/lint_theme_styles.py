@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Flowery.NET Theme Style Linter
+==============================
+
+Scores every Style in Flowery.NET/Themes against patterns that cost
+style-matching or resource-lookup time in Avalonia and prints the hotspots.
+
+RULES (weight):
+---------------
+    template-chain      3 per /template/ beyond the first in the effective
+                          selector (nested ^ styles include their parents)
+    deep-selector       1 per combinator beyond MAX_SELECTOR_DEPTH
+    infinite-animation  3 per IterationCount="Infinite" animation, +2 when the
+                          selector has no state pseudo-class to gate it
+    is-selector         2 per :is() (matches the type and every subclass)
+    untyped-selector    2 per alternative that starts with a class or
+                          pseudo-class, so it is tested against every control
+    wide-selector       1 per comma alternative beyond MAX_SELECTOR_ALTERNATIVES
+    dynamic-resource    1 per DynamicResource whose key is defined exactly once,
+                          outside the palettes and ThemeDictionaries, so a
+                          StaticResource would resolve to the same value
+
+The theme tree is read in a single pass: comments are removed with the stripper
+from count_loc.py (line numbers are preserved) and each file is parsed once with
+expat. Resource definitions are collected during the same pass, so the
+dynamic-resource rule is scored after the last file without reading any twice.
+
+USAGE:
+    python Utils/lint_theme_styles.py
+    python Utils/lint_theme_styles.py --top 20 --json llms/theme-styles.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import xml.parsers.expat
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from count_loc import _strip_xml_comments
+
+# =============================================================================
+# Configuration Constants
+# =============================================================================
+
+DEFAULT_PATH = "Flowery.NET/Themes"
+SWITCHABLE_RESOURCE_DIRS = {'Palettes'}        # Keys defined here are swapped at runtime
+
+MAX_TEMPLATE_DEPTH = 1                         # /template/ hops before template-chain fires
+MAX_SELECTOR_DEPTH = 4                         # Combinators before deep-selector fires
+MAX_SELECTOR_ALTERNATIVES = 3                  # Comma alternatives before wide-selector fires
+
+WEIGHT_TEMPLATE_CHAIN = 3
+WEIGHT_DEEP_SELECTOR = 1
+WEIGHT_INFINITE_ANIMATION = 3
+WEIGHT_UNGATED_ANIMATION = 2
+WEIGHT_IS_SELECTOR = 2
+WEIGHT_UNTYPED_SELECTOR = 2
+WEIGHT_WIDE_SELECTOR = 1
+WEIGHT_DYNAMIC_RESOURCE = 1
+
+DYNAMIC_RESOURCE_PATTERN = re.compile(r'\{DynamicResource\s+(?:ResourceKey=)?([^}\s,]+)\s*\}')
+COMBINATOR_PATTERN = re.compile(r'\s*/template/\s*|\s*>\s*|(?<=[\w\])])\s+(?=[\w.:^#\[|])')
+STATE_PSEUDO_CLASS_PATTERN = re.compile(r':(?!is\(|not\(|nth-)[\w-]+')
+
+
+@dataclass
+class StyleIssue:
+    rule: str
+    weight: int
+    detail: str
+
+
+@dataclass
+class StyleReport:
+    """One Style (or ControlTheme) with its issues; score is the summed weight."""
+    file: str
+    line: int
+    selector: str
+    score: int = 0
+    issues: list[StyleIssue] = field(default_factory=list)
+
+    def flag(self, rule: str, weight: int, detail: str):
+        self.issues.append(StyleIssue(rule, weight, detail))
+        self.score += weight
+
+
+@dataclass
+class _OpenStyle:
+    """A Style element being parsed; depths are effective (parents included)."""
+    report: StyleReport
+    template_depth: int
+    selector_depth: int
+    gated: bool
+
+
+# =============================================================================
+# Selector Metrics
+# =============================================================================
+
+def split_alternatives(selector: str) -> list[str]:
+    """Split a selector on top-level commas (commas inside :is()/:not() stay)."""
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(selector):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(selector[start:i].strip())
+            start = i + 1
+    parts.append(selector[start:].strip())
+    return [part for part in parts if part]
+
+
+def combinator_count(alternative: str) -> int:
+    return len(COMBINATOR_PATTERN.findall(alternative))
+
+
+# =============================================================================
+# Theme Linter
+# =============================================================================
+
+class ThemeStyleLinter:
+    """Parses theme files one at a time; call finish() after the last one."""
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = root_dir
+        self.reports: list[StyleReport] = []
+        self.definitions: dict[str, list[tuple[str, bool]]] = {}   # key -> [(file, switchable)]
+        self.dynamic_refs: list[tuple[StyleReport, str]] = []
+        self.files = 0
+
+    def add_file(self, filepath: Path):
+        rel_path = filepath.relative_to(self.root_dir).as_posix()
+        switchable_file = bool(SWITCHABLE_RESOURCE_DIRS.intersection(filepath.parts))
+        text = _strip_xml_comments(filepath.read_text(encoding='utf-8-sig'))
+
+        parser = xml.parsers.expat.ParserCreate()
+        elements: list[str] = []
+        styles: list[Optional[_OpenStyle]] = []   # One entry per open element
+
+        def start(name: str, attrs: dict):
+            line = parser.CurrentLineNumber
+            parent = next((s for s in reversed(styles) if s), None)
+            opened = None
+
+            if name in ('Style', 'ControlTheme'):
+                selector = attrs.get('Selector') or attrs.get('TargetType', '')
+                opened = self._open_style(rel_path, line, selector, parent)
+            elif name == 'Animation' and attrs.get('IterationCount') == 'Infinite' and parent:
+                weight = WEIGHT_INFINITE_ANIMATION
+                detail = f"line {line}"
+                if not parent.gated:
+                    weight += WEIGHT_UNGATED_ANIMATION
+                    detail += ", no state pseudo-class gates it"
+                parent.report.flag('infinite-animation', weight, detail)
+
+            key = attrs.get('x:Key')
+            if key:
+                switchable = switchable_file or any(e.endswith('.ThemeDictionaries') for e in elements)
+                self.definitions.setdefault(key, []).append((rel_path, switchable))
+
+            owner = opened or parent
+            if owner:
+                for value in attrs.values():
+                    for match in DYNAMIC_RESOURCE_PATTERN.finditer(value):
+                        self.dynamic_refs.append((owner.report, match.group(1)))
+
+            elements.append(name)
+            styles.append(opened)
+
+        def end(name: str):
+            elements.pop()
+            styles.pop()
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        try:
+            parser.Parse(text, True)
+        except xml.parsers.expat.ExpatError as e:
+            print(f"      Warning: {rel_path}: {e}")
+        self.files += 1
+
+    def _open_style(self, rel_path: str, line: int, selector: str,
+                    parent: Optional[_OpenStyle]) -> _OpenStyle:
+        report = StyleReport(rel_path, line, selector)
+        self.reports.append(report)
+        alternatives = split_alternatives(selector) or ['']
+
+        template_depth = selector_depth = 0
+        gated = False
+        for alternative in alternatives:
+            nested = alternative.startswith('^') and parent is not None
+            template_depth = max(template_depth, alternative.count('/template/') +
+                                 (parent.template_depth if nested else 0))
+            selector_depth = max(selector_depth, combinator_count(alternative) +
+                                 (parent.selector_depth if nested else 0))
+            gated = gated or bool(STATE_PSEUDO_CLASS_PATTERN.search(alternative)) or (nested and parent.gated)
+            if alternative[:1] in ('.', ':') and not alternative.startswith(':is('):
+                report.flag('untyped-selector', WEIGHT_UNTYPED_SELECTOR, alternative)
+
+        if template_depth > MAX_TEMPLATE_DEPTH:
+            report.flag('template-chain', WEIGHT_TEMPLATE_CHAIN * (template_depth - MAX_TEMPLATE_DEPTH),
+                        f"{template_depth} /template/ hops")
+        if selector_depth > MAX_SELECTOR_DEPTH:
+            report.flag('deep-selector', WEIGHT_DEEP_SELECTOR * (selector_depth - MAX_SELECTOR_DEPTH),
+                        f"{selector_depth} combinators")
+        is_count = selector.count(':is(')
+        if is_count:
+            report.flag('is-selector', WEIGHT_IS_SELECTOR * is_count, f"{is_count} :is()")
+        if len(alternatives) > MAX_SELECTOR_ALTERNATIVES:
+            report.flag('wide-selector', WEIGHT_WIDE_SELECTOR * (len(alternatives) - MAX_SELECTOR_ALTERNATIVES),
+                        f"{len(alternatives)} alternatives")
+        return _OpenStyle(report, template_depth, selector_depth, gated)
+
+    def finish(self) -> list[StyleReport]:
+        """Score the deferred resource rule; returns styles with issues, highest score first."""
+        counts: dict[tuple[int, str], int] = {}
+        owners: dict[int, StyleReport] = {}
+        for report, key in self.dynamic_refs:
+            counts[id(report), key] = counts.get((id(report), key), 0) + 1
+            owners[id(report)] = report
+        for (report_id, key), count in counts.items():
+            definitions = self.definitions.get(key, [])
+            if len(definitions) == 1 and not definitions[0][1]:
+                times = f" x{count}" if count > 1 else ""
+                owners[report_id].flag('dynamic-resource', WEIGHT_DYNAMIC_RESOURCE * count,
+                                       f"{key}{times} (only defined in {definitions[0][0]})")
+        flagged = [report for report in self.reports if report.issues]
+        return sorted(flagged, key=lambda r: (-r.score, r.file, r.line))
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def print_report(reports: list[StyleReport], styles: int, files: int, top: Optional[int]):
+    print(f"Theme style hotspots: {len(reports)} of {styles} styles flagged in {files} files")
+    print("=" * 40)
+
+    by_rule: dict[str, int] = {}
+    for report in reports:
+        for issue in report.issues:
+            by_rule[issue.rule] = by_rule.get(issue.rule, 0) + issue.weight
+    for rule, weight in sorted(by_rule.items(), key=lambda item: -item[1]):
+        print(f"  {rule:<20} {weight:>5}")
+
+    for rank, report in enumerate(reports[:top] if top else reports, 1):
+        print(f"\n{rank:>3}. score {report.score}  {report.file}:{report.line}")
+        print(f"      {report.selector}")
+        for issue in report.issues:
+            print(f"      - {issue.rule:<20} +{issue.weight:<3} {issue.detail}")
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Score theme styles for selector and resource-lookup cost',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python Utils/lint_theme_styles.py                        # Full report for Flowery.NET/Themes
+  python Utils/lint_theme_styles.py --top 20               # Twenty highest-scoring styles
+  python Utils/lint_theme_styles.py --json llms/theme-styles.json
+        """
+    )
+    parser.add_argument('--path', type=Path, default=None, metavar='DIR',
+                        help=f'Theme directory, relative to the repository root (default: {DEFAULT_PATH})')
+    parser.add_argument('--top', type=int, default=None, metavar='N',
+                        help='Only print the N highest-scoring styles')
+    parser.add_argument('--json', type=Path, default=None, metavar='PATH',
+                        help='Also write every flagged style as JSON')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.parent
+    theme_dir = root_dir / (args.path or DEFAULT_PATH)
+    if not theme_dir.is_dir():
+        parser.error(f"directory not found: {theme_dir}")
+
+    linter = ThemeStyleLinter(root_dir)
+    for filepath in sorted(theme_dir.glob("**/*.axaml")):
+        linter.add_file(filepath)
+    reports = linter.finish()
+    print_report(reports, len(linter.reports), linter.files, args.top)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps([asdict(report) for report in reports], indent=2), encoding='utf-8')
+        print(f"\nReport: {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
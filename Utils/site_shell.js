@@ -161,3 +161,13 @@ handleHashNavigation();
 
 // Handle hash changes (back/forward navigation)
 window.addEventListener('hashchange', handleHashNavigation);
+
+// --- Offline Cache ---
+// Register the service worker emitted by generate_site.py (not available on file://)
+if ('serviceWorker' in navigator && window.location.protocol.startsWith('http')) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('sw.js').catch(() => {
+            // Built with --no-service-worker or blocked by the browser - run online only
+        });
+    });
+}
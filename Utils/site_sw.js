@@ -0,0 +1,91 @@
+// --- Offline Cache (generated by Utils/generate_site.py) ---
+// Precaches every file listed in the precache manifest. Entries whose content
+// hash (revision) matches the previous cache are copied over instead of being
+// downloaded again, so a new deploy only refetches the files that changed.
+
+const PRECACHE_VERSION = '__PRECACHE_VERSION__';
+const PRECACHE_MANIFEST = '__PRECACHE_MANIFEST__';
+const CACHE_PREFIX = 'flowery-docs-';
+const CACHE_NAME = CACHE_PREFIX + PRECACHE_VERSION;
+const REVISION_HEADER = 'X-Precache-Revision';
+
+function toAbsolute(url) {
+    return new URL(url, self.registration.scope).href;
+}
+
+// Store the revision alongside the response so the next install can compare it
+async function withRevision(response, revision) {
+    const headers = new Headers(response.headers);
+    headers.set(REVISION_HEADER, revision);
+    return new Response(await response.blob(), {
+        status: response.status,
+        statusText: response.statusText,
+        headers: headers
+    });
+}
+
+async function previousCaches() {
+    const names = await caches.keys();
+    return Promise.all(names
+        .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+        .map(name => caches.open(name)));
+}
+
+async function precache() {
+    const manifestResponse = await fetch(`${PRECACHE_MANIFEST}?v=${PRECACHE_VERSION}`, { cache: 'no-store' });
+    const manifest = await manifestResponse.json();
+    const cache = await caches.open(CACHE_NAME);
+    const previous = await previousCaches();
+
+    await Promise.all(manifest.files.map(async entry => {
+        const url = toAbsolute(entry.url);
+
+        // 1. Unchanged since the last deploy: reuse the cached copy
+        for (const old of previous) {
+            const hit = await old.match(url);
+            if (hit && hit.headers.get(REVISION_HEADER) === entry.revision) {
+                await cache.put(url, hit);
+                return;
+            }
+        }
+
+        // 2. New or changed: fetch from the network
+        const response = await fetch(url, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`Precache failed for ${entry.url}: ${response.status}`);
+        }
+        await cache.put(url, await withRevision(response, entry.revision));
+    }));
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+            .map(name => caches.delete(name)));
+        await self.clients.claim();
+    })());
+});
+
+// Cache-first for everything inside the site scope, network fallback otherwise
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || !request.url.startsWith(self.registration.scope)) return;
+
+    const url = new URL(request.url);
+    url.hash = '';
+    if (url.pathname.endsWith('/')) {
+        url.pathname += 'index.html';
+    }
+
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        const cached = await cache.match(url.href, { ignoreSearch: true });
+        return cached || fetch(request);
+    })());
+});
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the generate_docs.py C# scan, parse cache and XML
+documentation index (against the sample Flowery.NET.xml next to this file).
+
+USAGE:
+    python -m unittest Utils/test_generate_docs.py
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from generate_docs import ControlInfo, CSharpParser, EnumInfo, ParseCache, PropertyInfo, XmlDocIndex
+
+SAMPLE_XMLDOC = Path(__file__).parent / "Flowery.NET.xml"
+
+CONTROL_SOURCE = """
+using Avalonia.Controls;
+
+namespace Flowery.Controls
+{
+    #region Control
+    /// <summary>
+    /// A documented control.
+    /// </summary>
+    // Plain comment with words like internal and abstract in it
+#if NET6_0_OR_GREATER
+#endif
+    public class DaisySample : ContentControl
+    {
+        // Another comment: private static class Helper
+        public static readonly StyledProperty<double> SpacingProperty =
+            AvaloniaProperty.Register<DaisySample, double>(nameof(Spacing), 4.0);
+    }
+    #endregion
+}
+"""
+
+
+class CSharpScanTests(unittest.TestCase):
+
+    def test_comment_and_region_above_class_are_not_modifiers(self):
+        parser = CSharpParser()
+        symbols = parser.scan(CONTROL_SOURCE)
+        control = parser.control_from_symbols(symbols, "DaisySample")
+
+        self.assertIsNotNone(control)
+        self.assertEqual(control.name, "DaisySample")
+        self.assertEqual(control.description, "A documented control.")
+        self.assertEqual(symbols.classes[0].modifiers, ['public'])
+        self.assertEqual([p.name for p in control.properties], ['Spacing'])
+
+    def test_numeric_default_is_kept(self):
+        parser = CSharpParser()
+        control = parser.control_from_symbols(parser.scan(CONTROL_SOURCE), "DaisySample")
+        self.assertEqual(control.properties[0].default, "4.0")
+
+
+class ParseCacheTests(unittest.TestCase):
+
+    def load(self, content: str) -> ParseCache:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.json"
+            cache_path.write_text(content, encoding='utf-8')
+            return ParseCache(cache_path)
+
+    def test_non_dict_cache_is_empty(self):
+        for content in ('[]', '"text"', '42', 'null'):
+            self.assertEqual(self.load(content).entries, {}, content)
+
+    def test_malformed_entries_are_dropped(self):
+        good = {'sha256': 'abc', 'version': 1, 'result': {}}
+        cache = self.load(json.dumps({'good.cs': good, 'list.cs': [1], 'partial.cs': {'sha256': 'abc'}}))
+        self.assertEqual(cache.entries, {'good.cs': good})
+        self.assertIsNone(cache.get('partial.cs', 'abc', 1))
+        self.assertIsNotNone(cache.get('good.cs', 'abc', 1))
+
+
+class XmlDocIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.index = XmlDocIndex.load(SAMPLE_XMLDOC)
+
+    def test_load_keys_summaries_by_simple_name(self):
+        self.assertEqual(set(self.index.types), {'DaisySample', 'DaisySize'})
+        self.assertEqual(set(self.index.members), {
+            ('DaisySample', 'SpacingProperty'), ('DaisySample', 'Spacing'), ('DaisySample', 'Label'),
+        })
+
+    def test_text_flattens_cref_and_langword(self):
+        self.assertEqual(self.index.types['DaisySample'], "A sample control built on ContentControl.")
+        self.assertEqual(self.index.members['DaisySample', 'Label'],
+                         "Text shown next to the content, or null to hide it.")
+
+    def test_property_summary_prefers_the_property_field(self):
+        self.assertEqual(self.index.property_summary('DaisySample', 'Spacing'), "Defines the Spacing property.")
+        self.assertEqual(self.index.property_summary('DaisySample', 'Label'),
+                         "Text shown next to the content, or null to hide it.")
+        self.assertIsNone(self.index.property_summary('DaisySample', 'Size'))
+
+    def test_apply_keeps_scanned_descriptions_without_xml(self):
+        control = ControlInfo(
+            name='DaisyDerived',
+            base_class='DaisySample',
+            description="Scanned control.",
+            properties=[PropertyInfo('Spacing', 'double', '0', "Scanned spacing.")],
+            enums=[EnumInfo('DaisySize', ['Small'], "Scanned size."), EnumInfo('DaisyTone', ['Soft'], "Scanned tone.")],
+            inherited_properties={'DaisySample': [PropertyInfo('Label', 'string?', 'null'),
+                                                  PropertyInfo('Size', 'DaisySize', 'Medium', "Scanned size.")]},
+        )
+        self.index.apply(control)
+
+        self.assertEqual(control.description, "Scanned control.")
+        self.assertEqual(control.properties[0].description, "Scanned spacing.")
+        inherited = control.inherited_properties['DaisySample']
+        self.assertEqual(inherited[0].description, "Text shown next to the content, or null to hide it.")
+        self.assertEqual(inherited[1].description, "Scanned size.")
+        self.assertEqual([enum.description for enum in control.enums],
+                         ["Size preset shared by the Daisy controls.", "Scanned tone."])
+
+
+if __name__ == '__main__':
+    unittest.main()